@@ -7,13 +7,77 @@
 :license: MIT, see LICENSE for more details.
 """
 
-from .resolves_to import resolves_to
-from .resolves_to import resolves_to_404
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Lazy Imports
+# ~~~~~~~~~~~~
+# Importing Django is relatively slow, so the public API is only imported
+# once it's accessed, using a module-level `__getattr__()`. This way, tools
+# that only need `VERSION` or the exceptions don't pay for importing Django.
+#
+# When a submodule is imported, it's bound as an attribute of this package.
+# The submodule `resolves_to` would then shadow the function `resolves_to`,
+# so this package's class prevents submodules from being bound to the names
+# of the public API.
 
+import sys
+from importlib import import_module
+from types import ModuleType
 
-__all__ = (
-    'resolves_to',
-    'resolves_to_404',
-)
+
+# the submodule that defines each name of the public API
+_SUBMODULES = {
+    'CaseTable': '.table',
+    'ResolveHistogram': '.hooks',
+    'ResolveHooks': '.hooks',
+    'StatsdHooks': '.hooks',
+    'aresolves_all': '.asynchronous',
+    'aresolves_all_404': '.asynchronous',
+    'aresolves_to': '.asynchronous',
+    'aresolves_to_404': '.asynchronous',
+    'benchmark_converters': '.converters',
+    'compare_route_cost': '.cost',
+    'find_dead_code': '.dead',
+    'generate_cases': '.samples',
+    'measure_memory': '.memory',
+    'resolves_all': '.batch',
+    'resolves_all_404': '.batch',
+    'resolves_all_languages': '.i18n',
+    'resolves_near_misses_to_404': '.samples',
+    'resolves_to': '.resolves_to',
+    'resolves_to_404': '.resolves_to',
+    'register_hooks': '.hooks',
+    'reverses_all': '.reverse',
+    'smoke_dispatch': '.smoke',
+    'stress_resolve': '.stress',
+    'unregister_hooks': '.hooks',
+    'within_memory_budget': '.memory',
+}
+
+__all__ = tuple(sorted(_SUBMODULES))
 
 VERSION = "0.3.0"
+
+
+def __getattr__(name):
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_SUBMODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(ModuleType):
+
+    def __setattr__(self, name, value):
+        if name in _SUBMODULES and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Runs the command-line interface of this package.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+import sys
+
+from .cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
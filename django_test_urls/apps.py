@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains the configuration of this package as a Django application.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+from django.apps import AppConfig
+from django.core.checks import Tags
+from django.core.checks import register
+
+
+class DjangoTestUrlsConfig(AppConfig):
+    """ Registers the system checks of this package.
+    """
+    name = "django_test_urls"
+    verbose_name = "Django Test URLs"
+
+    def ready(self):
+        from .checks import check_url_mismatches
+        register(check_url_mismatches, Tags.urls)
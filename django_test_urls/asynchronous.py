@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains asynchronous variants of the functions of this package.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Resolving URLs is synchronous and CPU-bound, so these functions run the
+# synchronous functions in a small, shared thread pool to avoid blocking the
+# event loop. A batch is split into chunks, so that each chunk costs a single
+# round trip between the event loop and the thread pool.
+#
+# Threads of the pool don't inherit the caller's context variables, which
+# hold e.g. the active language and the URLconf set by `set_urlconf()`. So,
+# every call is run by `sync_to_async()` in its own copy of the caller's
+# context, as chunks of the same batch run concurrently. Copying the context
+# by hand isn't enough, as asgiref's `Local` hides values that were set by
+# another thread, unless they were handed over by `sync_to_async()` itself.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+
+from asgiref.sync import sync_to_async
+
+from .batch import BatchResult
+from .batch import resolves_all
+from .batch import resolves_all_404
+from .resolves_to import resolves_to
+from .resolves_to import resolves_to_404
+
+
+#: maximum number of threads used to resolve URLs
+MAX_WORKERS = 4
+
+#: default number of cases resolved by a thread in one go
+CHUNK_SIZE = 256
+
+_executor = None
+_executor_lock = Lock()
+
+
+async def aresolves_to(url_path, expected_view, expected_args,
+                       expected_kwargs, report=False, append_slash=False):
+    """ Asynchronous variant of `resolves_to()`.
+
+    :param str url_path: path of URL being mapped to a view and arguments
+    :param function|type expected_view: expected view, or its class
+    :param tuple|list expected_args: expected positional arguments
+    :param dict expected_kwargs: expected keyword arguments
+    :param bool report: return a report of the expected and actual mapping
+        instead of a bool
+    :param bool append_slash: follow the redirect to the path with a slash
+        appended, like `CommonMiddleware` does if APPEND_SLASH is enabled
+    :rtype: bool|ResolveReport
+    :return: Is the URL mapped to a view and arguments as expected?
+    :raises InvalidArgumentType:
+        passed an argument with an unexpected/invalid type
+    :raises ArgumentParameterMismatch:
+        mismatch between expected view's parameters and arguments
+    """
+    return await _run(
+        resolves_to, url_path, expected_view, expected_args, expected_kwargs,
+        report, append_slash)
+
+
+async def aresolves_to_404(url_path, append_slash=False):
+    """ Asynchronous variant of `resolves_to_404()`.
+
+    :param str url_path: path of URL
+    :param bool append_slash: follow the redirect to the path with a slash
+        appended, like `CommonMiddleware` does if APPEND_SLASH is enabled
+    :rtype: bool
+    :return: Is URL resolved to a 404?
+    :raises InvalidArgumentType:
+        passed argument with an unexpected type
+    """
+    return await _run(resolves_to_404, url_path, append_slash)
+
+
+async def aresolves_all(cases, chunk_size=CHUNK_SIZE, append_slash=False):
+    """ Asynchronous variant of `resolves_all()`.
+
+    The cases are split into chunks, which are checked concurrently.
+
+    :param cases: (url_path, expected_view, expected_args, expected_kwargs)
+    :type cases: collections.abc.Iterable[tuple]
+    :param int chunk_size: number of cases checked by a thread in one go
+    :param bool append_slash: follow redirects to paths with a slash
+        appended, like `CommonMiddleware` does if APPEND_SLASH is enabled
+    :rtype: BatchResult
+    :return: number of cases that were checked, the failed cases, and the
+        redirected URLs
+    """
+    return await _gather(
+        partial(resolves_all, append_slash=append_slash), cases, chunk_size)
+
+
+async def aresolves_all_404(url_paths, chunk_size=CHUNK_SIZE,
+                            append_slash=False):
+    """ Asynchronous variant of `resolves_all_404()`.
+
+    The URLs are split into chunks, which are checked concurrently.
+
+    :param url_paths: paths of URLs
+    :type url_paths: collections.abc.Iterable[str]
+    :param int chunk_size: number of URLs checked by a thread in one go
+    :param bool append_slash: follow redirects to paths with a slash
+        appended, like `CommonMiddleware` does if APPEND_SLASH is enabled
+    :rtype: BatchResult
+    :return: number of URLs that were checked, the URLs that resolved, and
+        the redirected URLs
+    :raises InvalidArgumentType:
+        passed argument with an unexpected type
+    """
+    return await _gather(
+        partial(resolves_all_404, append_slash=append_slash), url_paths,
+        chunk_size)
+
+
+async def _gather(check, items, chunk_size):
+    """ Checks chunks of items concurrently, and merges their results.
+
+    :param function check: function checking a batch of items
+    :param collections.abc.Iterable items: items that are checked
+    :param int chunk_size: number of items in a chunk
+    :rtype: BatchResult
+    :return: merged results of every chunk
+    """
+    items = list(items)
+    results = await asyncio.gather(*(
+        _run(check, items[i:i + chunk_size])
+        for i in range(0, len(items), chunk_size)
+    ))
+    failures = [failure for result in results for failure in result.failures]
+    redirects = [item for result in results for item in result.redirects]
+    return BatchResult(len(items), failures, redirects)
+
+
+async def _run(func, *args):
+    """ Runs a synchronous function in the shared thread pool, in a copy of
+        the caller's context.
+
+    :param function func: synchronous function
+    :param args: arguments passed on to the function
+    :return: the return value of the function
+    """
+    return await sync_to_async(
+        partial(func, *args), thread_sensitive=False,
+        executor=_get_executor())()
+
+
+def _get_executor():
+    """ Gets the thread pool shared by all asynchronous functions.
+
+    :rtype: ThreadPoolExecutor
+    :return: the shared thread pool, which is created when first needed
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_WORKERS,
+                thread_name_prefix="django-test-urls")
+    return _executor
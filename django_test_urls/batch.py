@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to test the mapping of many URLs at once.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+from collections import namedtuple
+
+from .exceptions import DjangoTestUtilsException
+from .exceptions import InvalidArgumentType
+from .hooks import _registered as _hooks
+from .resolves_to import _mismatch
+from .resolves_to import _report
+from .resolves_to import _resolve_slash
+from .resolves_to import _validate
+from .resolves_to import check_for_mismatches
+
+
+#: a URL path together with the expected view and arguments
+UrlCase = namedtuple("UrlCase", ("url_path", "view", "args", "kwargs"))
+
+#: a case that failed, the exception it raised (if any), and a report of the
+#: expected and actual mapping of its URL (if it was resolved)
+CaseFailure = namedtuple(
+    "CaseFailure", ("case", "error", "report"), defaults=(None,))
+
+
+class BatchResult(namedtuple(
+        "BatchResult", ("total", "failures", "redirects"), defaults=((),))):
+    """ The outcome of checking a batch of cases.
+
+    A result is truthy if none of the cases failed, so that it can be used
+    in an assertion just like the result of `resolves_to()`. If slashes are
+    appended, then the redirects list every URL that was only resolved after
+    appending a slash, and the path that it was redirected to.
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return not self.failures
+
+
+def resolves_all(cases, append_slash=False):
+    """ Checks whether every URL is resolved to the given view and arguments.
+
+    Every case is checked like `resolves_to()` does, but instead of stopping
+    at the first failure, all failures are collected. A case that raises an
+    exception, e.g. because of a mismatch between the captured arguments and
+    the view's parameters, is reported as a failure as well.
+
+    Every failure that isn't caused by an exception comes with the report of
+    `resolves_to()`, which shows the view and arguments that were found.
+
+    :param cases: (url_path, expected_view, expected_args, expected_kwargs)
+    :type cases: collections.abc.Iterable[tuple]
+    :param bool append_slash: follow redirects to paths with a slash
+        appended, like `CommonMiddleware` does if APPEND_SLASH is enabled
+    :rtype: BatchResult
+    :return: number of cases that were checked, the failed cases, and the
+        redirected URLs
+    """
+    total = 0
+    failures = []
+    redirects = []
+    variants = {}
+    for case in cases:
+        total += 1
+        try:
+            checked = _validate(*case)
+            check_for_mismatches(*checked[1:])
+        except DjangoTestUtilsException as e:
+            failures.append(CaseFailure(case, e))
+            continue
+        report = _report(*checked, append_slash, variants)
+        if report.redirect is not None:
+            redirects.append((report.url_path, report.redirect))
+        if not report:
+            failures.append(CaseFailure(case, None, report))
+    return BatchResult(total, failures, redirects)
+
+
+def resolves_all_404(url_paths, append_slash=False):
+    """ Checks whether none of the URLs can be mapped to a view.
+
+    :param url_paths: paths of URLs
+    :type url_paths: collections.abc.Iterable[str]
+    :param bool append_slash: follow redirects to paths with a slash
+        appended, like `CommonMiddleware` does if APPEND_SLASH is enabled
+    :rtype: BatchResult
+    :return: number of URLs that were checked, the URLs that resolved, and
+        the redirected URLs
+    :raises InvalidArgumentType:
+        passed argument with an unexpected type
+    """
+    total = 0
+    failures = []
+    redirects = []
+    variants = {}
+    for url_path in url_paths:
+        if not isinstance(url_path, str):
+            raise InvalidArgumentType("url_path must be a str")
+        total += 1
+        found, redirect = _resolve_slash(url_path, append_slash, variants)
+        if redirect is not None:
+            redirects.append((url_path, redirect))
+        if found is not None:
+            failures.append(CaseFailure(url_path, None))
+            if _hooks:
+                _mismatch(url_path, found)
+    return BatchResult(total, failures, redirects)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains a system check for mismatches between routes and views.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Checking Routes
+# ~~~~~~~~~~~~~~~
+# Instead of resolving a URL, the arguments captured by a route are derived
+# from the names and number of groups in its regexes. These arguments are
+# combined like Django does while resolving a URL, and then checked against
+# the view's parameters using `check_for_mismatches()`.
+#
+# Caching
+# ~~~~~~~
+# The mismatches are cached on a fingerprint of the URLconf, which covers the
+# regexes and extra arguments of every route, the names of the views, and the
+# modification times of the modules that define those views. The cache is
+# kept in memory, and optionally in the file given by the setting
+# `DJANGO_TEST_URLS_CHECK_CACHE`, so that it survives the restarts caused by
+# `runserver` reloading the code.
+#
+# Registration
+# ~~~~~~~~~~~~
+# The check is registered by the app's `ready()`, instead of when this module
+# is imported, so that using the rest of this package doesn't install it in
+# projects that haven't added the package to INSTALLED_APPS.
+
+import hashlib
+import json
+import os
+import sys
+
+from django.conf import settings
+from django.core.checks import Error
+from django.urls.resolvers import RoutePattern
+
+from .exceptions import ArgumentParameterMismatch
+from .resolves_to import check_for_mismatches
+from .samples import combine_arguments
+from .urlconf import iter_routes
+from .urlconf import view_path
+
+
+# IDs of the errors reported for each kind of mismatch
+_CHECK_IDS = (
+    ("missing a required argument", "django_test_urls.E001"),
+    ("too many positional arguments", "django_test_urls.E002"),
+    ("got an unexpected keyword argument", "django_test_urls.E003"),
+    ("multiple values for argument", "django_test_urls.E004"),
+)
+
+# mismatches that have been found, keyed by fingerprint of URLconf
+_cache = {}
+
+
+def check_url_mismatches(app_configs=None, **kwargs):
+    """ Reports mismatches between the routes of ROOT_URLCONF and their views.
+
+    :param app_configs: unused, as the URLconf isn't specific to an app
+    :rtype: list[django.core.checks.Error]
+    :return: an error for every route with a mismatch
+    """
+    routes = list(iter_routes())
+    fingerprint = _fingerprint(routes)
+    mismatches = _load_cached(fingerprint)
+    if mismatches is None:
+        mismatches = []
+        for index, route in enumerate(routes):
+            mismatch = route_mismatch(route)
+            if mismatch is not None:
+                mismatches.append((index, mismatch.__cause__.args[0]))
+        _store_cached(fingerprint, mismatches)
+
+    return [
+        Error(
+            f"View {view_path(routes[index].pattern.callback)} doesn't "
+            f"accept the arguments captured by route "
+            f"'{routes[index].route}': {reason}.",
+            obj=routes[index].pattern,
+            id=_check_id(reason),
+        )
+        for index, reason in mismatches
+    ]
+
+
+def find_mismatches(urlconf=None):
+    """ Finds mismatches between the routes of a URLconf and their views.
+
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :rtype: list[(Route, ArgumentParameterMismatch)]
+    :return: every route with a mismatch, and the mismatch
+    """
+    mismatches = []
+    for route in iter_routes(urlconf):
+        mismatch = route_mismatch(route)
+        if mismatch is not None:
+            mismatches.append((route, mismatch))
+    return mismatches
+
+
+def route_mismatch(route):
+    """ Finds a mismatch between a route and its view.
+
+    :param Route route: route to check
+    :rtype: ArgumentParameterMismatch|NoneType
+    :return: the mismatch, or None if there's no mismatch
+    """
+    args, kwargs = combine_arguments(
+        route, [_captured(level.pattern) for level in route.levels])
+    try:
+        check_for_mismatches(route.pattern.callback, args, kwargs)
+    except ArgumentParameterMismatch as e:
+        return e
+    return None
+
+
+def _captured(pattern):
+    """ Derives the arguments captured by a pattern from its regex.
+
+    :param pattern: pattern of a URL pattern or a URL resolver
+    :rtype: (tuple, dict)
+    :return: placeholders for the captured arguments
+    """
+    if isinstance(pattern, RoutePattern):
+        return (), dict.fromkeys(pattern.converters)
+    kwargs = dict.fromkeys(pattern.regex.groupindex)
+    args = () if kwargs else (None,) * pattern.regex.groups
+    return args, kwargs
+
+
+def _check_id(reason):
+    """ Determines the ID of the error reported for a kind of mismatch.
+
+    :param str reason: reason why arguments couldn't be bound to a view
+    :rtype: str
+    :return: ID of the error
+    """
+    for text, check_id in _CHECK_IDS:
+        if text in reason:
+            return check_id
+    return "django_test_urls.E000"
+
+
+def _fingerprint(routes):
+    """ Computes a fingerprint of the routes of a URLconf and their views.
+
+    :param list[Route] routes: every route of a URLconf
+    :rtype: str
+    :return: fingerprint that changes when a route or view might change
+    """
+    digest = hashlib.sha256()
+    modules = set()
+    for route in routes:
+        for level in route.levels:
+            digest.update(level.pattern.regex.pattern.encode())
+            extra = getattr(level, "default_kwargs", None) or \
+                getattr(level, "default_args", {})
+            digest.update(repr(sorted(extra)).encode())
+        view = getattr(route.pattern.callback, "view_class",
+                       route.pattern.callback)
+        digest.update(view_path(view).encode())
+        modules.add(getattr(view, "__module__", None))
+    for module in sorted(filter(None, modules)):
+        path = getattr(sys.modules.get(module), "__file__", None)
+        if path and os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()
+
+
+def _load_cached(fingerprint):
+    """ Loads the mismatches that were cached for a fingerprint.
+
+    :param str fingerprint: fingerprint of a URLconf
+    :rtype: list|NoneType
+    :return: (index of route, reason) for every mismatch, or None if unknown
+    """
+    if fingerprint not in _cache:
+        path = getattr(settings, "DJANGO_TEST_URLS_CHECK_CACHE", None)
+        if not path:
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get("fingerprint") != fingerprint:
+            return None
+        _cache[fingerprint] = [tuple(m) for m in cached["mismatches"]]
+    return _cache[fingerprint]
+
+
+def _store_cached(fingerprint, mismatches):
+    """ Caches the mismatches that were found for a fingerprint.
+
+    :param str fingerprint: fingerprint of a URLconf
+    :param list mismatches: (index of route, reason) for every mismatch
+    :rtype: NoneType
+    :return: N/A
+    """
+    _cache[fingerprint] = mismatches
+    path = getattr(settings, "DJANGO_TEST_URLS_CHECK_CACHE", None)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "fingerprint": fingerprint,
+                "mismatches": mismatches,
+            }, f)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains the command-line interface of this package.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Case Files
+# ~~~~~~~~~~
+# A case file is a JSON Lines file, where each line describes a single case.
+# A case with a view is checked using `resolves_to()`, while a case without a
+# view is checked using `resolves_to_404()`:
+#
+#   {"url_path": "/articles/2022/11/", "view": "blog.views.monthly_archive",
+#    "args": [], "kwargs": {"year": 2022, "month": 11}}
+#   {"url_path": "/articles/2022/13/"}
+#
+# Results
+# ~~~~~~~
+# The result of every case is written to stdout as a JSON Lines record as
+# soon as it's known, in the same order as the cases. A failed case with a
+# view also reports the view, arguments, route and URL name that were found,
+# which are taken from the resolution that was already done. A summary is
+# written to stderr. The exit code is 0 if every case passed, and 1
+# otherwise.
+#
+# Parallelism
+# ~~~~~~~~~~~
+# Resolving URLs is CPU-bound and holds the GIL, so cases are verified in
+# parallel by a pool of processes, each of which sets up Django once. Cases
+# are sent to the processes in chunks, so that the cost of passing them
+# between processes is shared by many cases. A single job verifies the cases
+# in the current process instead.
+#
+# Startup
+# ~~~~~~~
+# Django is only imported once the command-line arguments have been parsed,
+# so that e.g. `--help` responds without delay.
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from functools import lru_cache
+from itertools import chain
+from itertools import islice
+
+from .exceptions import DjangoTestUtilsException
+
+
+#: number of cases sent to a process in one go
+CHUNK_SIZE = 256
+
+
+def main(argv=None):
+    """ Verifies the cases in one or more case files.
+
+    :param list[str] argv: command-line arguments, or None for `sys.argv`
+    :rtype: int
+    :return: exit code
+    """
+    options = _parse_arguments(argv)
+    _setup(options.settings)
+
+    start = time.perf_counter()
+    chunks = _chunks(_read_cases(options.case_files), CHUNK_SIZE)
+    if options.jobs == 1:
+        total, failed = _write_results(map(_check_chunk, chunks))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+                max_workers=options.jobs, initializer=_setup,
+                initargs=(options.settings,)) as executor:
+            total, failed = _write_results(
+                _map(executor, _check_chunk, chunks, options.jobs * 2))
+    seconds = time.perf_counter() - start
+
+    rate = total / seconds if seconds else 0.0
+    sys.stderr.write(
+        f"{total} cases, {failed} failed in {seconds:.3f}s "
+        f"({rate:.0f} cases/s)\n")
+    return 1 if failed else 0
+
+
+def _write_results(chunks):
+    """ Writes the results of chunks of cases to stdout, as they arrive.
+
+    :param collections.abc.Iterable[list[dict]] chunks: results of chunks
+    :rtype: (int, int)
+    :return: number of cases, and number of failed cases
+    """
+    total = failed = 0
+    for result in chain.from_iterable(chunks):
+        total += 1
+        failed += not result["ok"]
+        sys.stdout.write(json.dumps(result, default=str) + "\n")
+        sys.stdout.flush()
+    return total, failed
+
+
+def _setup(settings_module):
+    """ Sets up Django, in the current process or in a worker process.
+
+    :param str settings_module: dotted path of settings module, or None to
+        use the environment variable DJANGO_SETTINGS_MODULE
+    :rtype: NoneType
+    :return: N/A
+    """
+    if settings_module is not None:
+        os.environ["DJANGO_SETTINGS_MODULE"] = settings_module
+
+    import django
+    django.setup()
+
+
+def _chunks(items, size):
+    """ Splits items into lists of a given size, lazily.
+
+    :param collections.abc.Iterable items: items being split
+    :param int size: maximum number of items in a chunk
+    :rtype: collections.abc.Iterator[list]
+    :return: every chunk of items
+    """
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map(executor, func, items, window):
+    """ Maps a function over items in parallel, while preserving their order.
+
+    Unlike `Executor.map()`, items are submitted lazily, so that no more
+    than a window of items is held in memory at any time.
+
+    :param concurrent.futures.Executor executor: executor running the
+        function
+    :param function func: function mapped over the items
+    :param collections.abc.Iterable items: items passed to the function
+    :param int window: maximum number of items submitted at once
+    :rtype: collections.abc.Iterator
+    :return: results of the function, in the order of the items
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _parse_arguments(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m django_test_urls",
+        description="Verifies the mapping of URLs to views and arguments.")
+    parser.add_argument(
+        "case_files", metavar="CASE_FILE", nargs="+",
+        help="JSON Lines file containing cases")
+    parser.add_argument(
+        "--settings", metavar="MODULE",
+        help="dotted path of settings module, e.g. 'mysite.settings'")
+    parser.add_argument(
+        "--jobs", "-j", metavar="N", type=_positive_int, default=1,
+        help="number of processes verifying cases in parallel (default: 1)")
+    return parser.parse_args(argv)
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def _read_cases(paths):
+    """ Reads the cases in case files, one by one.
+
+    :param list[str] paths: paths of case files
+    :rtype: collections.abc.Iterator[(str, int, str)]
+    :return: (path of file, line number, line) for every case
+    """
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield path, number, line
+
+
+def _check_chunk(locations):
+    """ Verifies a chunk of cases.
+
+    :param list[tuple] locations: (path of file, line number, line) of cases
+    :rtype: list[dict]
+    :return: results of the cases
+    """
+    return [_check(location) for location in locations]
+
+
+def _check(location):
+    """ Verifies a single case.
+
+    :param tuple location: (path of file, line number, line) of the case
+    :rtype: dict
+    :return: result of the case
+    """
+    from .resolves_to import resolves_to
+    from .resolves_to import resolves_to_404
+
+    path, number, line = location
+    result = {"file": path, "line": number, "url_path": None}
+    start = time.perf_counter()
+    try:
+        case = json.loads(line)
+        result["url_path"] = case["url_path"]
+        if case.get("view"):
+            report = resolves_to(
+                case["url_path"],
+                _import_view(case["view"]),
+                case.get("args", []),
+                case.get("kwargs", {}),
+                report=True)
+            ok = bool(report)
+            if not ok:
+                result["found"] = _found(report)
+        else:
+            ok = resolves_to_404(case["url_path"])
+        result.update(ok=ok, error=None)
+    except (DjangoTestUtilsException, ImportError, LookupError,
+            TypeError, ValueError) as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}")
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _found(report):
+    """ Describes the view and arguments that a URL was mapped to.
+
+    :param ResolveReport report: report of the mapping of a URL
+    :rtype: dict|NoneType
+    :return: view, arguments, route and URL name, or None for a 404
+    """
+    from .urlconf import view_path
+
+    if report.found_view is None:
+        return None
+    return {
+        "view": view_path(report.found_view),
+        "args": report.found_args,
+        "kwargs": report.found_kwargs,
+        "route": report.route,
+        "url_name": report.url_name,
+    }
+
+
+@lru_cache(maxsize=None)
+def _import_view(dotted_path):
+    """ Imports a view, which is cached for later cases.
+
+    :param str dotted_path: dotted path of a view
+    :rtype: function|type
+    :return: the view
+    """
+    from django.utils.module_loading import import_string
+    return import_string(dotted_path)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to benchmark and validate path converters.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Converters are called for every request that is mapped to a route using
+# them, so a slow converter slows down every one of those requests. Inputs
+# for a converter are generated from its regex, just like samples for URL
+# patterns are generated. Inputs rejected by `to_python()` are skipped.
+#
+# Round Trips
+# ~~~~~~~~~~~
+# For every accepted input, the value returned by `to_python()` is converted
+# back using `to_url()`. The result must be matched by the converter's regex,
+# and must be converted into the same value by `to_python()` again, or else
+# `reverse()` would generate URLs that don't resolve to the same arguments.
+#
+# Value Types
+# ~~~~~~~~~~~
+# The types of the values returned by `to_python()` are the types of the
+# keyword arguments that views (and `resolves_to()`) receive. A converter
+# returning values of different types is reported as inconsistent.
+
+import re
+import time
+from collections import namedtuple
+
+from django.urls.converters import get_converters
+from django.urls.resolvers import RoutePattern
+
+from .samples import generate_samples
+from .urlconf import iter_routes
+
+
+#: outcome of benchmarking and validating a single converter
+ConverterReport = namedtuple("ConverterReport", (
+    "name",                 # name used in routes, e.g. "int"
+    "converter",            # the converter itself
+    "routes",               # routes that use the converter
+    "inputs",               # inputs accepted by `to_python()`
+    "to_python_seconds",    # average time of one call to `to_python()`
+    "to_url_seconds",       # average time of one call to `to_url()`
+    "round_trip_failures",  # (input, reason) for every failed round trip
+    "value_types",          # names of the types returned by `to_python()`
+))
+
+
+def find_converters(urlconf=None):
+    """ Finds every converter used by the routes of a URLconf.
+
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :rtype: dict
+    :return: (name, converter) of each converter, and the routes using it
+    """
+    # converters are registered while importing the URLconf, so the routes
+    # are collected before looking up the names of the converters
+    routes = list(iter_routes(urlconf))
+    names = {id(converter): name
+             for name, converter in get_converters().items()}
+    found = {}
+    for route in routes:
+        for level in route.levels:
+            if not isinstance(level.pattern, RoutePattern):
+                continue
+            for converter in level.pattern.converters.values():
+                name = names.get(id(converter), type(converter).__name__)
+                users = found.setdefault((name, converter), [])
+                if route.route not in users:
+                    users.append(route.route)
+    return found
+
+
+def benchmark_converters(urlconf=None, number=1000):
+    """ Benchmarks and validates every converter used by a URLconf.
+
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :param int number: number of times each input is converted
+    :rtype: list[ConverterReport]
+    :return: a report for each converter, the most expensive one first
+    """
+    reports = [
+        benchmark_converter(name, converter, routes, number)
+        for (name, converter), routes in find_converters(urlconf).items()
+    ]
+    reports.sort(key=lambda r: r.to_python_seconds + r.to_url_seconds,
+                 reverse=True)
+    return reports
+
+
+def benchmark_converter(name, converter, routes=(), number=1000):
+    """ Benchmarks and validates a single converter.
+
+    :param str name: name of the converter
+    :param converter: the converter
+    :param list[str] routes: routes that use the converter
+    :param int number: number of times each input is converted
+    :rtype: ConverterReport
+    :return: report for the converter
+    """
+    regex = re.compile(converter.regex)
+    inputs = []
+    values = []
+    for sample in generate_samples(regex):
+        try:
+            values.append(converter.to_python(sample))
+        except ValueError:
+            continue
+        inputs.append(sample)
+
+    failures = []
+    for sample, value in zip(inputs, values):
+        reason = _round_trip(converter, regex, value)
+        if reason is not None:
+            failures.append((sample, reason))
+
+    return ConverterReport(
+        name=name,
+        converter=converter,
+        routes=list(routes),
+        inputs=inputs,
+        to_python_seconds=_time(converter.to_python, inputs, number),
+        to_url_seconds=_time(converter.to_url, values, number),
+        round_trip_failures=failures,
+        value_types=sorted({type(value).__name__ for value in values}),
+    )
+
+
+def _round_trip(converter, regex, value):
+    """ Converts a value into a URL and back.
+
+    :param converter: the converter
+    :param re.Pattern regex: compiled regex of the converter
+    :param value: value returned by `to_python()`
+    :rtype: str|NoneType
+    :return: reason why the round trip failed, or None if it succeeded
+    """
+    try:
+        url = converter.to_url(value)
+    except ValueError as e:
+        return f"to_url() rejected {value!r}: {e}"
+    if not isinstance(url, str) or not regex.fullmatch(url):
+        return f"to_url() returned {url!r}, which isn't matched by the regex"
+    try:
+        again = converter.to_python(url)
+    except ValueError as e:
+        return f"to_python() rejected {url!r}: {e}"
+    if again != value:
+        return f"{value!r} became {again!r} after a round trip"
+    return None
+
+
+def _time(func, arguments, number):
+    """ Measures the average time of calling a function with an argument.
+
+    :param function func: function being measured
+    :param list arguments: arguments that the function is called with
+    :param int number: number of calls for each argument
+    :rtype: float
+    :return: average number of seconds per call, or 0.0 without arguments
+    """
+    total = 0.0
+    for argument in arguments:
+        start = time.perf_counter()
+        for _ in range(number):
+            try:
+                func(argument)
+            except ValueError:
+                pass
+        total += time.perf_counter() - start
+    return total / (number * len(arguments)) if arguments else 0.0
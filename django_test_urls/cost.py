@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to compare the cost of resolving URLs with two
+    versions of a URLconf.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Pattern Attempts
+# ~~~~~~~~~~~~~~~~
+# Django tries the URL patterns of a resolver one by one, and descends into
+# an included resolver if its prefix matches. The number of patterns that are
+# tried before a URL is resolved is counted by walking the resolvers in the
+# same way, calling each pattern's `match()`. Unlike the time it takes, this
+# number doesn't depend on the machine, so it explains why a URLconf became
+# slower.
+#
+# Interleaved Timing
+# ~~~~~~~~~~~~~~~~~~
+# Timing both URLconfs one after the other would attribute any drift in the
+# machine's load to one of them. Instead, both are timed in every run, and
+# the order alternates between runs. The median of the runs is compared, so
+# that a few disturbed runs don't decide the outcome. Every URL is resolved
+# once with both URLconfs before timing, so that populating the resolvers'
+# caches isn't measured.
+
+import statistics
+import time
+from collections import namedtuple
+
+from django.urls import URLResolver
+from django.urls import get_resolver
+from django.urls.exceptions import Resolver404
+
+
+#: average cost of resolving a URL with a URLconf
+RouteCost = namedtuple("RouteCost", (
+    "urlconf",   # the URLconf
+    "attempts",  # average number of patterns tried per URL
+    "seconds",   # median time it took to resolve a URL
+))
+
+
+class RouteCostComparison(namedtuple("RouteCostComparison", (
+        "old", "new", "slowdown", "threshold"))):
+    """ The cost of resolving URLs with an old and a new URLconf.
+
+    The slowdown is the relative increase of the time it takes to resolve a
+    URL, e.g. 0.25 if the new URLconf is 25% slower. A comparison is truthy
+    if the slowdown doesn't exceed the threshold, so that it can be used in
+    an assertion.
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return self.slowdown <= self.threshold
+
+
+def compare_route_cost(url_paths, old_urlconf, new_urlconf, threshold=0.1,
+                       runs=11, number=10):
+    """ Compares the cost of resolving URLs with two URLconfs.
+
+    :param url_paths: paths of URLs that are resolved with both URLconfs
+    :type url_paths: collections.abc.Iterable[str]
+    :param str old_urlconf: dotted path of the old URLconf
+    :param str new_urlconf: dotted path of the new URLconf
+    :param float threshold: maximum slowdown of the new URLconf
+    :param int runs: number of timing runs of both URLconfs
+    :param int number: number of times every URL is resolved in a run
+    :rtype: RouteCostComparison
+    :return: cost of both URLconfs, and the slowdown of the new one
+    """
+    url_paths = list(url_paths)
+    resolvers = (get_resolver(old_urlconf), get_resolver(new_urlconf))
+    attempts = [_average_attempts(resolver, url_paths)
+                for resolver in resolvers]
+
+    timings = ([], [])
+    for run in range(runs):
+        order = (0, 1) if run % 2 == 0 else (1, 0)
+        for index in order:
+            timings[index].append(_time(resolvers[index], url_paths, number))
+
+    calls = max(len(url_paths) * number, 1)
+    old, new = (
+        RouteCost(urlconf, average, statistics.median(timing) / calls)
+        for urlconf, average, timing in zip(
+            (old_urlconf, new_urlconf), attempts, timings))
+    slowdown = new.seconds / old.seconds - 1 if old.seconds else 0.0
+    return RouteCostComparison(old, new, slowdown, threshold)
+
+
+def _average_attempts(resolver, url_paths):
+    """ Resolves URLs once, counting the patterns that are tried.
+
+    :param django.urls.URLResolver resolver: root resolver of a URLconf
+    :param list[str] url_paths: paths of URLs
+    :rtype: float
+    :return: average number of patterns tried per URL
+    """
+    total = 0
+    for url_path in url_paths:
+        _resolve(resolver, url_path)
+        match = resolver.pattern.match(url_path)
+        if match:
+            total += _attempts(resolver, match[0])[0]
+    return total / len(url_paths) if url_paths else 0.0
+
+
+def _attempts(resolver, path):
+    """ Counts the patterns that are tried to resolve the rest of a path.
+
+    :param django.urls.URLResolver resolver: resolver whose prefix matched
+    :param str path: rest of the path, after the resolver's prefix
+    :rtype: (int, bool)
+    :return: number of patterns tried, and whether the path was resolved
+    """
+    attempts = 0
+    for pattern in resolver.url_patterns:
+        attempts += 1
+        match = pattern.pattern.match(path)
+        if not match:
+            continue
+        if not isinstance(pattern, URLResolver):
+            return attempts, True
+        sub_attempts, resolved = _attempts(pattern, match[0])
+        attempts += sub_attempts
+        if resolved:
+            return attempts, True
+    return attempts, False
+
+
+def _time(resolver, url_paths, number):
+    """ Measures the time it takes to resolve URLs a number of times.
+
+    :param django.urls.URLResolver resolver: root resolver of a URLconf
+    :param list[str] url_paths: paths of URLs
+    :param int number: number of times every URL is resolved
+    :rtype: float
+    :return: total time, in seconds
+    """
+    start = time.perf_counter()
+    for _ in range(number):
+        for url_path in url_paths:
+            _resolve(resolver, url_path)
+    return time.perf_counter() - start
+
+
+def _resolve(resolver, url_path):
+    """ Resolves a URL, treating a 404 as a result.
+
+    :param django.urls.URLResolver resolver: root resolver of a URLconf
+    :param str url_path: path of URL
+    :rtype: django.urls.ResolverMatch|NoneType
+    :return: resolved URL, or None for a 404
+    """
+    try:
+        return resolver.resolve(url_path)
+    except Resolver404:
+        return None
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to find views and routes that are never used.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Orphaned Views
+# ~~~~~~~~~~~~~~
+# A view is reached if a route maps URLs to it, using the same notion of
+# identity as `resolves_to_view()`: either the function is the route's view,
+# or the class is the `view_class` of the route's view. Views that are
+# decorated or built using `partial()` in a URLconf are unwrapped, and every
+# view they wrap is reached, down to the innermost view or the class of a
+# class-based view. Views are compared by identity, as a view doesn't have
+# to be hashable. A function defined in a module is considered to be a view
+# if its first parameter is `request`, and a class is considered to be a
+# view if it's a subclass of `View`.
+#
+# Unused Routes
+# ~~~~~~~~~~~~~
+# A route is used if its name appears as a string literal somewhere in the
+# source tree, e.g. in `reverse("blog:article")` or `{% url 'blog:article' %}`.
+# Both the instance namespaces and the application namespaces of a route are
+# accepted. Literals that define a name, such as `name="article"`, don't
+# count. This errs on the side of caution: a route is only reported if its
+# name isn't mentioned anywhere.
+#
+# Files are searched in parallel by a pool of processes, as matching regexes
+# holds the GIL. Each process only reports which of the names it found. A
+# single job searches the files in the current process instead.
+
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from inspect import getmembers
+from inspect import isclass
+from inspect import isfunction
+from inspect import signature
+
+from django.views import View
+
+from .resolves_to import _iter_wrapped
+from .urlconf import iter_routes
+
+
+#: views and routes that are never used
+DeadCodeReport = namedtuple("DeadCodeReport", (
+    "orphaned_views",  # views that no route maps URLs to
+    "unused_routes",   # named routes whose name is never used
+))
+
+#: extensions of the files that are searched for names of routes
+SOURCE_EXTENSIONS = (".py", ".html", ".txt", ".xml", ".jinja2")
+
+# string literals, and whether they define a name instead of using it
+_LITERAL = re.compile(r"""(\bname\s*=\s*)?(['"])([\w.:-]+)\2""")
+
+
+def find_dead_code(view_modules=(), source_paths=(), urlconf=None,
+                   jobs=None):
+    """ Finds views that aren't reached, and routes whose name isn't used.
+
+    :param view_modules: modules (or their dotted paths) containing views
+    :type view_modules: collections.abc.Iterable
+    :param source_paths: files and directories searched for names of routes
+    :type source_paths: collections.abc.Iterable[str]
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :param int jobs: number of processes searching files, or None for the
+        number of CPUs
+    :rtype: DeadCodeReport
+    :return: orphaned views, and unused routes in resolution order
+    """
+    reached = set()
+    named = []
+    for route in iter_routes(urlconf):
+        reached.update(map(id, _iter_wrapped(route.pattern.callback)))
+        if route.pattern.name:
+            named.append((route, _route_names(route)))
+
+    orphaned_views = [
+        view
+        for module in view_modules
+        for view in _find_views(module)
+        if id(view) not in reached
+    ]
+    names = {name for _, route_names in named for name in route_names}
+    used = _search_names(names, source_paths, jobs) if names else set()
+    unused_routes = [
+        route for route, route_names in named if not route_names & used]
+    return DeadCodeReport(orphaned_views, unused_routes)
+
+
+def _route_names(route):
+    """ Determines the names that can be used to reverse a route.
+
+    :param Route route: a named route
+    :rtype: set[str]
+    :return: name of route, prefixed by its instance or app namespaces
+    """
+    names = set()
+    for attribute in ("namespace", "app_name"):
+        namespaces = [
+            getattr(resolver, attribute) for resolver in route.resolvers
+            if getattr(resolver, attribute)
+        ]
+        names.add(":".join(namespaces + [route.pattern.name]))
+    return names
+
+
+def _find_views(module):
+    """ Finds the views that are defined in a module.
+
+    :param module: a module, or its dotted path
+    :rtype: list
+    :return: every view function and view class defined in the module
+    """
+    if isinstance(module, str):
+        module = import_module(module)
+    return [
+        value for _, value in getmembers(module)
+        if getattr(value, "__module__", None) == module.__name__
+        and (_is_view_class(value) or _is_view_function(value))
+    ]
+
+
+def _is_view_class(value):
+    return isclass(value) and issubclass(value, View)
+
+
+def _is_view_function(value):
+    if not isfunction(value):
+        return False
+    parameters = list(signature(value).parameters)
+    return bool(parameters) and parameters[0] == "request"
+
+
+def _search_names(names, source_paths, jobs):
+    """ Searches files in parallel for names used as string literals.
+
+    :param set[str] names: names being searched for
+    :param collections.abc.Iterable[str] source_paths: files and directories
+    :param int jobs: number of processes, or None for the number of CPUs
+    :rtype: set[str]
+    :return: names that were found
+    """
+    paths = list(_iter_source_files(source_paths))
+    if not paths:
+        return set()
+    jobs = min(jobs or os.cpu_count() or 1, len(paths))
+    if jobs == 1:
+        return _search_files(paths, names)
+    chunks = [paths[i::jobs] for i in range(jobs)]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(
+            _search_files, chunks, [frozenset(names)] * jobs)
+        return set().union(*results)
+
+
+def _iter_source_files(source_paths):
+    """ Iterates over the source files in files and directories.
+
+    :param collections.abc.Iterable[str] source_paths: files and directories
+    :rtype: collections.abc.Iterator[str]
+    :return: paths of files with one of the extensions SOURCE_EXTENSIONS
+    """
+    for source_path in source_paths:
+        if os.path.isfile(source_path):
+            yield source_path
+            continue
+        for root, dirs, files in os.walk(source_path):
+            dirs[:] = [d for d in dirs
+                       if not d.startswith(".") and d != "__pycache__"]
+            for file in files:
+                if file.endswith(SOURCE_EXTENSIONS):
+                    yield os.path.join(root, file)
+
+
+def _search_files(paths, names):
+    """ Searches files for names used as string literals.
+
+    :param list[str] paths: paths of files
+    :param frozenset[str] names: names being searched for
+    :rtype: set[str]
+    :return: names that were found
+    """
+    found = set()
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+        for match in _LITERAL.finditer(text):
+            if match.group(1) is None and match.group(3) in names:
+                found.add(match.group(3))
+    return found
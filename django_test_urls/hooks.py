@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains hooks to instrument the resolution of URLs by this package.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Overhead
+# ~~~~~~~~
+# The registered hooks are kept in a single list, which is checked before
+# every resolution. While that list is empty, resolving a URL doesn't look
+# up the time or call anything else, so the only cost is the check itself.
+# Hooks are registered and unregistered by mutating the list in place, as
+# the helpers that resolve URLs hold a reference to it.
+#
+# Events
+# ~~~~~~
+# Every URL that is resolved by `resolves_to()`, `resolves_to_view()`,
+# `resolves_to_arguments()`, `resolves_to_404()`, and by the batch functions
+# built on top of them, triggers the following events in order:
+#
+# - `pre_resolve`: before the URL is resolved
+# - `post_resolve`: after the URL is resolved, along with the time it took
+# - `not_found`: after `post_resolve`, if the URL couldn't be resolved
+# - `mismatch`: if the URL isn't mapped as expected by the caller
+#
+# A path that is resolved a second time with an appended slash triggers its
+# own events, unless its result was cached by a batch function.
+#
+# Exporters
+# ~~~~~~~~~
+# Two implementations are provided: `ResolveHistogram` counts the time spent
+# resolving URLs in buckets, and `StatsdHooks` sends timers and counters to
+# a StatsD daemon using UDP. Sending is fire-and-forget, so an unreachable
+# daemon never makes a test fail.
+#
+# Hooks can be called from several threads at once, e.g. by the asynchronous
+# helpers and by `stress_resolve()`, so the counters of `ResolveHistogram`
+# are updated while holding a lock.
+
+import bisect
+import socket
+import threading
+
+# hooks that are currently registered
+_registered = []
+
+
+class ResolveHooks:
+    """ Base class of hooks that are called whenever this package resolves a
+        URL. Every method does nothing, so that subclasses only have to
+        override the events they're interested in.
+    """
+
+    def pre_resolve(self, url_path):
+        """ Called before a URL is resolved.
+
+        :param str url_path: path of URL
+        """
+
+    def post_resolve(self, url_path, found, seconds):
+        """ Called after a URL has been resolved.
+
+        :param str url_path: path of URL
+        :param django.urls.ResolverMatch|NoneType found: resolved URL, or
+            None for a 404
+        :param float seconds: time it took to resolve the URL
+        """
+
+    def not_found(self, url_path, seconds):
+        """ Called after a URL couldn't be resolved.
+
+        :param str url_path: path of URL
+        :param float seconds: time it took to try to resolve the URL
+        """
+
+    def mismatch(self, url_path, found):
+        """ Called when a URL isn't mapped as expected.
+
+        :param str url_path: path of URL
+        :param django.urls.ResolverMatch|NoneType found: resolved URL, or
+            None for a 404
+        """
+
+
+def register_hooks(hooks):
+    """ Registers hooks, which are called until they're unregistered.
+
+    :param ResolveHooks hooks: the hooks
+    :rtype: ResolveHooks
+    :return: the same hooks
+    """
+    _registered.append(hooks)
+    return hooks
+
+
+def unregister_hooks(hooks):
+    """ Unregisters hooks, if they're registered.
+
+    :param ResolveHooks hooks: the hooks
+    :rtype: NoneType
+    :return: N/A
+    """
+    if hooks in _registered:
+        _registered.remove(hooks)
+
+
+class ResolveHistogram(ResolveHooks):
+    """ Hooks counting the time spent resolving URLs in buckets.
+
+    The bucket at index `i` counts resolutions that took at most
+    `bounds[i]` seconds, and the last bucket counts all slower resolutions.
+    The counters can be updated from several threads at once.
+    """
+
+    #: default upper bounds of the buckets, in seconds
+    BOUNDS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2)
+
+    def __init__(self, bounds=BOUNDS):
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.seconds = 0.0
+        self.not_found_count = 0
+        self.mismatch_count = 0
+        self._lock = threading.Lock()
+
+    def post_resolve(self, url_path, found, seconds):
+        bucket = bisect.bisect_left(self.bounds, seconds)
+        with self._lock:
+            self.counts[bucket] += 1
+            self.total += 1
+            self.seconds += seconds
+
+    def not_found(self, url_path, seconds):
+        with self._lock:
+            self.not_found_count += 1
+
+    def mismatch(self, url_path, found):
+        with self._lock:
+            self.mismatch_count += 1
+
+    @property
+    def mean(self):
+        """ Average time it took to resolve a URL, in seconds.
+        """
+        return self.seconds / self.total if self.total else 0.0
+
+
+class StatsdHooks(ResolveHooks):
+    """ Hooks sending the time spent resolving URLs, and the number of 404s
+        and mismatches, to a StatsD daemon.
+
+    The following metrics are sent, using the given prefix:
+
+    - `<prefix>.resolve`: timer, in milliseconds
+    - `<prefix>.not_found`: counter
+    - `<prefix>.mismatch`: counter
+    """
+
+    def __init__(self, host="127.0.0.1", port=8125, prefix="django_test_urls"):
+        self.address = (host, port)
+        self.prefix = prefix
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def post_resolve(self, url_path, found, seconds):
+        self._send(f"resolve:{seconds * 1000:.6f}|ms")
+
+    def not_found(self, url_path, seconds):
+        self._send("not_found:1|c")
+
+    def mismatch(self, url_path, found):
+        self._send("mismatch:1|c")
+
+    def close(self):
+        """ Closes the socket used to send metrics.
+
+        :rtype: NoneType
+        :return: N/A
+        """
+        self._socket.close()
+
+    def _send(self, metric):
+        try:
+            self._socket.sendto(
+                f"{self.prefix}.{metric}".encode(), self.address)
+        except OSError:
+            pass
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to test the mapping of URLs in many languages.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Language-Agnostic Cases
+# ~~~~~~~~~~~~~~~~~~~~~~~
+# The path of a URL under `i18n_patterns()` depends on the active language,
+# both because of its language prefix and because of translated segments.
+# Cases therefore name the route instead, and the path of each case is found
+# by reversing its name and arguments in every language.
+#
+# Grouping by Language
+# ~~~~~~~~~~~~~~~~~~~~
+# Resolvers cache their reverse dictionaries and translated regexes for each
+# language separately. All cases are checked for one language before moving
+# on to the next, so that every language is activated only once, and its
+# caches are populated by the first case and reused by all others.
+
+from collections import namedtuple
+
+from django.conf import settings
+from django.urls import NoReverseMatch
+from django.urls import reverse
+from django.utils import translation
+
+from .batch import BatchResult
+from .batch import CaseFailure
+from .exceptions import DjangoTestUtilsException
+from .resolves_to import resolves_to
+
+
+#: a language-agnostic case, which names a route instead of a URL path
+NamedCase = namedtuple("NamedCase", ("url_name", "view", "args", "kwargs"))
+
+#: a case checked in a specific language, and the path it was reversed to
+LocalizedCase = namedtuple("LocalizedCase", (
+    "language",   # language in which the case was checked
+    "url_path",   # path that the case was reversed to, or None
+    "case",       # the language-agnostic case
+))
+
+
+def resolves_all_languages(cases, languages=None):
+    """ Checks whether every route is resolved as expected in every language.
+
+    For every language, the name and arguments of each case are reversed to
+    a URL path, which is then checked like `resolves_to()` does. A case that
+    can't be reversed, or that raises an exception while it's checked, is
+    reported as a failure as well.
+
+    :param cases: (url_name, expected_view, expected_args, expected_kwargs)
+    :type cases: collections.abc.Iterable[tuple]
+    :param list[str] languages: language codes, or None for every language
+        in the setting LANGUAGES
+    :rtype: BatchResult
+    :return: number of cases that were checked in all languages, and the
+        failed cases, as LocalizedCase
+    """
+    cases = [NamedCase(*case) for case in cases]
+    if languages is None:
+        languages = [code for code, _ in settings.LANGUAGES]
+
+    total = 0
+    failures = []
+    for language in languages:
+        with translation.override(language):
+            for case in cases:
+                total += 1
+                localized = LocalizedCase(language, None, case)
+                try:
+                    localized = localized._replace(url_path=reverse(
+                        case.url_name, args=case.args, kwargs=case.kwargs))
+                    if not resolves_to(localized.url_path, *case[1:]):
+                        failures.append(CaseFailure(localized, None))
+                except (DjangoTestUtilsException, NoReverseMatch,
+                        ValueError) as e:
+                    failures.append(CaseFailure(localized, e))
+    return BatchResult(total, failures)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to measure the memory used by a URLconf.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Fresh Interpreter
+# ~~~~~~~~~~~~~~~~~
+# Memory can only be traced while it's allocated, and a URLconf is usually
+# loaded and populated long before a test runs. The measurement is therefore
+# made in a fresh interpreter, which starts tracing before the URLconf is
+# imported, just like a worker process would load it.
+#
+# Caches
+# ~~~~~~
+# The URLconf is loaded and populated step by step, and the memory retained
+# after each step is attributed to the cache that it fills:
+#
+# - url_patterns: importing the URLconf and the URLconfs that it includes
+# - regex:<language>: compiling the regex of every URL pattern
+# - reverse_dict:<language>: populating the reverse, namespace and app
+#   dictionaries of every resolver, including the namespaced resolvers that
+#   `reverse()` creates
+#
+# Sub-Trees
+# ~~~~~~~~~
+# Regexes are compiled, and included resolvers are populated, one top-level
+# URL pattern at a time. Memory shared by the whole URLconf, such as the
+# imported modules and the reverse dictionary of the root resolver, isn't
+# attributed to any sub-tree.
+
+import gc
+import json
+import os
+# only used to run this interpreter, see `measure_memory()`
+import subprocess  # nosec B404
+import sys
+import tracemalloc
+from collections import namedtuple
+
+from .exceptions import InvalidArgumentType
+
+
+#: memory retained by a URLconf once it has been loaded and populated
+MemoryReport = namedtuple("MemoryReport", (
+    "total",       # number of bytes retained by the URLconf
+    "by_cache",    # number of bytes retained by each cache
+    "by_subtree",  # (route, bytes) of each top-level URL pattern
+))
+
+
+def measure_memory(urlconf=None, languages=None):
+    """ Measures the memory retained by a URLconf in a fresh interpreter.
+
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :param list[str] languages: languages for which the URLconf is
+        populated, or None for the current language
+    :rtype: MemoryReport
+    :return: bytes retained in total, by cache and by sub-tree, the largest
+        sub-tree first
+    :raises InvalidArgumentType:
+        passed argument with an unexpected type, or the settings weren't
+        loaded from a settings module, e.g. by `settings.configure()`
+    :raises subprocess.CalledProcessError:
+        the URLconf couldn't be loaded in a fresh interpreter
+    """
+    from django.conf import settings
+    from django.utils import translation
+
+    if urlconf is None:
+        urlconf = settings.ROOT_URLCONF
+    if not isinstance(urlconf, str):
+        raise InvalidArgumentType("urlconf must be a dotted path or None")
+    if languages is None:
+        languages = [translation.get_language()]
+    if not settings.SETTINGS_MODULE:
+        raise InvalidArgumentType(
+            "settings must be loaded from a settings module, so that they "
+            "can be loaded in a fresh interpreter")
+
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE,
+        "PYTHONPATH": os.pathsep.join(filter(None, sys.path)),
+    }
+    # the command is this interpreter running a fixed script, without a
+    # shell, and the URLconf and languages are passed on as plain arguments
+    process = subprocess.run(  # nosec B603
+        [sys.executable, "-c", _CHILD, urlconf, *languages],
+        stdout=subprocess.PIPE, universal_newlines=True, env=env,
+        check=True)
+    report = json.loads(process.stdout)
+    return MemoryReport(
+        report["total"],
+        report["by_cache"],
+        [tuple(subtree) for subtree in report["by_subtree"]])
+
+
+def within_memory_budget(max_bytes, urlconf=None, languages=None):
+    """ Checks whether a URLconf retains no more memory than a budget.
+
+    :param int max_bytes: maximum number of bytes retained by the URLconf
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :param list[str] languages: languages for which the URLconf is
+        populated, or None for the current language
+    :rtype: bool
+    :return: True if the URLconf retains at most the given number of bytes
+    :raises InvalidArgumentType:
+        passed argument with an unexpected type
+    """
+    return measure_memory(urlconf, languages).total <= max_bytes
+
+
+# code run by the fresh interpreter
+_CHILD = "from django_test_urls.memory import _main; _main()"
+
+
+def _main(argv=None):
+    """ Measures the memory retained by a URLconf, and writes it to stdout.
+
+    :param list[str] argv: dotted path of URLconf, followed by languages
+    :rtype: NoneType
+    :return: N/A
+    """
+    urlconf, *languages = sys.argv[1:] if argv is None else argv
+    tracemalloc.start()
+    try:
+        import django
+        django.setup()
+        report = _measure(urlconf, languages)
+    finally:
+        tracemalloc.stop()
+    sys.stdout.write(json.dumps(report._asdict()) + "\n")
+
+
+def _measure(urlconf, languages):
+    """ Loads and populates a URLconf, while tracing the memory retained.
+
+    :param urlconf: URLconf, as accepted by `get_resolver()`
+    :param list[str] languages: languages for which the URLconf is populated
+    :rtype: MemoryReport
+    :return: bytes retained in total, by cache and by sub-tree
+    """
+    from django.urls import URLResolver
+    from django.urls import get_resolver
+    from django.utils import translation
+
+    from .reverse import _namespace_resolvers
+
+    root = get_resolver(urlconf)
+    by_cache = {"url_patterns": _retained(lambda: root.url_patterns)}
+    by_subtree = {}
+    for language in languages:
+        with translation.override(language):
+            regex = reverse_dict = 0
+            for pattern in root.url_patterns:
+                compiled = _retained(lambda: _compile_regexes(pattern))
+                populated = 0
+                if isinstance(pattern, URLResolver):
+                    populated = _retained(lambda: pattern.reverse_dict)
+                regex += compiled
+                reverse_dict += populated
+                route = str(pattern.pattern)
+                by_subtree[route] = \
+                    by_subtree.get(route, 0) + compiled + populated
+            by_cache[f"regex:{language}"] = regex
+            by_cache[f"reverse_dict:{language}"] = reverse_dict + _retained(
+                lambda: _namespace_resolvers(root))
+
+    return MemoryReport(
+        total=sum(by_cache.values()),
+        by_cache=by_cache,
+        by_subtree=sorted(by_subtree.items(), key=lambda s: -s[1]),
+    )
+
+
+def _compile_regexes(pattern):
+    """ Compiles the regex of a URL pattern, and of those nested inside it.
+
+    :param pattern: URL pattern or URL resolver
+    :rtype: NoneType
+    :return: N/A
+    """
+    pattern.pattern.regex
+    for nested in getattr(pattern, "url_patterns", ()):
+        _compile_regexes(nested)
+
+
+def _retained(func):
+    """ Measures the memory that is retained after calling a function.
+
+    :param function func: function allocating memory
+    :rtype: int
+    :return: number of bytes that are still allocated after the call
+    """
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    func()
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] - before
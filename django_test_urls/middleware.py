@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains middleware to sample the routing of real requests.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Overhead
+# ~~~~~~~~
+# Most requests aren't sampled, so the only work done for those requests is
+# drawing a random number and comparing it with the sample rate. Sampled
+# requests are resolved a second time to measure how long resolution takes,
+# as Django doesn't expose this measurement itself.
+#
+# Buffering
+# ~~~~~~~~~
+# Samples are appended to a bounded deque, which drops the oldest samples
+# once it's full. Appending to and popping from a deque are thread-safe, so
+# no lock is needed between request threads and the flushing thread. The
+# flushing thread periodically appends all buffered samples to a JSON Lines
+# file, which can be loaded again using `load_samples()`.
+#
+# Settings
+# ~~~~~~~~
+# The middleware is configured using the setting `DJANGO_TEST_URLS_SAMPLING`,
+# a dict with the following (optional) keys:
+#
+# - RATE: fraction of requests that is sampled (default: 0.01)
+# - BUFFER_SIZE: maximum number of buffered samples (default: 10000)
+# - FILE: path of file that samples are flushed to (default: None)
+# - FLUSH_INTERVAL: number of seconds between flushes (default: 10.0)
+
+import atexit
+import json
+import random
+import threading
+import time
+from collections import deque
+from collections import namedtuple
+
+from django.conf import settings
+from django.urls import resolve as resolve_url
+from django.urls.exceptions import Resolver404
+
+
+#: the routing of a single sampled request
+RouteSample = namedtuple("RouteSample", (
+    "timestamp",    # time at which the request was sampled
+    "url_path",     # path of the requested URL
+    "route",        # route that the URL was mapped to, or None for a 404
+    "view_name",    # view name reported by Django, or None for a 404
+    "seconds",      # time it took to resolve the URL
+    "status_code",  # status code of the response
+))
+
+DEFAULT_SETTINGS = {
+    "RATE": 0.01,
+    "BUFFER_SIZE": 10000,
+    "FILE": None,
+    "FLUSH_INTERVAL": 10.0,
+}
+
+
+class RouteSamplingMiddleware:
+    """ Records the routing of a random sample of requests.
+    """
+
+    def __init__(self, get_response):
+        config = {
+            **DEFAULT_SETTINGS,
+            **getattr(settings, "DJANGO_TEST_URLS_SAMPLING", {}),
+        }
+        self.get_response = get_response
+        self.rate = float(config["RATE"])
+        self.buffer = deque(maxlen=config["BUFFER_SIZE"])
+        self.flusher = None
+        if config["FILE"]:
+            self.flusher = SampleFlusher(
+                self.buffer, config["FILE"], config["FLUSH_INTERVAL"])
+            self.flusher.start()
+
+    def __call__(self, request):
+        # sampling requests isn't security sensitive
+        if random.random() >= self.rate:  # nosec B311
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        try:
+            found = resolve_url(
+                request.path_info, getattr(request, "urlconf", None))
+        except Resolver404:
+            found = None
+        seconds = time.perf_counter() - start
+
+        response = self.get_response(request)
+        self.buffer.append(RouteSample(
+            timestamp=time.time(),
+            url_path=request.path_info,
+            route=found.route if found else None,
+            view_name=found.view_name if found else None,
+            seconds=seconds,
+            status_code=response.status_code,
+        ))
+        return response
+
+
+class SampleFlusher(threading.Thread):
+    """ Periodically appends buffered samples to a JSON Lines file.
+    """
+
+    def __init__(self, buffer, path, interval):
+        super().__init__(name="django-test-urls-sampling", daemon=True)
+        self.buffer = buffer
+        self.path = path
+        self.interval = interval
+        self.stopped = threading.Event()
+        atexit.register(self.flush)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.flush()
+
+    def stop(self):
+        """ Stops the thread, after flushing the remaining samples.
+        """
+        self.stopped.set()
+        self.join()
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def flush(self):
+        """ Appends all buffered samples to the file.
+
+        :rtype: int
+        :return: number of samples that were flushed
+        """
+        lines = []
+        while True:
+            try:
+                lines.append(json.dumps(self.buffer.popleft()) + "\n")
+            except IndexError:
+                break
+        if lines:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+        return len(lines)
+
+
+def load_samples(path):
+    """ Loads the samples that were flushed to a file.
+
+    The paths of the sampled URLs can be used as a realistic mix of URLs for
+    functions like `stress_resolve()` and `resolves_all_404()`.
+
+    :param str path: path of file that samples were flushed to
+    :rtype: list[RouteSample]
+    :return: every sample in the file, in the order they were recorded
+    """
+    with open(path, encoding="utf-8") as f:
+        return [RouteSample(*json.loads(line)) for line in f if line.strip()]
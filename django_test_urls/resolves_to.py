@@ -36,18 +36,103 @@
 #
 # For more information, check out the link below:
 # https://docs.djangoproject.com/en/dev/topics/http/urls/#using-unnamed-regular-expression-groups
+#
+# Class-Based Views
+# ~~~~~~~~~~~~~~~~~
+# The view that Django maps a URL to is the function returned by `as_view()`,
+# which keeps a reference to its class in the attribute `view_class`. That
+# function accepts any arguments, and passes them on to the handler method
+# of the request's HTTP method (`get`, `post`, ...). So, when checking for
+# mismatches, every handler method of the class is checked instead. Which
+# handlers a class has, and their signatures, is cached per class.
+#
+# Decorated Views
+# ~~~~~~~~~~~~~~~
+# Views are often wrapped by decorators (`login_required`, `cache_page`, ...)
+# or built using `functools.partial()`. A decorator that uses `wraps()` keeps
+# a reference to the view it wraps in `__wrapped__`, and `signature()`
+# follows these references, and accounts for the arguments bound by a
+# partial. Such views are unwrapped to find the class of a class-based view,
+# in which case the keyword arguments bound by partials are passed on to its
+# handler methods as well. Since the same views are checked again and again,
+# the unwrapped view and the signature are cached per view, except for views
+# that can't be hashed, such as instances of a class that defines `__eq__()`.
+#
+# Asynchronous Views
+# ~~~~~~~~~~~~~~~~~~
+# Views defined using `async def` are functions, but an asynchronous view may
+# also be a callable object that has been marked as a coroutine function,
+# e.g. a view wrapped by `sync_to_async()`. The signature of such an object
+# is the signature of the function that it wraps.
+#
+# Mismatch Reports
+# ~~~~~~~~~~~~~~~~
+# A URL is resolved only once, and the same `ResolverMatch` is used to check
+# both the view and the arguments. When a report is requested, it's built
+# from that match as well, so finding out why a URL wasn't mapped as expected
+# doesn't require resolving it again.
+#
+# Appending Slashes
+# ~~~~~~~~~~~~~~~~~
+# If the setting APPEND_SLASH is enabled, then `CommonMiddleware` redirects a
+# path without a trailing slash that can't be resolved, to the same path with
+# a trailing slash if that path can be resolved. In this mode, such a path is
+# treated as if it's mapped to the view of its redirect, which costs at most
+# one extra resolution. When many URLs are checked at once, the results of
+# resolving paths with an appended slash are cached, as these are often
+# shared by many URLs. Like `CommonMiddleware`, a path isn't redirected to a
+# view decorated with `no_append_slash()`.
+#
+# Hooks
+# ~~~~~
+# Every URL is resolved by `_resolve()`, which calls the registered hooks
+# around the resolution, and every mismatch between the expected and actual
+# mapping is reported to them as well. Both only happen if a hook has been
+# registered, so that resolution costs nothing extra otherwise.
 
+import time
+from collections import namedtuple
+from functools import lru_cache
+from functools import partial
+from functools import wraps
+from inspect import isclass
 from inspect import isfunction
+from inspect import ismethod
 from inspect import signature
 
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError:  # pragma: no cover
+    from asyncio import iscoroutinefunction
+
 from django.urls import resolve as resolve_url
 from django.urls.exceptions import Resolver404
 
 from .exceptions import ArgumentParameterMismatch
 from .exceptions import InvalidArgumentType
+from .hooks import _registered as _hooks
+
 
+class ResolveReport(namedtuple("ResolveReport", (
+        "url_path", "matches", "expected_view", "found_view",
+        "expected_args", "found_args", "expected_kwargs", "found_kwargs",
+        "route", "url_name", "redirect"), defaults=(None,))):
+    """ The expected and actual mapping of a URL to a view and arguments.
 
-def resolves_to(url_path, expected_view, expected_args, expected_kwargs):
+    The found view, arguments, route and URL name are None if the URL isn't
+    mapped to a view. The redirect is the path with an appended slash that
+    the URL was redirected to, if any. A report is truthy if the URL is mapped
+    as expected, so that it can be used in an assertion just like the result
+    of `resolves_to()`.
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return self.matches
+
+
+def resolves_to(url_path, expected_view, expected_args, expected_kwargs,
+                report=False, append_slash=False):
     """ Checks whether URL is resolved to the given view and arguments.
 
     This method preemptively checks for any mismatches between the given
@@ -58,20 +143,42 @@ def resolves_to(url_path, expected_view, expected_args, expected_kwargs):
     when using both named and unnamed regex groups in a URL pattern.
 
     :param str url_path: path of URL being mapped to a view and arguments
-    :param function expected_view: expected view
+    :param function|type expected_view: expected view, or its class
     :param tuple|list expected_args: expected positional arguments
     :param dict expected_kwargs: expected keyword arguments
-    :rtype: bool
+    :param bool report: return a report of the expected and actual mapping
+        instead of a bool
+    :param bool append_slash: follow the redirect to the path with a slash
+        appended, like `CommonMiddleware` does if APPEND_SLASH is enabled
+    :rtype: bool|ResolveReport
     :return: Is the URL mapped to a view and arguments as expected?
     :raises InvalidArgumentType:
         passed an argument with an unexpected/invalid type
     :raises ArgumentParameterMismatch:
         mismatch between expected view's parameters and arguments
     """
+    case = _validate(url_path, expected_view, expected_args, expected_kwargs)
+    check_for_mismatches(*case[1:])
+    result = _report(*case, append_slash=append_slash)
+    return result if report else result.matches
+
+
+def _validate(url_path, expected_view, expected_args, expected_kwargs):
+    """ Validates the arguments of `resolves_to()`.
+
+    :param str url_path: path of URL being mapped to a view and arguments
+    :param function|type expected_view: expected view, or its class
+    :param tuple|list expected_args: expected positional arguments
+    :param dict expected_kwargs: expected keyword arguments
+    :rtype: tuple
+    :return: the arguments, with the positional arguments as a tuple
+    :raises InvalidArgumentType:
+        passed an argument with an unexpected/invalid type
+    """
     if not isinstance(url_path, str):
         raise InvalidArgumentType("url_path must be a str")
-    if not isfunction(expected_view):
-        raise InvalidArgumentType("expected_view must be a function")
+    if not _is_view(expected_view):
+        raise InvalidArgumentType("expected_view must be a function or class")
     if not isinstance(expected_args, (tuple, list)):
         raise InvalidArgumentType("expected_args must be a tuple or list")
     if not isinstance(expected_kwargs, dict):
@@ -79,27 +186,69 @@ def resolves_to(url_path, expected_view, expected_args, expected_kwargs):
 
     if isinstance(expected_args, list):
         expected_args = tuple(expected_args)
+    return url_path, expected_view, expected_args, expected_kwargs
+
+
+def _report(url_path, expected_view, expected_args, expected_kwargs,
+            append_slash=False, variants=None):
+    """ Resolves a URL once, and reports whether it's mapped as expected.
+
+    :param str url_path: path of URL being mapped to a view and arguments
+    :param function|type expected_view: expected view, or its class
+    :param tuple expected_args: expected positional arguments
+    :param dict expected_kwargs: expected keyword arguments
+    :param bool append_slash: follow the redirect to the path with a slash
+        appended
+    :param dict variants: cached results of paths with an appended slash
+    :rtype: ResolveReport
+    :return: report of the expected and actual mapping of the URL
+    """
+    found, redirect = _resolve_slash(url_path, append_slash, variants)
+    matches = \
+        _matches_view(found, expected_view) and \
+        _matches_arguments(found, expected_args, expected_kwargs)
+    if not matches and _hooks:
+        _mismatch(url_path, found)
+    return ResolveReport(
+        url_path=url_path,
+        matches=matches,
+        expected_view=expected_view,
+        found_view=found.func if found else None,
+        expected_args=expected_args,
+        found_args=found.args if found else None,
+        expected_kwargs=expected_kwargs,
+        found_kwargs=found.kwargs if found else None,
+        route=found.route if found else None,
+        url_name=found.url_name if found else None,
+        redirect=redirect,
+    )
 
-    check_for_mismatches(expected_view, expected_args, expected_kwargs)
-    return \
-        resolves_to_view(url_path, expected_view) and \
-        resolves_to_arguments(url_path, expected_args, expected_kwargs)
+
+def _is_view(view):
+    """ Checks whether an object can be used as an expected view.
+
+    :param object view: object used as expected view
+    :rtype: bool
+    :return: Is it a (coroutine) function, a bound method, a partial, or the
+        class of a view?
+    """
+    return isfunction(view) or ismethod(view) or isclass(view) or \
+        isinstance(view, partial) or iscoroutinefunction(view)
 
 
 def resolves_to_view(url_path, expected_view):
     """ Checks whether a URL is resolved to the expected view.
 
     :param str url_path: path of URL being mapped to a view
-    :param function expected_view: expected view
+    :param function|type expected_view: expected view, or its class
     :rtype: bool
     :return: Is the URL mapped to a view as expected?
     """
-    try:
-        found = resolve_url(url_path)
-    except Resolver404:
-        return False
-
-    return found.func == expected_view
+    found = _resolve(url_path)
+    matches = _matches_view(found, expected_view)
+    if not matches and _hooks:
+        _mismatch(url_path, found)
+    return matches
 
 
 def resolves_to_arguments(url_path, expected_args, expected_kwargs):
@@ -111,18 +260,128 @@ def resolves_to_arguments(url_path, expected_args, expected_kwargs):
     :rtype: bool
     :return: Is the URL mapped to arguments as expected?
     """
+    found = _resolve(url_path)
+    matches = _matches_arguments(found, expected_args, expected_kwargs)
+    if not matches and _hooks:
+        _mismatch(url_path, found)
+    return matches
+
+
+def _resolve(url_path):
+    """ Resolves a URL.
+
+    :param str url_path: path of URL
+    :rtype: django.urls.ResolverMatch|NoneType
+    :return: view and arguments that the URL is mapped to, or None for a 404
+    """
+    if _hooks:
+        return _resolve_with_hooks(url_path)
+    try:
+        return resolve_url(url_path)
+    except Resolver404:
+        return None
+
+
+def _resolve_with_hooks(url_path):
+    """ Resolves a URL, calling the registered hooks around it.
+
+    :param str url_path: path of URL
+    :rtype: django.urls.ResolverMatch|NoneType
+    :return: view and arguments that the URL is mapped to, or None for a 404
+    """
+    hooks = tuple(_hooks)
+    for hook in hooks:
+        hook.pre_resolve(url_path)
+    start = time.perf_counter()
     try:
         found = resolve_url(url_path)
     except Resolver404:
+        found = None
+    seconds = time.perf_counter() - start
+    for hook in hooks:
+        hook.post_resolve(url_path, found, seconds)
+        if found is None:
+            hook.not_found(url_path, seconds)
+    return found
+
+
+def _mismatch(url_path, found):
+    """ Reports a URL that isn't mapped as expected to the registered hooks.
+
+    :param str url_path: path of URL
+    :param django.urls.ResolverMatch|NoneType found: resolved URL, or None
+    :rtype: NoneType
+    :return: N/A
+    """
+    for hook in tuple(_hooks):
+        hook.mismatch(url_path, found)
+
+
+def _resolve_slash(url_path, append_slash=False, variants=None):
+    """ Resolves a URL, optionally following a redirect to an appended slash.
+
+    :param str url_path: path of URL
+    :param bool append_slash: follow the redirect to the path with a slash
+        appended
+    :param dict variants: cached results of paths with an appended slash, or
+        None to not cache them
+    :rtype: (django.urls.ResolverMatch|NoneType, str|NoneType)
+    :return: resolved URL or None for a 404, and the path it was redirected
+        to or None if it wasn't redirected
+    """
+    found = _resolve(url_path)
+    if found is not None or not append_slash or url_path.endswith("/"):
+        return found, None
+
+    slashed = url_path + "/"
+    if variants is None:
+        found = _resolve(slashed)
+    elif slashed in variants:
+        found = variants[slashed]
+    else:
+        found = variants[slashed] = _resolve(slashed)
+    if found is None or not getattr(found.func, "should_append_slash", True):
+        return None, None
+    return found, slashed
+
+
+def _matches_view(found, expected_view):
+    """ Checks whether a resolved URL is mapped to the expected view.
+
+    :param django.urls.ResolverMatch|NoneType found: resolved URL, or None
+    :param function|type expected_view: expected view, or its class
+    :rtype: bool
+    :return: Is the URL mapped to a view as expected?
+    """
+    if found is None:
         return False
+    if isclass(expected_view):
+        return _unwrap_view(found.func)[0] is expected_view
+    return found.func == expected_view
+
 
+def _matches_arguments(found, expected_args, expected_kwargs):
+    """ Checks whether a resolved URL is mapped to the expected arguments.
+
+    :param django.urls.ResolverMatch|NoneType found: resolved URL, or None
+    :param tuple expected_args: expected positional arguments
+    :param dict expected_kwargs: expected keyword arguments
+    :rtype: bool
+    :return: Is the URL mapped to arguments as expected?
+    """
+    if found is None:
+        return False
     return expected_args == found.args and expected_kwargs == found.kwargs
 
 
 def check_for_mismatches(view, args, kwargs):
     """ Check for mismatches between arguments and the view's parameters.
 
-    :param function view: expected view
+    In the case of a class-based view, the arguments are checked against the
+    parameters of each of the class's handler methods. Decorated views and
+    partials are checked against the signature of the view they wrap.
+
+    :param function|type view: expected view, or its class
     :param tuple args: positional arguments
     :param dict kwargs: keyword arguments
     :rtype: NoneType
@@ -130,18 +389,130 @@ def check_for_mismatches(view, args, kwargs):
     :raises ArgumentParameterMismatch:
         mismatch between captured arguments and the view's parameters
     """
-    args = (None,) + args  # add stub for `request` parameter
+    view_class, keywords = _unwrap_view(view)
+    if isclass(view_class):
+        args = (None, None) + args  # add stubs for `self` and `request`
+        kwargs = {**keywords, **kwargs}
+        for handler, handler_signature in _handler_signatures(view_class):
+            _bind(handler, handler_signature, args, kwargs)
+    else:
+        args = (None,) + args  # add stub for `request` parameter
+        _bind(view, _view_signature(view), args, kwargs)
+
+
+def _bind(view, view_signature, args, kwargs):
+    """ Binds arguments, including stubs, to the parameters of a view.
+
+    :param function view: view or handler method
+    :param inspect.Signature view_signature: signature of the view
+    :param tuple args: positional arguments, including stubs
+    :param dict kwargs: keyword arguments
+    :rtype: NoneType
+    :return: N/A
+    :raises ArgumentParameterMismatch:
+        mismatch between captured arguments and the view's parameters
+    """
     try:
-        signature(view).bind(*args, **kwargs)
+        view_signature.bind(*args, **kwargs)
     except TypeError as e:
         msg = f"mismatch found: {view} <- {args}, {kwargs} - {e.args[0]}"
-        raise ArgumentParameterMismatch(msg)
+        raise ArgumentParameterMismatch(msg) from e
+
+
+def _cached_per_view(function):
+    """ Caches the results of a function per view, unless a view can't be
+        hashed, in which case the function is called every time.
+
+    :param function function: function taking a single view
+    :rtype: function
+    :return: the function, with the cache of `lru_cache()`
+    """
+    cached = lru_cache(maxsize=None)(function)
+
+    @wraps(function)
+    def wrapper(view):
+        try:
+            hash(view)
+        except TypeError:
+            return function(view)
+        return cached(view)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_cached_per_view
+def _unwrap_view(view):
+    """ Unwraps a view that is decorated, or built using `partial()`.
+
+    :param function|type view: view, or its class
+    :rtype: (function|type, dict)
+    :return: the innermost view or the class of a class-based view, and the
+        keyword arguments bound by partials
+    """
+    keywords = {}
+    for view in _iter_wrapped(view):
+        if isinstance(view, partial):
+            keywords = {**view.keywords, **keywords}
+    return view, keywords
+
 
+def _iter_wrapped(view):
+    """ Iterates over a view, and every view that it wraps.
 
-def resolves_to_404(url_path):
+    :param function|type view: view, or its class
+    :rtype: collections.abc.Iterator
+    :return: the view and the views it wraps, from outer to inner, ending
+        with the innermost view or the class of a class-based view
+    """
+    while not isclass(view):
+        yield view
+        view_class = getattr(view, "view_class", None)
+        if view_class is not None:
+            view = view_class
+        elif isinstance(view, partial):
+            view = view.func
+        elif hasattr(view, "__wrapped__"):
+            view = view.__wrapped__
+        else:
+            return
+    yield view
+
+
+@_cached_per_view
+def _view_signature(view):
+    """ Looks up the effective signature of a function-based view.
+
+    :param function view: view, which may be decorated or a partial
+    :rtype: inspect.Signature
+    :return: signature of the innermost view, without bound parameters
+    """
+    return signature(view)
+
+
+@lru_cache(maxsize=None)
+def _handler_signatures(view_class):
+    """ Looks up the handler methods of a class-based view.
+
+    :param type view_class: class of a class-based view
+    :rtype: tuple[(function, inspect.Signature)]
+    :return: every handler method of the class, and its signature
+    """
+    handlers = []
+    for method in getattr(view_class, "http_method_names", ()):
+        handler = getattr(view_class, method, None)
+        if handler is not None:
+            handlers.append((handler, signature(handler)))
+    return tuple(handlers)
+
+
+def resolves_to_404(url_path, append_slash=False):
     """ Checks whether URL couldn't be mapped to a view, resulting in a 404.
 
     :param str url_path: path of URL
+    :param bool append_slash: follow the redirect to the path with a slash
+        appended, like `CommonMiddleware` does if APPEND_SLASH is enabled
     :rtype: bool
     :return: Is URL resolved to a 404?
     :raises InvalidArgumentType:
@@ -150,8 +521,7 @@ def resolves_to_404(url_path):
     if not isinstance(url_path, str):
         raise InvalidArgumentType("url_path must be a str")
 
-    try:
-        _ = resolve_url(url_path)
-        return False
-    except Resolver404:
-        return True
+    found, _ = _resolve_slash(url_path, append_slash)
+    if found is not None and _hooks:
+        _mismatch(url_path, found)
+    return found is None
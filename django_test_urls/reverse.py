@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to test the reversing of many URLs at once.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Reversing in Bulk
+# ~~~~~~~~~~~~~~~~~
+# Every call to `reverse()` looks up the resolver of each namespace in the
+# view name, and wraps the innermost one in a new resolver whenever the
+# namespaces capture arguments. Instead, the resolver used for each chain of
+# namespaces is determined once, the same way `reverse()` does, and all of
+# their reverse dictionaries are populated up front. Populating these is
+# timed separately, so that its cost shows up in the result instead of being
+# attributed to the first case that happens to trigger it.
+#
+# Comparing Paths
+# ~~~~~~~~~~~~~~~
+# URL paths are resolved the way `resolve()` does, without a script prefix,
+# while reversed URLs are quoted. Reversed URLs are therefore generated
+# without a script prefix, and are unquoted before they're compared.
+
+import time
+from collections import namedtuple
+from urllib.parse import unquote
+
+from django.urls import NoReverseMatch
+from django.urls import Resolver404
+from django.urls import get_resolver
+from django.urls.resolvers import get_ns_resolver
+
+
+#: a URL path that didn't survive a round trip through `reverse()`
+ReverseFailure = namedtuple("ReverseFailure", (
+    "url_path",        # path of the URL that was resolved
+    "view_name",       # namespaced name of the view it was resolved to
+    "args",            # positional arguments that were captured
+    "kwargs",          # keyword arguments that were captured
+    "reversed_path",   # path generated by reversing, or None
+    "error",           # exception raised while reversing, or None
+))
+
+
+class ReverseResult(namedtuple("ReverseResult", (
+        "total", "failures", "skipped", "populate_seconds"))):
+    """ The outcome of reversing a batch of resolved URLs.
+
+    A result is truthy if every URL was reversed to the same path, so that
+    it can be used in an assertion just like the result of `resolves_all()`.
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return not self.failures
+
+
+def reverses_all(url_paths, urlconf=None):
+    """ Checks whether every URL is reversed to the same path it came from.
+
+    Every URL is resolved, and the name of its view and the captured
+    arguments are passed to `reverse()`, which should generate the same path
+    again. URLs that can't be resolved, or that are resolved to a route
+    without a name, can't be reversed and are skipped.
+
+    :param url_paths: paths of URLs
+    :type url_paths: collections.abc.Iterable[str]
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :rtype: ReverseResult
+    :return: number of URLs, the failed and skipped URLs, and the time it took
+        to populate the reverse dictionaries
+    """
+    start = time.perf_counter()
+    root = get_resolver(urlconf)
+    resolvers = _namespace_resolvers(root)
+    populate_seconds = time.perf_counter() - start
+
+    total = 0
+    failures = []
+    skipped = []
+    for url_path in url_paths:
+        total += 1
+        try:
+            found = root.resolve(url_path)
+        except Resolver404:
+            skipped.append(url_path)
+            continue
+        if found.url_name is None:
+            skipped.append(url_path)
+            continue
+
+        resolver = resolvers[tuple(found.namespaces)]
+        reversed_path = error = None
+        try:
+            reversed_path = resolver._reverse_with_prefix(
+                found.url_name, "/", *found.args, **found.kwargs)
+        except (NoReverseMatch, ValueError) as e:
+            error = e
+        if reversed_path is None or unquote(reversed_path) != url_path:
+            failures.append(ReverseFailure(
+                url_path, found.view_name, found.args, found.kwargs,
+                reversed_path, error))
+    return ReverseResult(total, failures, skipped, populate_seconds)
+
+
+def _namespace_resolvers(root):
+    """ Determines the resolver that `reverse()` uses for each namespace.
+
+    :param URLResolver root: resolver of a URLconf
+    :rtype: dict
+    :return: populated resolver for every chain of namespaces
+    """
+    root.reverse_dict  # populates the root resolver
+    resolvers = {(): root}
+    _add_namespace_resolvers(resolvers, (), root, "", {})
+    return resolvers
+
+
+def _add_namespace_resolvers(resolvers, namespaces, resolver, pattern,
+                             converters):
+    """ Adds the resolvers of the namespaces nested inside a resolver.
+
+    :param dict resolvers: populated resolver for every chain of namespaces
+    :param tuple namespaces: chain of namespaces of the resolver
+    :param URLResolver resolver: resolver of the innermost namespace
+    :param str pattern: regex combining the prefixes of the namespaces
+    :param dict converters: converters used by the prefixes
+    :rtype: NoneType
+    :return: N/A
+    """
+    for namespace in list(resolver.namespace_dict):
+        # like `reverse()`, prefer the default instance of an application
+        instances = resolver.app_dict.get(namespace, [namespace])
+        instance = namespace if namespace in instances else instances[0]
+        prefix, inner = resolver.namespace_dict[instance]
+        inner_pattern = pattern + prefix
+        inner_converters = {**converters, **inner.pattern.converters}
+        ns_resolver = get_ns_resolver(
+            inner_pattern, inner, tuple(inner_converters.items()))
+        ns_resolver.reverse_dict  # populates the namespaced resolver
+        resolvers[namespaces + (namespace,)] = ns_resolver
+        _add_namespace_resolvers(
+            resolvers, namespaces + (namespace,), inner, inner_pattern,
+            inner_converters)
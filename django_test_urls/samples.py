@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to generate URLs that should (not) match URLs.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Generating Samples
+# ~~~~~~~~~~~~~~~~~~
+# Both `path()` and `re_path()` are compiled by Django into a regex, so that
+# samples for both kinds of URL patterns can be generated from their regex.
+# In the case of `path()`, that regex is built from the converters' regexes.
+#
+# The parse tree of a regex is compiled into a generator exactly once, and
+# that generator is cached on the regex's source. A generator can produce
+# several variants of a sample, e.g. by picking a different alternative of a
+# branch or by repeating a subpattern once more. Features that cannot be
+# generated reliably, such as lookarounds, are simply ignored; every sample
+# is matched against its regex afterwards, and dropped if it doesn't match.
+#
+# Near Misses
+# ~~~~~~~~~~~
+# A near miss is derived from the first sample of a route by toggling its
+# trailing slash, appending an extra segment, altering its prefix, or by
+# replacing a captured value with one that its group (or converter) rejects.
+# Such a URL shouldn't resolve; if it does, then a regex is likely too
+# permissive, or another route shadows it.
+#
+# Deriving Arguments
+# ~~~~~~~~~~~~~~~~~~
+# The captured arguments are derived from the regex's match of a sample, and
+# then combined in the same way Django combines them while resolving a URL,
+# including the quirks described in `resolves_to.py`.
+#
+# A sample can be matched by an earlier route, e.g. the empty sample of a
+# catch-all `(?P<url>.*)$` by the route of the index page. Every sample is
+# resolved once before it becomes a case, and dropped unless it reaches its
+# own route, so that generated cases pass on a correct URLconf.
+
+import string
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    from re import _parser as sre_parse  # Python 3.11 and later
+except ImportError:  # pragma: no cover
+    import sre_parse
+
+from django.urls.exceptions import Resolver404
+from django.urls.resolvers import RoutePattern
+
+from .batch import BatchResult
+from .batch import CaseFailure
+from .batch import UrlCase
+from .resolves_to import resolves_to_404
+from .urlconf import iter_routes
+
+
+#: number of variants generated for every regex and URL pattern
+SAMPLE_VARIANTS = 2
+
+#: a URL that nearly matches a route, but shouldn't be mapped to a view
+NearMiss = namedtuple("NearMiss", ("url_path", "kind", "route"))
+
+# characters used to generate a single character, in order of preference
+_POOL = string.ascii_letters + string.digits + "-_.~" + \
+    "".join(c for c in string.punctuation if c not in "-_.~") + " "
+
+_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: str.isdigit,
+    sre_parse.CATEGORY_NOT_DIGIT: lambda c: not c.isdigit(),
+    sre_parse.CATEGORY_SPACE: str.isspace,
+    sre_parse.CATEGORY_NOT_SPACE: lambda c: not c.isspace(),
+    sre_parse.CATEGORY_WORD: lambda c: c.isalnum() or c == "_",
+    sre_parse.CATEGORY_NOT_WORD: lambda c: not (c.isalnum() or c == "_"),
+}
+
+
+class _Unsatisfiable(Exception):
+    """ Used to signal that a part of a regex cannot be generated.
+    """
+    pass
+
+
+def generate_samples(regex):
+    """ Generates strings that are fully matched by a regex.
+
+    :param re.Pattern regex: compiled regex
+    :rtype: list[str]
+    :return: distinct samples matched by the regex, possibly none
+    """
+    emit = _compile_regex(regex.pattern, regex.flags)
+    samples = []
+    for variant in range(SAMPLE_VARIANTS):
+        out = []
+        try:
+            emit(variant, out, {})
+        except _Unsatisfiable:
+            continue
+        sample = "".join(out)
+        if sample not in samples and regex.fullmatch(sample):
+            samples.append(sample)
+    return samples
+
+
+def generate_cases(urlconf=None):
+    """ Generates cases for every route of a URLconf that should resolve.
+
+    Every case consists of a URL path, the view of the route, and the
+    arguments that Django should capture, so that it can be checked using
+    `resolves_to()` or `resolves_all()`.
+
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :rtype: list[UrlCase]
+    :return: cases for every route that samples could be generated for
+    """
+    cases = []
+    for route in iter_routes(urlconf):
+        cases.extend(route_cases(route))
+    return cases
+
+
+def route_cases(route):
+    """ Generates cases for a single route that should resolve.
+
+    :param Route route: route for which cases are generated
+    :rtype: list[UrlCase]
+    :return: distinct cases for the route, possibly none
+    """
+    levels = [_level_matches(level.pattern) for level in route.levels]
+    if not all(levels):
+        return []
+    cases = []
+    for variant in range(SAMPLE_VARIANTS):
+        picked = [matches[min(variant, len(matches) - 1)]
+                  for matches in levels]
+        url_path = "".join(sample for sample, _ in picked)
+        if url_path in (case.url_path for case in cases) or \
+                not _reaches_route(route, url_path):
+            continue
+        args, kwargs = combine_arguments(route, [m for _, m in picked])
+        cases.append(UrlCase(url_path, route.pattern.callback, args, kwargs))
+    return cases
+
+
+def resolves_near_misses_to_404(urlconf=None):
+    """ Checks whether none of the near misses of a URLconf can be resolved.
+
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :rtype: BatchResult
+    :return: number of near misses that were checked, and those resolved
+    """
+    near_misses = generate_near_misses(urlconf)
+    failures = [
+        CaseFailure(near_miss, None) for near_miss in near_misses
+        if not resolves_to_404(near_miss.url_path)
+    ]
+    return BatchResult(len(near_misses), failures)
+
+
+def generate_near_misses(urlconf=None):
+    """ Generates URLs for every route of a URLconf that shouldn't resolve.
+
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :rtype: list[NearMiss]
+    :return: near misses for every route that samples could be generated for
+    """
+    near_misses = []
+    for route in iter_routes(urlconf):
+        near_misses.extend(route_near_misses(route))
+    return near_misses
+
+
+def route_near_misses(route):
+    """ Generates URLs for a single route that shouldn't resolve.
+
+    :param Route route: route for which near misses are generated
+    :rtype: list[NearMiss]
+    :return: distinct near misses for the route, possibly none
+    """
+    levels = [_level_matches(level.pattern) for level in route.levels]
+    if not all(levels):
+        return []
+    samples = [matches[0][0] for matches in levels]
+    url_path = "".join(samples)
+    slash = url_path.endswith("/")
+    prefix = "-" if url_path[1:2] == "~" else "~"
+    candidates = [
+        ("trailing_slash", url_path[:-1] if slash else url_path + "/"),
+        ("extra_segment", url_path + ("extra/" if slash else "/extra")),
+        ("wrong_prefix", "/" + prefix + url_path[2:]),
+    ]
+    for index, level in enumerate(route.levels[1:], start=1):
+        for sample in _out_of_range(level.pattern, samples[index]):
+            candidates.append(("out_of_range", "".join(
+                samples[:index] + [sample] + samples[index + 1:])))
+    near_misses = []
+    for kind, candidate in candidates:
+        if candidate != url_path and candidate not in (
+                near_miss.url_path for near_miss in near_misses):
+            near_misses.append(NearMiss(candidate, kind, route))
+    return near_misses
+
+
+def combine_arguments(route, matches):
+    """ Combines the arguments captured by each level of a route.
+
+    :param Route route: route that was matched
+    :param list matches: (args, kwargs) captured by each level of the route
+    :rtype: (tuple, dict)
+    :return: the arguments that Django passes on to the view
+    """
+    *outer, (args, kwargs) = matches
+    kwargs = {**kwargs, **route.pattern.default_args}
+    for resolver, (outer_args, outer_kwargs) in zip(
+            reversed(route.resolvers), reversed(outer)):
+        kwargs = {**outer_kwargs, **resolver.default_kwargs, **kwargs}
+        if not kwargs:
+            args = outer_args + args
+    return args, kwargs
+
+
+def _level_matches(pattern):
+    """ Generates samples for a single level of a route.
+
+    :param pattern: pattern of a URL pattern or a URL resolver
+    :rtype: list[(str, (tuple, dict))]
+    :return: samples and their captured arguments, excluding rejected ones
+    """
+    matches = []
+    for sample in generate_samples(pattern.regex):
+        captured = _match_level(pattern, sample)
+        if captured is not None:
+            matches.append((sample, captured))
+    return matches
+
+
+def _reaches_route(route, url_path):
+    """ Checks whether a sample is resolved by its own route, rather than by
+        an earlier route that shadows it.
+
+    :param Route route: route the sample was generated for
+    :param str url_path: path of URL generated for the route
+    :rtype: bool
+    :return: Is the URL resolved to the route it was generated for?
+    """
+    try:
+        found = route.resolvers[0].resolve(url_path)
+    except Resolver404:
+        return False
+    return found.func is route.pattern.callback and found.route == route.route
+
+
+def _out_of_range(pattern, sample):
+    """ Replaces each captured value of a sample with a rejected value.
+
+    :param pattern: pattern of a URL pattern or a URL resolver
+    :param str sample: sample fully matched by the pattern's regex
+    :rtype: list[str]
+    :return: samples with one captured value replaced by a rejected one
+    """
+    match = pattern.regex.fullmatch(sample)
+    samples = []
+    for group in range(1, pattern.regex.groups + 1):
+        start, end = match.span(group)
+        if start < 0:
+            continue
+        value = sample[start:end]
+        for replacement in ("9" * len(value), "0" * len(value),
+                            value + value[-1:], value[:-1], "-1", "~"):
+            replaced = sample[:start] + replacement + sample[end:]
+            if pattern.regex.fullmatch(replaced) is None or \
+                    _match_level(pattern, replaced) is None:
+                samples.append(replaced)
+                break
+    return samples
+
+
+def _match_level(pattern, sample):
+    """ Derives the arguments captured by a single level of a route.
+
+    :param pattern: pattern of a URL pattern or a URL resolver
+    :param str sample: sample fully matched by the pattern's regex
+    :rtype: (tuple, dict)|NoneType
+    :return: captured arguments, or None if a converter rejects the sample
+    """
+    match = pattern.regex.fullmatch(sample)
+    kwargs = match.groupdict()
+    if isinstance(pattern, RoutePattern):
+        try:
+            return (), {k: pattern.converters[k].to_python(v)
+                        for k, v in kwargs.items()}
+        except ValueError:
+            return None
+    args = () if kwargs else match.groups()
+    return args, {k: v for k, v in kwargs.items() if v is not None}
+
+
+@lru_cache(maxsize=None)
+def _compile_regex(pattern, flags):
+    """ Compiles the source of a regex into a cached sample generator.
+
+    :param str pattern: source of a regex
+    :param int flags: flags of the regex
+    :rtype: function
+    :return: generator appending a sample's parts to a list
+    """
+    return _compile(sre_parse.parse(pattern, flags))
+
+
+def _compile(parsed):
+    """ Compiles a parse tree into a sample generator.
+
+    :param parsed: parse tree of (a part of) a regex
+    :type parsed: sre_parse.SubPattern|list
+    :rtype: function
+    :return: generator appending a sample's parts to a list
+    """
+    emitters = [
+        _COMPILERS.get(op, _compile_unsupported)(av) for op, av in parsed
+    ]
+
+    def emit(variant, out, groups):
+        for emitter in emitters:
+            emitter(variant, out, groups)
+
+    return emit
+
+
+def _compile_nothing(av):
+    """ Compiles an anchor or lookaround, which adds nothing to a sample.
+
+    :param av: argument of the opcode, which is ignored
+    :rtype: function
+    :return: generator that appends nothing
+    """
+    return lambda variant, out, groups: None
+
+
+def _compile_unsupported(av):
+    """ Compiles an opcode that samples can't be generated for.
+
+    :param av: argument of the opcode, which is ignored
+    :rtype: function
+    :return: generator raising `_Unsatisfiable`
+    """
+    def emit(variant, out, groups):
+        raise _Unsatisfiable()
+
+    return emit
+
+
+def _compile_choice(choices):
+    """ Compiles a choice of characters, picking one per variant.
+
+    :param choices: characters in order of preference
+    :type choices: str|list[str]
+    :rtype: function
+    :return: generator appending one of the characters
+    """
+    if not choices:
+        return _compile_unsupported(choices)
+
+    def emit(variant, out, groups):
+        out.append(choices[min(variant, len(choices) - 1)])
+
+    return emit
+
+
+def _compile_literal(av):
+    """ Compiles a literal character.
+
+    :param int av: code point of the character
+    :rtype: function
+    :return: generator appending the character
+    """
+    return _compile_choice(chr(av))
+
+
+def _compile_not_literal(av):
+    """ Compiles a negated literal, e.g. `[^a]`.
+
+    :param int av: code point of the excluded character
+    :rtype: function
+    :return: generator appending any other character of the pool
+    """
+    return _compile_choice([c for c in _POOL if ord(c) != av])
+
+
+def _compile_any(av):
+    """ Compiles `.`, which matches any character.
+
+    :param av: argument of the opcode, which is ignored
+    :rtype: function
+    :return: generator appending a character of the pool
+    """
+    return _compile_choice(_POOL)
+
+
+def _compile_in(av):
+    """ Compiles a (negated) character set, e.g. `[a-z_]`.
+
+    :param list av: items of the set
+    :rtype: function
+    :return: generator appending a character in the set
+    """
+    negate = bool(av) and av[0][0] is sre_parse.NEGATE
+    items = av[1:] if negate else av
+    choices = [c for c in _POOL if _in_set(items, c) != negate]
+    for op, item in items if not negate else ():
+        if op is sre_parse.LITERAL or op is sre_parse.RANGE:
+            char = chr(item[0] if op is sre_parse.RANGE else item)
+            if char not in choices:
+                choices.append(char)
+    return _compile_choice(choices)
+
+
+def _in_set(items, char):
+    """ Checks whether a character is one of the items of a set.
+
+    :param list items: items of the set, without a negation
+    :param str char: character being checked
+    :rtype: bool
+    :return: Is the character in the set?
+    """
+    code = ord(char)
+    for op, av in items:
+        if op is sre_parse.LITERAL and code == av:
+            return True
+        if op is sre_parse.RANGE and av[0] <= code <= av[1]:
+            return True
+        if op is sre_parse.CATEGORY and _CATEGORIES.get(av, bool)(char):
+            return True
+    return False
+
+
+def _compile_branch(av):
+    """ Compiles alternatives, e.g. `a|b`, picking one per variant.
+
+    :param tuple av: (None, alternatives) of the branch
+    :rtype: function
+    :return: generator appending one of the alternatives
+    """
+    alternatives = [_compile(alternative) for alternative in av[1]]
+
+    def emit(variant, out, groups):
+        alternatives[min(variant, len(alternatives) - 1)](variant, out, groups)
+
+    return emit
+
+
+def _compile_repeat(av):
+    """ Compiles a repeat, repeating once more in every next variant.
+
+    :param tuple av: (minimum, maximum, subpattern) of the repeat
+    :rtype: function
+    :return: generator appending the subpattern a number of times
+    """
+    low, high, sub = av
+    sub = _compile(sub)
+
+    def emit(variant, out, groups):
+        for _ in range(min(low + variant, high)):
+            sub(variant, out, groups)
+
+    return emit
+
+
+def _compile_subpattern(av):
+    """ Compiles a (capturing) group, recording what it captured.
+
+    :param tuple av: group number, or None, followed by the subpattern
+    :rtype: function
+    :return: generator appending the subpattern
+    """
+    group, sub = av[0], _compile(av[-1])
+
+    def emit(variant, out, groups):
+        start = len(out)
+        sub(variant, out, groups)
+        if group is not None:
+            groups[group] = "".join(out[start:])
+
+    return emit
+
+
+def _compile_groupref(av):
+    """ Compiles a backreference, e.g. `(?P=name)`.
+
+    :param int av: number of the referenced group
+    :rtype: function
+    :return: generator appending what the group captured
+    """
+    def emit(variant, out, groups):
+        out.append(groups.get(av, ""))
+
+    return emit
+
+
+def _compile_groupref_exists(av):
+    """ Compiles a conditional, e.g. `(?(1)yes|no)`.
+
+    :param tuple av: (group number, yes, no) of the conditional
+    :rtype: function
+    :return: generator appending either branch, depending on the group
+    """
+    group, yes, no = av
+    yes = _compile(yes)
+    no = _compile(no) if no is not None else _compile([])
+
+    def emit(variant, out, groups):
+        (yes if group in groups else no)(variant, out, groups)
+
+    return emit
+
+
+_COMPILERS = {
+    sre_parse.LITERAL: _compile_literal,
+    sre_parse.NOT_LITERAL: _compile_not_literal,
+    sre_parse.ANY: _compile_any,
+    sre_parse.IN: _compile_in,
+    sre_parse.BRANCH: _compile_branch,
+    sre_parse.MAX_REPEAT: _compile_repeat,
+    sre_parse.MIN_REPEAT: _compile_repeat,
+    sre_parse.SUBPATTERN: _compile_subpattern,
+    sre_parse.GROUPREF: _compile_groupref,
+    sre_parse.GROUPREF_EXISTS: _compile_groupref_exists,
+    sre_parse.AT: _compile_nothing,
+    sre_parse.ASSERT: _compile_nothing,
+    sre_parse.ASSERT_NOT: _compile_nothing,
+}
+
+if hasattr(sre_parse, "ATOMIC_GROUP"):  # pragma: no branch
+    _COMPILERS[sre_parse.ATOMIC_GROUP] = _compile
+    _COMPILERS[sre_parse.POSSESSIVE_REPEAT] = _compile_repeat
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to smoke test the views that URLs resolve to.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Dispatching
+# ~~~~~~~~~~~
+# Every URL is resolved, and the view it's mapped to is called directly with
+# the captured arguments, using a request built by a single `RequestFactory`.
+# Unlike the test client, no middleware, signals or response checks are
+# involved, so that each call only costs the view itself. Responses that are
+# rendered lazily, such as `TemplateResponse`, are rendered like Django's
+# handler would.
+#
+# Like a middleware setting `request.urlconf`, a URLconf passed by the caller
+# is set on every request, so that views can reverse URLs with it.
+#
+# Asynchronous views are called using `async_to_sync()`, and the exceptions
+# that Django turns into responses (Http404, PermissionDenied, ...) are
+# reported with the status code of that response.
+
+import time
+from collections import namedtuple
+
+from asgiref.sync import async_to_sync
+
+try:
+    from asgiref.sync import iscoroutinefunction
+except ImportError:  # pragma: no cover
+    from asyncio import iscoroutinefunction
+
+from django.core.exceptions import BadRequest
+from django.core.exceptions import PermissionDenied
+from django.core.exceptions import SuspiciousOperation
+from django.http import Http404
+from django.test import RequestFactory
+from django.urls import get_resolver
+from django.urls.exceptions import Resolver404
+
+from .urlconf import view_path
+
+
+#: outcome of dispatching a single URL to its view
+DispatchResult = namedtuple("DispatchResult", (
+    "url_path",     # path of URL
+    "view",         # dotted path of view, or None if the URL wasn't resolved
+    "status_code",  # status code of response, or None if an error occurred
+    "seconds",      # time it took the view to respond
+    "error",        # exception raised by the view, or None
+))
+
+#: latency of a view over every URL dispatched to it
+ViewLatency = namedtuple("ViewLatency", (
+    "view",          # dotted path of view
+    "calls",         # number of URLs dispatched to the view
+    "seconds",       # total time it took the view to respond
+    "max_seconds",   # slowest response of the view
+))
+
+# status codes of the responses to exceptions that Django handles
+_HANDLED_EXCEPTIONS = (
+    (Http404, 404),
+    (PermissionDenied, 403),
+    (BadRequest, 400),
+    (SuspiciousOperation, 400),
+)
+
+
+class SmokeReport(namedtuple("SmokeReport", ("results", "latencies"))):
+    """ The outcome of dispatching a batch of URLs to their views.
+
+    A report is truthy if no view raised an unhandled exception or responded
+    with a server error, so that it can be used in an assertion.
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return not self.errors
+
+    @property
+    def errors(self):
+        """ Results of the URLs whose view failed.
+        """
+        return [
+            result for result in self.results
+            if result.status_code is None or result.status_code >= 500
+        ]
+
+
+def smoke_dispatch(url_paths, method="get", prepare=None, urlconf=None):
+    """ Dispatches URLs directly to their views, skipping middleware.
+
+    :param url_paths: paths of URLs
+    :type url_paths: collections.abc.Iterable[str]
+    :param str method: HTTP method of the requests
+    :param function prepare: called with every request before dispatching
+        it, e.g. to set `request.user`, or None
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :rtype: SmokeReport
+    :return: result of every URL, and the latency of every view, the
+        slowest view first
+    """
+    resolver = get_resolver(urlconf)
+    factory = RequestFactory()
+    results = []
+    latencies = {}
+    for url_path in url_paths:
+        try:
+            found = resolver.resolve(url_path)
+        except Resolver404:
+            results.append(DispatchResult(url_path, None, 404, 0.0, None))
+            continue
+
+        request = factory.generic(method.upper(), url_path)
+        request.resolver_match = found
+        if urlconf is not None:
+            request.urlconf = urlconf
+        if prepare is not None:
+            prepare(request)
+        result = _dispatch(request, found)
+        results.append(result)
+
+        calls, seconds, max_seconds = latencies.get(result.view, (0, 0, 0))
+        latencies[result.view] = (
+            calls + 1, seconds + result.seconds,
+            max(max_seconds, result.seconds))
+
+    return SmokeReport(results, sorted(
+        (ViewLatency(view, *latency) for view, latency in latencies.items()),
+        key=lambda latency: latency.seconds, reverse=True))
+
+
+def _dispatch(request, found):
+    """ Calls the view of a resolved URL, and renders its response.
+
+    :param django.http.HttpRequest request: request for the URL
+    :param django.urls.ResolverMatch found: the resolved URL
+    :rtype: DispatchResult
+    :return: status code of the response, and the time it took
+    """
+    view = found.func
+    if iscoroutinefunction(view):
+        view = async_to_sync(view)
+
+    status_code = error = None
+    start = time.perf_counter()
+    try:
+        response = view(request, *found.args, **found.kwargs)
+        if callable(getattr(response, "render", None)):
+            response = response.render()
+        status_code = response.status_code
+    except Exception as e:
+        status_code = _handled_status_code(e)
+        if status_code is None:
+            error = e
+    seconds = time.perf_counter() - start
+    return DispatchResult(
+        request.path_info, view_path(found.func), status_code, seconds,
+        error)
+
+
+def _handled_status_code(error):
+    """ Determines the status code of the response to a handled exception.
+
+    :param Exception error: exception raised by a view
+    :rtype: int|NoneType
+    :return: status code, or None if Django doesn't handle the exception
+    """
+    for exception_type, status_code in _HANDLED_EXCEPTIONS:
+        if isinstance(error, exception_type):
+            return status_code
+    return None
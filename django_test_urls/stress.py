@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to stress test URL resolution from many threads.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Measuring Scaling
+# ~~~~~~~~~~~~~~~~~
+# Every thread resolves the same mix of URLs, starting at a different offset
+# so that threads don't resolve the same URL in lockstep. All threads are
+# released at once using a barrier, and the run ends when the last thread
+# has finished.
+#
+# The efficiency of a run compares its throughput with the throughput of the
+# first run, scaled to the number of threads. An efficiency close to 1.0
+# means that resolution scales linearly with the number of threads.
+#
+# Detecting Contention
+# ~~~~~~~~~~~~~~~~~~~~
+# The CPU time of each thread is compared with the wall-clock time of the
+# run. If threads run in parallel, then this ratio stays close to 1.0; if
+# threads are serialized by a lock (or the GIL), then it approaches 1/N.
+#
+# Detecting Inconsistencies
+# ~~~~~~~~~~~~~~~~~~~~~~~~~
+# Before any threads are started, every URL is resolved once to establish the
+# expected `ResolverMatch`. Each thread compares its results with these, and
+# reports any differences as inconsistencies.
+#
+# Since the active language and the URLconf set by `set_urlconf()` are local
+# to a thread, and aren't copied to threads that are started from it, every
+# thread activates the caller's language and URLconf before resolving URLs.
+
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from django.urls import get_urlconf
+from django.urls import resolve as resolve_url
+from django.urls import set_urlconf
+from django.urls.exceptions import Resolver404
+from django.utils import translation
+
+from .exceptions import InvalidArgumentType
+
+
+#: outcome of resolving a URL from many threads at once
+StressResult = namedtuple("StressResult", (
+    "threads",          # number of threads
+    "calls",            # number of URLs resolved by all threads
+    "seconds",          # wall-clock time of the run
+    "throughput",       # URLs resolved per second
+    "efficiency",       # throughput relative to the first run, per thread
+    "cpu_ratio",        # CPU time of threads relative to wall-clock time
+    "max_latency",      # slowest resolution of a single URL, in seconds
+    "inconsistencies",  # (url_path, expected, found) that didn't match
+))
+
+#: outcome of stress testing with a growing number of threads
+StressReport = namedtuple("StressReport", ("gil_enabled", "results"))
+
+
+def stress_resolve(url_paths, thread_counts=(1, 2, 4, 8), rounds=10):
+    """ Resolves a mix of URLs from a growing number of threads.
+
+    :param url_paths: paths of URLs that are resolved by every thread
+    :type url_paths: collections.abc.Iterable[str]
+    :param tuple[int] thread_counts: number of threads of each run
+    :param int rounds: number of times each thread resolves every URL
+    :rtype: StressReport
+    :return: whether the GIL is enabled, and the result of every run
+    :raises InvalidArgumentType:
+        a number of threads isn't a positive int
+    :raises Exception:
+        the first exception raised by a thread, other than a 404
+    """
+    for threads in thread_counts:
+        if not isinstance(threads, int) or threads < 1:
+            raise InvalidArgumentType(
+                "thread_counts must contain positive ints")
+    url_paths = list(url_paths)
+    expected = {url_path: _resolve(url_path) for url_path in url_paths}
+    results = []
+    for threads in thread_counts:
+        result = _run(url_paths, expected, threads, rounds)
+        if results and results[0].throughput:
+            baseline = results[0].throughput / results[0].threads
+            result = result._replace(
+                efficiency=result.throughput / (baseline * threads))
+        results.append(result)
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return StressReport(gil_enabled, results)
+
+
+def _run(url_paths, expected, threads, rounds):
+    """ Resolves a mix of URLs from a given number of threads.
+
+    :param list[str] url_paths: paths of URLs resolved by every thread
+    :param dict expected: expected outcome of resolving every URL
+    :param int threads: number of threads
+    :param int rounds: number of times each thread resolves every URL
+    :rtype: StressResult
+    :return: the result of the run, with an efficiency of 1.0
+    """
+    barrier = threading.Barrier(threads + 1)
+    stats = [None] * threads
+    context = (translation.get_language(), get_urlconf())
+    workers = [
+        threading.Thread(
+            target=_work,
+            args=(barrier, stats, index, url_paths, expected, rounds,
+                  context))
+        for index in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    seconds = time.perf_counter() - start
+    for stat in stats:
+        if isinstance(stat, Exception):
+            raise stat
+
+    calls = threads * rounds * len(url_paths)
+    cpu_time = sum(cpu for cpu, _, _ in stats)
+    return StressResult(
+        threads=threads,
+        calls=calls,
+        seconds=seconds,
+        throughput=calls / seconds,
+        efficiency=1.0,
+        cpu_ratio=cpu_time / (seconds * threads),
+        max_latency=max(latency for _, latency, _ in stats),
+        inconsistencies=[i for _, _, found in stats for i in found],
+    )
+
+
+def _work(barrier, stats, index, url_paths, expected, rounds, context):
+    """ Resolves a mix of URLs repeatedly, as one of the threads of a run.
+
+    :param threading.Barrier barrier: used to start all threads at once
+    :param list stats: used to store (cpu time, max latency, inconsistencies),
+        or the exception raised while resolving a URL
+    :param int index: index of this thread
+    :param list[str] url_paths: paths of URLs to resolve
+    :param dict expected: expected outcome of resolving every URL
+    :param int rounds: number of times every URL is resolved
+    :param tuple context: active language and URLconf of the caller
+    :rtype: NoneType
+    :return: N/A
+    """
+    language, urlconf = context
+    if language is not None:
+        translation.activate(language)
+    set_urlconf(urlconf)
+    offset = index % len(url_paths) if url_paths else 0
+    url_paths = url_paths[offset:] + url_paths[:offset]
+    inconsistencies = []
+    max_latency = 0.0
+    barrier.wait()
+    cpu_start = time.thread_time()
+    try:
+        for _ in range(rounds):
+            for url_path in url_paths:
+                start = time.perf_counter()
+                found = _resolve(url_path)
+                latency = time.perf_counter() - start
+                if latency > max_latency:
+                    max_latency = latency
+                if found != expected[url_path]:
+                    inconsistencies.append(
+                        (url_path, expected[url_path], found))
+    except Exception as e:
+        stats[index] = e
+        return
+    stats[index] = (time.thread_time() - cpu_start, max_latency,
+                    inconsistencies)
+
+
+def _resolve(url_path):
+    """ Resolves a URL into a comparable outcome.
+
+    :param str url_path: path of URL
+    :rtype: tuple|NoneType
+    :return: the view, arguments, name and route; or None if not found
+    """
+    try:
+        found = resolve_url(url_path)
+    except Resolver404:
+        return None
+    return (found.func, found.args, found.kwargs, found.view_name,
+            found.route)
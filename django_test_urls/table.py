@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains a compact table of cases, for checking very many URLs at once.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+# DEV NOTES
+# ----------------------------------------------------------------------------
+#
+# Layout
+# ~~~~~~
+# Holding every case as a tuple with its own str, tuple and dict costs a few
+# hundred bytes per case. A table instead stores its cases in a handful of
+# flat arrays:
+#
+# - the paths of all URLs are encoded in one contiguous buffer, and each
+#   case stores the offset of its path in that buffer
+# - the arguments of all cases are encoded as JSON arrays in a second buffer,
+#   with the positional arguments first and the keyword arguments last
+# - views and the keys of keyword arguments are interned, so each case only
+#   stores the index of its view, the index of its keys, and the number of
+#   its positional arguments
+#
+# Cases are only decoded into tuples while iterating over the table, so
+# checking a table with `resolves_all()` holds a single case at a time.
+#
+# Files
+# ~~~~~
+# A table can be saved to a binary file, and loaded again by mapping that
+# file into memory, so that its arrays and buffers are paged in by the OS
+# instead of being read into the heap. A file starts with a magic number and
+# the size of a JSON header, which lists the dotted paths of the views, the
+# interned keys, and the byte order of the arrays. The arrays and buffers
+# follow, each aligned to 8 bytes.
+#
+# A class-based view is saved by the dotted path of its class, since the
+# function returned by `as_view()` can't be imported, so a loaded table
+# expects the class instead. Views that can't be imported again, such as
+# partials, bound methods, and nested functions, can't be saved.
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from .batch import UrlCase
+from .exceptions import InvalidArgumentType
+
+# magic number and version of the file format
+_MAGIC = b"DTUCASE1"
+
+# (name, type code) of every array in a file, in order
+_ARRAYS = (
+    ("path_offsets", "Q"),
+    ("argument_offsets", "Q"),
+    ("views", "I"),
+    ("keys", "I"),
+    ("arg_counts", "H"),
+)
+
+
+class CaseTable:
+    """ A compact table of (url_path, view, args, kwargs) cases.
+
+    A table can be passed to `resolves_all()` like any other iterable of
+    cases. Arguments must be representable as JSON, e.g. str or int.
+    """
+
+    def __init__(self):
+        self._views = []
+        self._view_indices = {}
+        self._keys = []
+        self._key_indices = {}
+        self._arrays = {name: array(code) for name, code in _ARRAYS}
+        self._arrays["path_offsets"].append(0)
+        self._arrays["argument_offsets"].append(0)
+        self._paths = bytearray()
+        self._arguments = bytearray()
+        self._mmap = None
+        self._buffer = None
+
+    @classmethod
+    def from_cases(cls, cases):
+        """ Creates a table containing the given cases.
+
+        :param cases: (url_path, view, args, kwargs)
+        :type cases: collections.abc.Iterable[tuple]
+        :rtype: CaseTable
+        :return: the new table
+        """
+        table = cls()
+        for case in cases:
+            table.append(*case)
+        return table
+
+    def append(self, url_path, view, args, kwargs):
+        """ Adds a case to the end of the table.
+
+        :param str url_path: path of URL
+        :param function|type view: expected view, or its class
+        :param tuple|list args: expected positional arguments
+        :param dict kwargs: expected keyword arguments
+        :rtype: NoneType
+        :return: N/A
+        :raises InvalidArgumentType:
+            passed argument with an unexpected type, or the table was loaded
+            from a file
+        """
+        if self._mmap is not None:
+            raise InvalidArgumentType("a table loaded from a file is fixed")
+        if not isinstance(url_path, str):
+            raise InvalidArgumentType("url_path must be a str")
+        try:
+            encoded = json.dumps(
+                [*args, *kwargs.values()], separators=(",", ":"))
+        except TypeError as e:
+            raise InvalidArgumentType(
+                f"arguments must be representable as JSON: {e}") from e
+
+        self._paths += url_path.encode()
+        self._arguments += encoded.encode()
+        self._arrays["path_offsets"].append(len(self._paths))
+        self._arrays["argument_offsets"].append(len(self._arguments))
+        self._arrays["views"].append(
+            _intern(self._views, self._view_indices, view))
+        self._arrays["keys"].append(
+            _intern(self._keys, self._key_indices, tuple(kwargs)))
+        self._arrays["arg_counts"].append(len(args))
+
+    def __len__(self):
+        return len(self._arrays["views"])
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("case index out of range")
+        arrays = self._arrays
+        path = self._paths[
+            arrays["path_offsets"][index]:arrays["path_offsets"][index + 1]]
+        values = json.loads(bytes(self._arguments[
+            arrays["argument_offsets"][index]:
+            arrays["argument_offsets"][index + 1]]))
+        count = arrays["arg_counts"][index]
+        return UrlCase(
+            str(path, "utf-8"),
+            self._views[arrays["views"][index]],
+            tuple(values[:count]),
+            dict(zip(self._keys[arrays["keys"][index]], values[count:])),
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def save(self, path):
+        """ Saves the table to a binary file.
+
+        Views are saved by their dotted path, so they must be importable.
+        Class-based views are saved by the dotted path of their class.
+
+        :param str path: path of file
+        :rtype: NoneType
+        :return: N/A
+        :raises InvalidArgumentType:
+            a view can't be imported by its dotted path
+        """
+        header = json.dumps({
+            "byteorder": sys.byteorder,
+            "count": len(self),
+            "views": [_dotted_path(view) for view in self._views],
+            "keys": self._keys,
+            "paths": len(self._paths),
+            "arguments": len(self._arguments),
+        }).encode()
+        with open(path, "wb") as f:
+            f.write(_MAGIC + struct.pack("<Q", len(header)) + header)
+            for name, _ in _ARRAYS:
+                _align(f)
+                self._arrays[name].tofile(f)
+            f.write(self._paths)
+            f.write(self._arguments)
+
+    @classmethod
+    def load(cls, path):
+        """ Loads a table from a binary file, by mapping it into memory.
+
+        A loaded table is read-only, and keeps the file open until it's
+        closed.
+
+        :param str path: path of file
+        :rtype: CaseTable
+        :return: the loaded table
+        :raises ValueError:
+            the file isn't a table, or was saved with another byte order
+        :raises ImportError:
+            a view couldn't be imported
+        """
+        from django.utils.module_loading import import_string
+
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(mapped)
+        if bytes(buffer[:len(_MAGIC)]) != _MAGIC:
+            buffer.release()
+            mapped.close()
+            raise ValueError(f"{path} isn't a file containing a case table")
+        size, = struct.unpack_from("<Q", buffer, len(_MAGIC))
+        position = len(_MAGIC) + 8
+        header = json.loads(bytes(buffer[position:position + size]))
+        position += size
+        if header["byteorder"] != sys.byteorder:
+            buffer.release()
+            mapped.close()
+            raise ValueError(f"{path} was saved with another byte order")
+
+        table = cls()
+        table._mmap = mapped
+        table._buffer = buffer
+        table._views = [import_string(view) for view in header["views"]]
+        table._keys = [tuple(keys) for keys in header["keys"]]
+        for name, code in _ARRAYS:
+            position += -position % 8
+            count = header["count"] + (name.endswith("offsets"))
+            end = position + count * array(code).itemsize
+            table._arrays[name] = buffer[position:end].cast(code)
+            position = end
+        end = position + header["paths"]
+        table._paths = buffer[position:end]
+        table._arguments = buffer[end:end + header["arguments"]]
+        return table
+
+    def close(self):
+        """ Closes the file that a table was loaded from, after which the
+            table can't be used anymore.
+
+        :rtype: NoneType
+        :return: N/A
+        """
+        if self._mmap is None:
+            return
+        for view in (*self._arrays.values(), self._paths, self._arguments,
+                     self._buffer):
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _intern(values, indices, value):
+    """ Looks up the index of a value, adding the value if it's new.
+
+    :param list values: interned values
+    :param dict indices: index of every interned value
+    :param value: value being interned
+    :rtype: int
+    :return: index of the value
+    """
+    index = indices.get(value)
+    if index is None:
+        index = indices[value] = len(values)
+        values.append(value)
+    return index
+
+
+def _dotted_path(view):
+    """ Determines the dotted path that a view, or the class of a class-based
+        view, can be imported from.
+
+    :param function|type view: view, or its class
+    :rtype: str
+    :return: dotted path of the view, or of its class
+    :raises InvalidArgumentType:
+        the view can't be imported by its dotted path
+    """
+    from django.utils.module_loading import import_string
+
+    view = getattr(view, "view_class", view)
+    try:
+        path = f"{view.__module__}.{view.__qualname__}"
+        imported = import_string(path)
+    except (AttributeError, ImportError):
+        imported = None
+    if imported is not view:
+        raise InvalidArgumentType(
+            f"view {view!r} can't be imported by its dotted path")
+    return path
+
+
+def _align(f):
+    """ Pads a file with zeros, up to the next multiple of 8 bytes.
+
+    :param f: file opened for writing bytes
+    :rtype: NoneType
+    :return: N/A
+    """
+    f.write(bytes(-f.tell() % 8))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+""" Contains functionality to walk the URL patterns of a URLconf.
+
+:copyright: (c) 2022 by Alan Verresen
+:license: MIT, see LICENSE for more details.
+"""
+
+from collections import namedtuple
+
+from django.urls import URLResolver
+from django.urls import get_resolver
+
+from .resolves_to import _unwrap_view
+
+
+class Route(namedtuple("Route", ("resolvers", "pattern"))):
+    """ A URL pattern together with the resolvers that lead up to it.
+
+    The first resolver is always the root resolver of the URLconf, so every
+    route can be used to reconstruct a complete URL path.
+    """
+    __slots__ = ()
+
+    @property
+    def levels(self):
+        """ All resolvers and the URL pattern itself, from outer to inner.
+        """
+        return self.resolvers + (self.pattern,)
+
+    @property
+    def route(self):
+        """ The route as reported by Django's `ResolverMatch.route`.
+        """
+        route = ""
+        for level in self.levels[1:]:
+            part = str(level.pattern)
+            if route and part.startswith("^"):
+                part = part[1:]
+            route += part
+        return route
+
+    @property
+    def view_name(self):
+        """ The namespaced name of the route, or None if it has no name.
+        """
+        if not self.pattern.name:
+            return None
+        namespaces = [r.namespace for r in self.resolvers if r.namespace]
+        return ":".join(namespaces + [self.pattern.name])
+
+
+def iter_routes(urlconf=None):
+    """ Iterates over every route of a URLconf in resolution order.
+
+    :param str urlconf: dotted path of URLconf, or None for ROOT_URLCONF
+    :rtype: collections.abc.Iterator[Route]
+    :return: every route, depth-first and in the order Django tries them
+    """
+    root = get_resolver(urlconf)
+    return _iter_routes((root,))
+
+
+def _iter_routes(resolvers):
+    """ Iterates over the routes below the innermost of the given resolvers.
+
+    :param tuple resolvers: chain of resolvers, starting with the root
+    :rtype: collections.abc.Iterator[Route]
+    :return: every route below the innermost resolver
+    """
+    for pattern in resolvers[-1].url_patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _iter_routes(resolvers + (pattern,))
+        else:
+            yield Route(resolvers, pattern)
+
+
+def view_path(view):
+    """ Determines the dotted path of a (decorated) view, or of its class.
+
+    :param view: view of a route
+    :rtype: str
+    :return: dotted path of the view
+    """
+    view, _ = _unwrap_view(view)
+    name = getattr(view, "__qualname__", type(view).__qualname__)
+    return f"{view.__module__}.{name}"
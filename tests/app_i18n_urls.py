@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from django.conf.urls.i18n import i18n_patterns
+from django.urls import path
+from django.utils.translation import gettext_lazy as _
+
+from tests import app_views as views
+
+
+# - used to test URL patterns whose paths depend on the active language
+
+urlpatterns = i18n_patterns(
+
+    # an example of a translated segment
+    path(
+        route=_("articles/"),
+        view=views.articles,
+        name="articles",
+    ),
+
+    # an example of a translated segment with converters
+    path(
+        route=_("archive/<int:year>/<int:month>/"),
+        view=views.monthly_archive,
+        name="monthly",
+    ),
+
+)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from django.urls import include
+from django.urls import path
+from django.urls import re_path
+from django.urls import register_converter
+
+from tests import app_views as views
+
+
+class EvenConverter:
+    regex = "[0-9]+"
+
+    def to_python(self, value):
+        if int(value) % 2:
+            raise ValueError("not an even number")
+        return int(value)
+
+    def to_url(self, value):
+        return str(value)
+
+
+register_converter(EvenConverter, "even")
+
+
+# - used to test URL patterns that are nested using `include()`, as well as
+#   namespaces and custom converters
+
+archive_patterns = [
+
+    # an example of a named URL with a converter in both levels
+    path(
+        route="<int:month>/",
+        view=views.monthly_archive,
+        name="monthly",
+    ),
+
+    # an example of a custom converter rejecting some values
+    path(
+        route="<even:month>/even/",
+        view=views.monthly_archive,
+        name="even",
+    ),
+
+    # an example of a URL pattern for which no URL can be generated
+    re_path(
+        route=r"^never/[^\s\S]$",
+        view=views.articles,
+    ),
+
+]
+
+legacy_patterns = [
+
+    # an example of unnamed groups in both levels
+    re_path(
+        route=r"^([0-9]{2})/$",
+        view=views.monthly_archive,
+    ),
+
+]
+
+urlpatterns = [
+
+    path(
+        route="archive/<int:year>/",
+        view=include((archive_patterns, "archive")),
+    ),
+
+    re_path(
+        route=r"^legacy/([0-9]{4})/",
+        view=include(legacy_patterns),
+    ),
+
+    path(
+        route="articles/",
+        view=views.articles,
+        name="articles",
+    ),
+
+]
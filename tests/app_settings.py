@@ -5,5 +5,6 @@ from django.urls import include
 from django.urls import path
 
 
+INSTALLED_APPS = ["django_test_urls"]
 ROOT_URLCONF = __name__
 urlpatterns = [path("", include('tests.app_urls'))]
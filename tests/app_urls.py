@@ -65,6 +65,18 @@ urlpatterns = [
         kwargs={"year": "2022"},
     ),
 
+    # an example of a URL with converters
+    path(
+        route="url9/<int:year>/<int:month>/",
+        view=views.monthly_archive,
+    ),
+
+    # an example of an asynchronous view
+    path(
+        route="url10/<slug:slug>/",
+        view=views.async_article,
+    ),
+
     # extra: captures value for year, but then overwrites it
     re_path(
         route=r"^bad1/(?P<year>[0-9]{4})/(?P<month>0[1-9]|1[0-2])/$",
@@ -109,4 +121,16 @@ urlpatterns = [
         view=TemplateView.as_view(template_name="no-such-file.html"),
     ),
 
+    # an example of a class-based view with converters
+    path(
+        route="cbv2/<int:year>/<int:month>/",
+        view=views.MonthlyArchiveView.as_view(),
+    ),
+
+    # extra: class-based view with a handler that doesn't accept the slug
+    path(
+        route="cbv3/<slug:slug>/",
+        view=views.ArticleView.as_view(),
+    ),
+
 ]
@@ -2,6 +2,7 @@
 # -*- coding: UTF-8 -*-
 
 from django.http import HttpResponse
+from django.views import View
 
 
 def articles(request):
@@ -18,3 +19,22 @@ def other_monthly_archive(request, year, month):
 
 def article(request, slug):
     return HttpResponse("<h1>Article</h1>")
+
+
+async def async_article(request, slug):
+    return HttpResponse("<h1>Article</h1>")
+
+
+class MonthlyArchiveView(View):
+
+    def get(self, request, year, month):
+        return HttpResponse("<h1>Monthly Archive</h1>")
+
+
+class ArticleView(View):
+
+    def get(self, request, slug):
+        return HttpResponse("<h1>Article</h1>")
+
+    def post(self, request):
+        return HttpResponse("<h1>Article</h1>")
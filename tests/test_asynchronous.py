@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the functions `aresolves_to()`, `aresolves_to_404()`,
+# `aresolves_all()` and `aresolves_all_404()`.
+
+# Test Design
+# -----------
+# These functions run their synchronous variants in a thread pool, which
+# have been tested individually. So, these tests only verify that results
+# and exceptions are passed on, and that the results of chunks are merged.
+#
+# The coroutines are run using `asyncio.run()`, so that no plugin is needed.
+# The active language and URLconf are context variables, which are verified
+# to be passed on to the thread pool.
+
+import asyncio
+
+import pytest
+from django.urls import set_urlconf
+from django.utils import translation
+
+from django_test_urls.asynchronous import aresolves_all
+from django_test_urls.asynchronous import aresolves_all_404
+from django_test_urls.asynchronous import aresolves_to
+from django_test_urls.asynchronous import aresolves_to_404
+from django_test_urls.exceptions import ArgumentParameterMismatch
+from tests import app_views as views
+
+
+def test__aresolves_to():
+    """ Returns the same result as `resolves_to()`.
+    """
+    assert asyncio.run(aresolves_to(
+        "/url10/hello/", views.async_article, (), {"slug": "hello"}))
+    assert not asyncio.run(aresolves_to(
+        "/url1/", views.monthly_archive, (), {"year": "1", "month": "2"}))
+    report = asyncio.run(aresolves_to(
+        "/url1/", views.articles, (), {}, report=True))
+    assert report.found_view is views.articles
+
+
+def test__aresolves_to__context(settings):
+    """ Resolves URLs with the caller's active language and URLconf.
+    """
+    settings.LANGUAGES = [("en", "English"), ("nl", "Dutch")]
+
+    async def check():
+        with translation.override("nl"):
+            return await aresolves_to("/nl/articles/", views.articles, (), {})
+
+    set_urlconf("tests.app_i18n_urls")
+    try:
+        assert asyncio.run(check())
+    finally:
+        set_urlconf(None)
+
+
+def test__aresolves_to__mismatch():
+    """ Raises the same exceptions as `resolves_to()`.
+    """
+    with pytest.raises(ArgumentParameterMismatch):
+        asyncio.run(aresolves_to(
+            "/bad4/2022/", views.monthly_archive, (), {"year": "2022"}))
+
+
+def test__aresolves_to_404():
+    """ Returns the same result as `resolves_to_404()`.
+    """
+    assert asyncio.run(aresolves_to_404("/not/a/url"))
+    assert not asyncio.run(aresolves_to_404("/url1/"))
+
+
+def test__aresolves_all():
+    """ Merges the results of every chunk, in order.
+    """
+    cases = [
+        ("/url1/", views.articles, (), {}),
+        ("/url1/", views.article, (), {"slug": "x"}),
+        ("/url10/x/", views.async_article, (), {"slug": "x"}),
+        ("/bad3/2022/", views.monthly_archive, ("2022",), {}),
+        ("/url1/", views.articles, (), {}),
+    ]
+    result = asyncio.run(aresolves_all(iter(cases), chunk_size=2))
+    assert result.total == 5
+    assert [failure.case for failure in result.failures] == [
+        cases[1], cases[3]]
+
+
+def test__aresolves_all_404():
+    """ Merges the results of every chunk, in order.
+    """
+    result = asyncio.run(aresolves_all_404(
+        ["/not/a/url", "/url1/", "/url10/x/"], chunk_size=1))
+    assert result.total == 3
+    assert result.failures == [
+        ("/url1/", None, None), ("/url10/x/", None, None)]
+
+
+def test__aresolves_all_404__append_slash():
+    """ Merges the redirects of every chunk, in order.
+    """
+    result = asyncio.run(aresolves_all_404(
+        ["/url1", "/not/a/url", "/url10/x"], chunk_size=1,
+        append_slash=True))
+    assert result.redirects == [("/url1", "/url1/"), ("/url10/x", "/url10/x/")]
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the functions `resolves_all()` and `resolves_all_404()`.
+
+# Test Design
+# -----------
+# Both functions check cases like `resolves_to()` and `resolves_to_404()` do,
+# which have been tested individually, so these tests only verify that every
+# case is checked, that the failures and redirects are collected, and that
+# the results of paths with an appended slash are cached.
+
+from importlib import import_module
+
+import pytest
+from django.urls import resolve
+
+from django_test_urls.batch import resolves_all
+from django_test_urls.batch import resolves_all_404
+from django_test_urls.exceptions import ArgumentParameterMismatch
+from django_test_urls.exceptions import InvalidArgumentType
+from tests import app_views as views
+
+
+# the submodule is shadowed by the function `resolves_to()` in the package
+module = import_module("django_test_urls.resolves_to")
+
+
+def test__resolves_all__no_failures():
+    """ Result is truthy when every URL is resolved as expected.
+    """
+    result = resolves_all([
+        ("/url1/", views.articles, (), {}),
+        ("/url3/2022/11/", views.monthly_archive, ("2022", "11"), {}),
+    ])
+    assert result
+    assert result.total == 2
+
+
+def test__resolves_all__failures():
+    """ Collects every case that isn't resolved as expected.
+    """
+    wrong_view = ("/url1/", views.article, (), {"slug": "x"})
+    mismatch = ("/bad3/2022/", views.monthly_archive, ("2022",), {})
+    result = resolves_all([
+        wrong_view,
+        ("/url1/", views.articles, (), {}),
+        mismatch,
+    ])
+    assert not result
+    assert result.total == 3
+    assert result.failures[0][:2] == (wrong_view, None)
+    assert result.failures[0].report.found_view is views.articles
+    assert result.failures[1].case == mismatch
+    assert isinstance(result.failures[1].error, ArgumentParameterMismatch)
+    assert result.failures[1].report is None
+
+
+def test__resolves_all_404():
+    """ Collects every URL that can be mapped to a view.
+    """
+    result = resolves_all_404(["/not/a/url", "/url1/"])
+    assert not result
+    assert result.total == 2
+    assert result.failures == [("/url1/", None, None)]
+
+
+def test__resolves_all__append_slash(monkeypatch):
+    """ Reports the URLs that are redirected to a URL with a trailing slash,
+        and resolves each of those URLs only once.
+    """
+    resolved = []
+
+    def resolve_url(url_path):
+        resolved.append(url_path)
+        return resolve(url_path)
+
+    monkeypatch.setattr(module, "resolve_url", resolve_url)
+    result = resolves_all([
+        ("/url1", views.articles, (), {}),
+        ("/url1", views.articles, (), {}),
+        ("/url1/", views.articles, (), {}),
+        ("/not/a/url", views.articles, (), {}),
+    ], append_slash=True)
+    assert result.total == 4
+    assert [failure.case[0] for failure in result.failures] == ["/not/a/url"]
+    assert result.redirects == [("/url1", "/url1/"), ("/url1", "/url1/")]
+    assert resolved == [
+        "/url1", "/url1/", "/url1", "/url1/", "/not/a/url", "/not/a/url/"]
+
+
+def test__resolves_all_404__append_slash():
+    """ Collects every URL that can be mapped to a view, if necessary after
+        being redirected to a URL with a trailing slash.
+    """
+    result = resolves_all_404(["/not/a/url", "/url1"], append_slash=True)
+    assert result.failures == [("/url1", None, None)]
+    assert result.redirects == [("/url1", "/url1/")]
+    with pytest.raises(InvalidArgumentType):
+        resolves_all_404([None])
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the system check `check_url_mismatches()`, and the
+# function `find_mismatches()`.
+
+# Test Design
+# -----------
+# The URL patterns of the test app include one route for every kind of
+# mismatch, so the tests verify that exactly these routes are reported, and
+# with the expected IDs. Caching is verified by making sure that views aren't
+# checked again when the URLconf hasn't changed.
+
+import subprocess
+import sys
+
+import pytest
+from django.core.checks import run_checks
+from django.urls import path
+
+from django_test_urls import checks
+from django_test_urls.checks import check_url_mismatches
+from django_test_urls.checks import find_mismatches
+from django_test_urls.urlconf import iter_routes
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(monkeypatch):
+    monkeypatch.setattr(checks, "_cache", {})
+
+
+def test__find_mismatches():
+    """ Finds every route whose view doesn't accept the captured arguments.
+    """
+    mismatches = find_mismatches()
+    assert [route.route.split("/")[0] for route, _ in mismatches] == [
+        "^url7", "^url8", "^bad2", "^bad3", "^bad4", "^bad5", "^bad6",
+        "cbv3",
+    ]
+
+
+def test__find_mismatches__nested_url_patterns():
+    """ Combines the arguments captured by nested URL patterns.
+    """
+    mismatches = find_mismatches("tests.app_nested_urls")
+    assert [route.route for route, _ in mismatches] == [
+        "archive/<int:year>/never/[^\\s\\S]$"]
+
+
+def test__check_url_mismatches():
+    """ Reports an error for every mismatch, with an ID for each kind.
+    """
+    errors = check_url_mismatches()
+    assert [error.id[-4:] for error in errors] == [
+        "E004", "E003", "E004", "E001", "E001", "E002", "E003", "E003"]
+    assert errors[0].msg == (
+        "View tests.app_views.monthly_archive doesn't accept the arguments "
+        "captured by route '^url7/two-zero-two-two/(0[1-9]|1[0-2])/': "
+        "multiple values for argument 'year'.")
+    assert "View tests.app_views.ArticleView doesn't" in errors[-1].msg
+
+
+def test__check_url_mismatches__registered():
+    """ The check is run by Django, as the package is an installed app.
+    """
+    errors = run_checks(tags=["urls"])
+    assert len([e for e in errors if e.id.startswith("django_test_urls")]) \
+        == 8
+
+
+def test__check_url_mismatches__not_installed():
+    """ Importing this package's modules doesn't register the check, when
+        the package isn't an installed app.
+    """
+    process = subprocess.run([sys.executable, "-c", (
+        "from django.conf import settings\n"
+        "settings.configure(ROOT_URLCONF='tests.app_urls')\n"
+        "import django\n"
+        "django.setup()\n"
+        "import django_test_urls.checks, django_test_urls.cli\n"
+        "import django_test_urls.smoke\n"
+        "from django.core.checks import run_checks\n"
+        "print([e.id for e in run_checks(tags=['urls'])])\n"
+    )], stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    assert "django_test_urls" not in process.stdout
+
+
+def test__check_url_mismatches__cached(monkeypatch):
+    """ Doesn't check views again when the URLconf hasn't changed.
+    """
+    expected = check_url_mismatches()
+    monkeypatch.setattr(checks, "check_for_mismatches", None)
+    assert check_url_mismatches() == expected
+
+
+def test__check_url_mismatches__cached_in_file(monkeypatch, settings,
+                                               tmp_path):
+    """ Doesn't check views again in another process when the URLconf hasn't
+        changed, by caching mismatches in a file.
+    """
+    settings.DJANGO_TEST_URLS_CHECK_CACHE = str(tmp_path / "cache.json")
+    expected = check_url_mismatches()
+    monkeypatch.setattr(checks, "_cache", {})
+    monkeypatch.setattr(checks, "check_for_mismatches", None)
+    assert check_url_mismatches() == expected
+
+
+def test__check_url_mismatches__stale_file(settings, tmp_path):
+    """ Ignores a cache file that is invalid or for another URLconf.
+    """
+    path = tmp_path / "cache.json"
+    settings.DJANGO_TEST_URLS_CHECK_CACHE = str(path)
+    path.write_text('{"fingerprint": "stale", "mismatches": []}')
+    assert len(check_url_mismatches()) == 8
+    checks._cache.clear()
+    path.write_text('not json')
+    assert len(check_url_mismatches()) == 8
+
+
+def test__fingerprint__view_without_module_file():
+    """ Computes a fingerprint for views defined in modules without a file.
+    """
+    class urlconf:
+        urlpatterns = [path("", len)]
+
+    assert len(checks._fingerprint(list(iter_routes(urlconf)))) == 64
+
+
+def test__check_id():
+    """ Uses a generic ID for unknown kinds of mismatches.
+    """
+    assert checks._check_id("something else") == "django_test_urls.E000"
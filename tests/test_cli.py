@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the command-line interface, `main()`.
+
+# Test Design
+# -----------
+# The command-line interface is run in-process, using the settings of the
+# test app, and optionally with a pool of worker processes. Each test
+# verifies the streamed results, and the exit code.
+
+import importlib
+import json
+import subprocess
+import sys
+
+import pytest
+
+from django_test_urls import cli
+from django_test_urls.cli import main
+
+
+def run(capsys, tmp_path, lines, *options):
+    path = tmp_path / "cases.jsonl"
+    path.write_text("\n".join(lines) + "\n")
+    code = main([*options, str(path)])
+    out, err = capsys.readouterr()
+    return code, [json.loads(line) for line in out.splitlines()], err
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test__main__passed(capsys, tmp_path, monkeypatch, jobs):
+    """ Exits with 0 when every case passed, and reports a summary, whether
+        the cases are verified in this process or by a pool of processes.
+    """
+    monkeypatch.setattr(cli, "CHUNK_SIZE", 1)
+    code, results, err = run(capsys, tmp_path, [
+        '{"url_path": "/url1/", "view": "tests.app_views.articles"}',
+        '{"url_path": "/url9/2022/11/", '
+        '"view": "tests.app_views.monthly_archive", '
+        '"kwargs": {"year": 2022, "month": 11}}',
+        '',
+        '{"url_path": "/cbv2/2022/11/", '
+        '"view": "tests.app_views.MonthlyArchiveView", '
+        '"kwargs": {"year": 2022, "month": 11}}',
+        '{"url_path": "/not/a/url"}',
+    ], "--settings", "app_settings", "--jobs", jobs)
+    assert code == 0
+    assert [(r["line"], r["ok"]) for r in results] == [
+        (1, True), (2, True), (4, True), (5, True)]
+    assert "4 cases, 0 failed in" in err
+
+
+def test__main__failed(capsys, tmp_path):
+    """ Exits with 1 when a case failed, or couldn't be verified.
+    """
+    code, results, err = run(capsys, tmp_path, [
+        '{"url_path": "/url1/"}',
+        '{"url_path": "/url1/", "view": "tests.app_views.nope"}',
+        '{"url_path": "/bad4/2022/", '
+        '"view": "tests.app_views.monthly_archive", '
+        '"kwargs": {"year": "2022"}}',
+        'not json',
+        '{"url_path": "/url9/2022/11/", '
+        '"view": "tests.app_views.monthly_archive", '
+        '"kwargs": {"year": "2022", "month": "11"}}',
+        '{"url_path": "/not/a/url", "view": "tests.app_views.articles"}',
+    ])
+    assert code == 1
+    assert [r["ok"] for r in results] == [False] * 6
+    assert results[0]["error"] is None
+    assert results[1]["error"].startswith("ImportError")
+    assert results[2]["error"].startswith("ArgumentParameterMismatch")
+    assert results[3]["error"].startswith("JSONDecodeError")
+    assert results[3]["url_path"] is None
+    assert results[4]["found"] == {
+        "view": "tests.app_views.monthly_archive",
+        "args": [],
+        "kwargs": {"year": 2022, "month": 11},
+        "route": "url9/<int:year>/<int:month>/",
+        "url_name": None,
+    }
+    assert results[5]["found"] is None
+    assert "6 cases, 6 failed in" in err
+
+
+def test__main__invalid_jobs(capsys, tmp_path):
+    """ Exits with 2 when the number of jobs isn't positive.
+    """
+    with pytest.raises(SystemExit) as e:
+        main(["--jobs", "0", str(tmp_path / "cases.jsonl")])
+    assert e.value.code == 2
+
+
+def test__entry_point():
+    """ Can be run using `python -m django_test_urls`.
+    """
+    importlib.import_module("django_test_urls.__main__")
+    process = subprocess.run(
+        [sys.executable, "-m", "django_test_urls", "--help"],
+        stdout=subprocess.PIPE, universal_newlines=True)
+    assert process.returncode == 0
+    assert process.stdout.startswith("usage: python -m django_test_urls")
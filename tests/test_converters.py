@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the function `benchmark_converters()`.
+
+# Test Design
+# -----------
+# Timings depend on the machine running the tests, so only their presence
+# is verified. Round trips and value types are verified using converters
+# that are broken on purpose, and that are only used by a URLconf defined
+# in this module.
+
+from django.urls import path
+from django.urls import register_converter
+
+from django_test_urls.converters import benchmark_converters
+from django_test_urls.converters import find_converters
+
+
+class UnpaddedYearConverter:
+    regex = "[0-9]{4}"
+
+    def to_python(self, value):
+        return int(value)
+
+    def to_url(self, value):
+        return str(value)
+
+
+class MixedConverter:
+    regex = "[0-9]+|[a-z]+"
+
+    def to_python(self, value):
+        return int(value) if value.isdigit() else value
+
+    def to_url(self, value):
+        return str(value)[:1]
+
+
+class LossyConverter:
+    regex = "[0-9]+"
+
+    def to_python(self, value):
+        if value == "22":
+            raise ValueError("reserved number")
+        return int(value)
+
+    def to_url(self, value):
+        if value == 0:
+            raise ValueError("zero")
+        return str(value * 2)
+
+
+register_converter(UnpaddedYearConverter, "unpadded-year")
+register_converter(MixedConverter, "mixed")
+register_converter(LossyConverter, "lossy")
+
+
+class urlconf:
+    urlpatterns = [
+        path("<unpadded-year:year>/", len),
+        path("<mixed:value>/", len),
+        path("lossy/<lossy:value>/", len),
+    ]
+
+
+def test__find_converters():
+    """ Finds every converter and the routes that use it, including those of
+        nested URL patterns and custom converters.
+    """
+    found = find_converters("tests.app_nested_urls")
+    assert {name: routes for (name, _), routes in found.items()} == {
+        "int": [
+            "archive/<int:year>/<int:month>/",
+            "archive/<int:year>/<even:month>/even/",
+            "archive/<int:year>/never/[^\\s\\S]$",
+        ],
+        "even": ["archive/<int:year>/<even:month>/even/"],
+    }
+
+
+def test__benchmark_converters():
+    """ Reports timings for each converter, without failed round trips.
+    """
+    reports = benchmark_converters(number=10)
+    assert sorted(report.name for report in reports) == [
+        "int", "slug", "str"]
+    for report in reports:
+        assert report.inputs
+        assert report.to_python_seconds > 0
+        assert report.to_url_seconds > 0
+        assert report.round_trip_failures == []
+        assert len(report.value_types) == 1
+    costs = [r.to_python_seconds + r.to_url_seconds for r in reports]
+    assert costs == sorted(costs, reverse=True)
+
+
+def test__benchmark_converters__rejected_inputs():
+    """ Skips inputs that are rejected by a converter.
+    """
+    reports = benchmark_converters("tests.app_nested_urls", number=10)
+    even, = [report for report in reports if report.name == "even"]
+    assert even.inputs == ["0"]
+    assert even.value_types == ["int"]
+
+
+def test__benchmark_converters__round_trip_failures():
+    """ Reports values that don't survive a round trip through a converter,
+        and converters returning values of different types.
+    """
+    reports = benchmark_converters(urlconf, number=1)
+    year, = [report for report in reports if report.name == "unpadded-year"]
+    assert year.inputs == ["0000", "1111"]
+    assert year.round_trip_failures == [
+        ("0000", "to_url() returned '0', which isn't matched by the regex")]
+    mixed, = [report for report in reports if report.name == "mixed"]
+    assert mixed.value_types == ["int", "str"]
+    assert mixed.round_trip_failures == [
+        ("bb", "'bb' became 'b' after a round trip")]
+    lossy, = [report for report in reports if report.name == "lossy"]
+    assert lossy.round_trip_failures == [
+        ("0", "to_url() rejected 0: zero"),
+        ("11", "to_python() rejected '22': reserved number"),
+    ]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the function `compare_route_cost()`.
+
+# Test Design
+# -----------
+# Timing is noisy, so the old and new URLconfs are defined by this module to
+# differ by an order of magnitude: the new URLconf tries a hundred patterns
+# before reaching the same route. The pattern attempts don't depend on the
+# machine, so they're verified exactly.
+
+from django.urls import include
+from django.urls import path
+
+from django_test_urls.cost import compare_route_cost
+from tests import app_views as views
+
+
+class old_urlconf:
+    urlpatterns = [
+        path("articles/<slug:slug>/", views.article),
+        path("archive/<int:year>/<int:month>/", views.monthly_archive),
+    ]
+
+
+class new_urlconf:
+    urlpatterns = [
+        path(f"unused{i}/<int:year>/", views.articles) for i in range(100)
+    ] + [
+        path("", include([
+            path("articles/<slug:slug>/", views.article),
+        ])),
+        path("archive/<int:year>/<int:month>/", views.monthly_archive),
+    ]
+
+
+URL_PATHS = ["/articles/hello/", "/archive/2022/11/", "/not/a/url"]
+
+
+def test__compare_route_cost__slower():
+    """ Returns a falsy comparison when the new URLconf is slower.
+    """
+    result = compare_route_cost(URL_PATHS, old_urlconf, new_urlconf, runs=3)
+    assert not result
+    assert result.old == (old_urlconf, 5 / 3, result.old.seconds)
+    assert result.new == (new_urlconf, 308 / 3, result.new.seconds)
+    assert result.slowdown > result.threshold
+
+
+def test__compare_route_cost__faster():
+    """ Returns a truthy comparison when the new URLconf isn't slower.
+    """
+    result = compare_route_cost(URL_PATHS, new_urlconf, old_urlconf, runs=3)
+    assert result
+    assert result.slowdown < 0
+
+
+def test__compare_route_cost__no_urls():
+    """ Reports no cost and no slowdown without any URLs, and tries no
+        patterns for a path that the root resolver doesn't match.
+    """
+    result = compare_route_cost([], old_urlconf, new_urlconf, runs=1)
+    assert result
+    assert result.old.attempts == result.new.attempts == 0.0
+    result = compare_route_cost(["relative/"], old_urlconf, new_urlconf)
+    assert result.old.attempts == result.new.attempts == 0.0
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the function `find_dead_code()`.
+
+# Test Design
+# -----------
+# The views of the test app are checked against both URLconfs of the test
+# app. Names of routes are searched for in a small source tree that's created
+# for each test, so that the names used by these tests don't count.
+
+from functools import partial
+
+import pytest
+from django.contrib.auth.decorators import login_required
+from django.urls import path
+from django.views.decorators.cache import cache_page
+
+from django_test_urls.dead import find_dead_code
+from tests import app_views as views
+
+
+class decorated_urlconf:
+    urlpatterns = [
+        path("articles/", cache_page(60)(views.articles)),
+        path("articles/<slug:slug>/", login_required(partial(views.article))),
+        path("archive/", login_required(views.MonthlyArchiveView.as_view())),
+        path("article/", partial(views.ArticleView.as_view(), slug="x")),
+    ]
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    files = {
+        "templates/archive.html":
+            "{% url 'archive:monthly' year=2022 month=11 %}",
+        "app/views.py":
+            'reverse("articles")\npath("", view, name = "archive:even")\n',
+        "app/notes.md": "'archive:even'",
+        ".hidden/views.py": "'archive:even'",
+    }
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+def test__find_dead_code__orphaned_views():
+    """ Finds the views and view classes that no route maps URLs to.
+    """
+    report = find_dead_code([views])
+    assert report.orphaned_views == [views.other_monthly_archive]
+    assert report.unused_routes == []
+
+
+def test__find_dead_code__nested_url_patterns():
+    """ Finds the views that aren't reached by nested URL patterns.
+    """
+    report = find_dead_code(["tests.app_views"], [], "tests.app_nested_urls")
+    assert report.orphaned_views == [
+        views.ArticleView, views.MonthlyArchiveView, views.article,
+        views.async_article, views.other_monthly_archive]
+
+
+def test__find_dead_code__decorated_views():
+    """ Finds the views that aren't reached, when routes map URLs to views
+        that are decorated or built using `partial()`.
+    """
+    report = find_dead_code([views], [], decorated_urlconf)
+    assert report.orphaned_views == [
+        views.async_article, views.monthly_archive,
+        views.other_monthly_archive]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test__find_dead_code__unused_routes(source_tree, jobs):
+    """ Finds the named routes whose name isn't used as a string literal in
+        the source files, skipping hidden directories and other files.
+    """
+    report = find_dead_code(
+        source_paths=[str(source_tree)], urlconf="tests.app_nested_urls",
+        jobs=jobs)
+    assert [route.view_name for route in report.unused_routes] == [
+        "archive:even"]
+
+
+def test__find_dead_code__source_files(source_tree):
+    """ Searches the given files, and reports every named route if none of
+        their names are used.
+    """
+    report = find_dead_code(
+        source_paths=[str(source_tree / "app" / "notes.md")],
+        urlconf="tests.app_nested_urls")
+    assert [route.view_name for route in report.unused_routes] == [
+        "archive:monthly", "articles"]
+    report = find_dead_code(urlconf="tests.app_nested_urls")
+    assert len(report.unused_routes) == 3
+
+
+def test__find_dead_code__not_views():
+    """ Ignores classes and functions that aren't views.
+    """
+    report = find_dead_code(["tests.app_nested_urls", "tests.test_dead"])
+    assert report.orphaned_views == []
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the hooks that instrument the resolution of URLs.
+
+# Test Design
+# -----------
+# A hook recording every event is registered while checking URLs with each
+# of the helpers, to verify which events are triggered, and in which order.
+# The exporters are tested by the events they count and send, with a local
+# UDP socket standing in for a StatsD daemon.
+
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from django_test_urls.batch import resolves_all_404
+from django_test_urls.hooks import ResolveHistogram
+from django_test_urls.hooks import ResolveHooks
+from django_test_urls.hooks import StatsdHooks
+from django_test_urls.hooks import _registered
+from django_test_urls.hooks import register_hooks
+from django_test_urls.hooks import unregister_hooks
+from django_test_urls.resolves_to import resolves_to
+from django_test_urls.resolves_to import resolves_to_404
+from django_test_urls.resolves_to import resolves_to_arguments
+from django_test_urls.resolves_to import resolves_to_view
+from tests import app_views as views
+
+
+class RecordingHooks(ResolveHooks):
+
+    def __init__(self):
+        self.events = []
+
+    def pre_resolve(self, url_path):
+        self.events.append(("pre_resolve", url_path))
+
+    def post_resolve(self, url_path, found, seconds):
+        assert seconds >= 0
+        self.events.append(("post_resolve", url_path, found is not None))
+
+    def not_found(self, url_path, seconds):
+        self.events.append(("not_found", url_path))
+
+    def mismatch(self, url_path, found):
+        self.events.append(("mismatch", url_path))
+
+
+@pytest.fixture
+def hooks():
+    hooks = register_hooks(RecordingHooks())
+    yield hooks
+    unregister_hooks(hooks)
+    assert not _registered
+
+
+def test__hooks__resolves_to(hooks):
+    """ Triggers events around resolution, and for a mismatch.
+    """
+    assert resolves_to("/url1/", views.articles, (), {})
+    assert not resolves_to("/url1/", views.article, (), {"slug": "x"})
+    assert hooks.events == [
+        ("pre_resolve", "/url1/"),
+        ("post_resolve", "/url1/", True),
+        ("pre_resolve", "/url1/"),
+        ("post_resolve", "/url1/", True),
+        ("mismatch", "/url1/"),
+    ]
+
+
+def test__hooks__resolves_to_view_and_arguments(hooks):
+    """ Triggers events when checking only the view or the arguments.
+    """
+    assert resolves_to_view("/url1/", views.articles)
+    assert not resolves_to_view("/not/a/url", views.articles)
+    assert not resolves_to_arguments("/url1/", ("x",), {})
+    assert hooks.events[2:] == [
+        ("pre_resolve", "/not/a/url"),
+        ("post_resolve", "/not/a/url", False),
+        ("not_found", "/not/a/url"),
+        ("mismatch", "/not/a/url"),
+        ("pre_resolve", "/url1/"),
+        ("post_resolve", "/url1/", True),
+        ("mismatch", "/url1/"),
+    ]
+
+
+def test__hooks__resolves_to_404(hooks):
+    """ Triggers a mismatch for a URL that was expected to result in a 404,
+        including in a batch.
+    """
+    assert resolves_to_404("/not/a/url")
+    assert not resolves_to_404("/url1", append_slash=True)
+    assert not resolves_all_404(["/url1/"])
+    assert [event[0] for event in hooks.events] == [
+        "pre_resolve", "post_resolve", "not_found",
+        "pre_resolve", "post_resolve", "not_found",
+        "pre_resolve", "post_resolve", "mismatch",
+        "pre_resolve", "post_resolve", "mismatch",
+    ]
+
+
+def test__hooks__unregistered():
+    """ Triggers nothing once hooks have been unregistered.
+    """
+    hooks = register_hooks(RecordingHooks())
+    unregister_hooks(hooks)
+    unregister_hooks(hooks)
+    assert not resolves_to_view("/not/a/url", views.articles)
+    assert hooks.events == []
+    ResolveHooks().post_resolve("/url1/", None, 0.0)
+
+
+def test__resolve_histogram():
+    """ Counts resolutions per bucket, and counts 404s and mismatches.
+    """
+    histogram = ResolveHistogram(bounds=(1.0, 0.5))
+    assert histogram.mean == 0.0
+    with_hooks = register_hooks(histogram)
+    try:
+        resolves_to_view("/url1/", views.articles)
+        resolves_to_view("/not/a/url", views.articles)
+    finally:
+        unregister_hooks(with_hooks)
+    histogram.post_resolve("/url1/", None, 0.75)
+    histogram.post_resolve("/url1/", None, 2.0)
+    assert histogram.bounds == (0.5, 1.0)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.total == 4
+    assert histogram.not_found_count == 1
+    assert histogram.mismatch_count == 1
+    assert histogram.mean == histogram.seconds / 4
+
+
+def test__resolve_histogram__threads():
+    """ Doesn't lose counts when resolutions are counted by several threads.
+    """
+    histogram = ResolveHistogram()
+
+    def count(_):
+        for _ in range(1000):
+            histogram.post_resolve("/url1/", None, 1e-6)
+            histogram.not_found("/url1/", 1e-6)
+            histogram.mismatch("/url1/", None)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(count, range(4)))
+    assert histogram.total == histogram.counts[0] == 4000
+    assert histogram.not_found_count == histogram.mismatch_count == 4000
+
+
+def test__statsd_hooks():
+    """ Sends a timer for every resolution, and counters for 404s and
+        mismatches.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as daemon:
+        daemon.bind(("127.0.0.1", 0))
+        daemon.settimeout(5)
+        statsd = register_hooks(StatsdHooks(port=daemon.getsockname()[1]))
+        try:
+            resolves_to_view("/not/a/url", views.articles)
+        finally:
+            unregister_hooks(statsd)
+            statsd.close()
+        metrics = [daemon.recv(1024).decode() for _ in range(3)]
+    assert metrics[0].startswith("django_test_urls.resolve:")
+    assert metrics[0].endswith("|ms")
+    assert metrics[1:] == [
+        "django_test_urls.not_found:1|c", "django_test_urls.mismatch:1|c"]
+
+
+def test__statsd_hooks__unreachable():
+    """ Ignores errors while sending metrics.
+    """
+    statsd = StatsdHooks()
+    statsd.close()
+    statsd.mismatch("/url1/", None)
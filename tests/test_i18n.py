@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the function `resolves_all_languages()`.
+
+# Test Design
+# -----------
+# The test app doesn't have translations, so the paths in every language only
+# differ by their language prefix. The tests verify that every case is
+# checked in every language, and that the failures are collected along with
+# the language and the path they were reversed to.
+
+import pytest
+from django.urls import NoReverseMatch
+
+from django_test_urls.i18n import resolves_all_languages
+from tests import app_views as views
+
+
+pytestmark = pytest.mark.urls("tests.app_i18n_urls")
+
+CASES = [
+    ("articles", views.articles, (), {}),
+    ("monthly", views.monthly_archive, (), {"year": 2022, "month": 11}),
+]
+
+
+@pytest.fixture(autouse=True)
+def languages(settings):
+    settings.LANGUAGES = [("en", "English"), ("nl", "Dutch")]
+
+
+def test__resolves_all_languages():
+    """ Result is truthy when every case is resolved as expected in every
+        language of the setting LANGUAGES.
+    """
+    result = resolves_all_languages(CASES)
+    assert result
+    assert result.total == 4
+
+
+def test__resolves_all_languages__failures():
+    """ Collects every case that isn't resolved as expected, or that can't be
+        reversed, for each language.
+    """
+    wrong_view = ("monthly", views.other_monthly_archive, (),
+                  {"year": 2022, "month": 11})
+    unknown = ("no-such-name", views.articles, (), {})
+    result = resolves_all_languages(
+        CASES + [wrong_view, unknown], languages=["nl", "de"])
+    assert not result
+    assert result.total == 8
+    assert [(f.case.language, f.case.url_path) for f in result.failures] == [
+        ("nl", "/nl/archive/2022/11/"), ("nl", None),
+        ("de", "/de/archive/2022/11/"), ("de", None),
+    ]
+    assert result.failures[0].case.case.view is views.other_monthly_archive
+    assert result.failures[0].error is None
+    assert isinstance(result.failures[1].error, NoReverseMatch)
+
+
+def test__resolves_all_languages__invalid_arguments():
+    """ Reports a case that mixes positional and keyword arguments as a
+        failure, instead of aborting the batch.
+    """
+    mixed = ("monthly", views.monthly_archive, (2022,), {"month": 11})
+    result = resolves_all_languages(CASES + [mixed], languages=["en"])
+    assert not result
+    assert result.total == 3
+    assert [f.case.case for f in result.failures] == [mixed]
+    assert isinstance(result.failures[0].error, ValueError)
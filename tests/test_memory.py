@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the functions `measure_memory()` and
+# `within_memory_budget()`.
+
+# Test Design
+# -----------
+# The amount of memory depends on the versions of Python and Django, so only
+# the structure and the consistency of reports are verified. The measurement
+# itself is also run in this process, so that it's covered by the tests.
+
+import json
+
+import pytest
+
+from django_test_urls.exceptions import InvalidArgumentType
+from django_test_urls.memory import _main
+from django_test_urls.memory import measure_memory
+from django_test_urls.memory import within_memory_budget
+
+
+def test__measure_memory():
+    """ Reports memory retained by each cache, for each language.
+    """
+    report = measure_memory("tests.app_nested_urls", ["en", "nl"])
+    assert list(report.by_cache) == [
+        "url_patterns", "regex:en", "reverse_dict:en", "regex:nl",
+        "reverse_dict:nl"]
+    assert report.total == sum(report.by_cache.values())
+    assert report.by_cache["url_patterns"] > 0
+    assert report.by_cache["reverse_dict:nl"] > 0
+
+
+def test__measure_memory__by_subtree():
+    """ Reports memory retained by each top-level URL pattern, the largest
+        one first.
+    """
+    report = measure_memory("tests.app_nested_urls")
+    assert sorted(route for route, _ in report.by_subtree) == [
+        "^legacy/([0-9]{4})/", "archive/<int:year>/", "articles/"]
+    sizes = [size for _, size in report.by_subtree]
+    assert sizes == sorted(sizes, reverse=True)
+    assert sum(sizes) <= report.total
+
+
+def test__measure_memory__invalid_urlconf():
+    """ Raises an exception when the URLconf isn't a dotted path.
+    """
+    with pytest.raises(InvalidArgumentType):
+        measure_memory(object())
+
+
+def test__measure_memory__configured_settings(settings):
+    """ Raises an exception when the settings weren't loaded from a settings
+        module, as a fresh interpreter can't load them.
+    """
+    settings.SETTINGS_MODULE = None
+    with pytest.raises(InvalidArgumentType):
+        measure_memory()
+
+
+def test__measure_memory__in_process(capsys):
+    """ Writes the report of a measurement to stdout.
+    """
+    _main(["tests.app_nested_urls", "en"])
+    report = json.loads(capsys.readouterr().out)
+    assert set(report["by_cache"]) == {
+        "url_patterns", "regex:en", "reverse_dict:en"}
+
+
+def test__within_memory_budget():
+    """ Returns True when the URLconf retains at most the budget.
+    """
+    assert within_memory_budget(10 ** 8)
+    assert not within_memory_budget(0)
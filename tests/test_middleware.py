@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the class `RouteSamplingMiddleware`.
+
+# Test Design
+# -----------
+# The sample rate is set to either 0 or 1, so that whether a request is
+# sampled is deterministic. The flushing thread is tested by waiting until
+# it has flushed a sample, and then stopping it.
+
+import atexit
+import time
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from django_test_urls.middleware import RouteSamplingMiddleware
+from django_test_urls.middleware import load_samples
+
+
+def get_response(request):
+    return HttpResponse(status=404 if request.path == "/not/a/url" else 200)
+
+
+def test__not_sampled(settings):
+    """ Doesn't record any requests if the sample rate is 0.
+    """
+    settings.DJANGO_TEST_URLS_SAMPLING = {"RATE": 0}
+    middleware = RouteSamplingMiddleware(get_response)
+    response = middleware(RequestFactory().get("/url1/"))
+    assert response.status_code == 200
+    assert len(middleware.buffer) == 0
+    assert middleware.flusher is None
+
+
+def test__sampled(settings):
+    """ Records the route and status of every request if the rate is 1.
+    """
+    settings.DJANGO_TEST_URLS_SAMPLING = {"RATE": 1, "BUFFER_SIZE": 2}
+    middleware = RouteSamplingMiddleware(get_response)
+    for url_path in ("/url1/", "/url9/2022/11/", "/not/a/url"):
+        middleware(RequestFactory().get(url_path))
+    samples = list(middleware.buffer)
+    assert [s[1:4] for s in samples] == [
+        ("/url9/2022/11/", "url9/<int:year>/<int:month>/",
+         "tests.app_views.monthly_archive"),
+        ("/not/a/url", None, None),
+    ]
+    assert [s.status_code for s in samples] == [200, 404]
+    assert all(s.seconds > 0 for s in samples)
+
+
+def test__flushed_to_file(settings, tmp_path, monkeypatch):
+    """ Flushes samples to a file periodically, and when stopped, after which
+        it isn't flushed at exit anymore.
+    """
+    unregistered = []
+    unregister = atexit.unregister
+    monkeypatch.setattr(atexit, "unregister", lambda func: (
+        unregistered.append(func), unregister(func)))
+    path = tmp_path / "samples.jsonl"
+    settings.DJANGO_TEST_URLS_SAMPLING = {
+        "RATE": 1, "FILE": str(path), "FLUSH_INTERVAL": 0.01}
+    middleware = RouteSamplingMiddleware(get_response)
+    middleware(RequestFactory().get("/url1/"))
+    deadline = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    middleware(RequestFactory().get("/not/a/url"))
+    middleware.flusher.stop()
+    samples = load_samples(str(path))
+    assert [(s.url_path, s.route) for s in samples] == [
+        ("/url1/", "url1/"),
+        ("/not/a/url", None),
+    ]
+    assert middleware.flusher.flush() == 0
+    assert unregistered == [middleware.flusher.flush]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the public API of the package, `django_test_urls`.
+
+# Test Design
+# -----------
+# Whether importing the package is fast can only be verified in a fresh
+# interpreter, so those tests run a subprocess that reports which modules
+# were imported, and how long importing took.
+
+import subprocess
+import sys
+
+import pytest
+
+import django_test_urls
+
+
+#: maximum number of seconds that importing the package may take
+IMPORT_BUDGET = 0.05
+
+MEASURE_IMPORT = """
+import sys, time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start, "django" in sys.modules)
+"""
+
+
+def measure_import(statement):
+    process = subprocess.run(
+        [sys.executable, "-c", MEASURE_IMPORT.format(statement=statement)],
+        stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    seconds, imported_django = process.stdout.split()
+    return float(seconds), imported_django == "True"
+
+
+@pytest.mark.parametrize("statement", [
+    "import django_test_urls",
+    "from django_test_urls import VERSION",
+    "from django_test_urls.exceptions import ArgumentParameterMismatch",
+    "from django_test_urls.cli import main",
+    "from django_test_urls.hooks import register_hooks",
+])
+def test__import__without_django(statement):
+    """ Importing the package's version, exceptions, command-line interface,
+        or hooks doesn't import Django, and stays within the budget.
+    """
+    seconds, imported_django = measure_import(statement)
+    assert not imported_django
+    assert seconds < IMPORT_BUDGET
+
+
+def test__import__public_api():
+    """ Importing a function of the public API imports Django as needed.
+    """
+    _, imported_django = measure_import(
+        "from django_test_urls import resolves_to")
+    assert imported_django
+
+
+def test__getattr():
+    """ Every name in `__all__` can be accessed, while other names can't.
+    """
+    for name in django_test_urls.__all__:
+        assert callable(getattr(django_test_urls, name))
+    assert set(django_test_urls.__all__) <= set(dir(django_test_urls))
+    with pytest.raises(AttributeError):
+        django_test_urls.no_such_function
+
+
+def test__submodule_does_not_shadow_function():
+    """ The submodule `resolves_to` doesn't replace the function.
+    """
+    import django_test_urls.resolves_to as imported
+    assert django_test_urls.resolves_to is imported
+    assert django_test_urls.resolves_to.__name__ == "resolves_to"
+    django_test_urls.extra = sys
+    assert django_test_urls.extra is sys
+    del django_test_urls.extra
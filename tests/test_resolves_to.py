@@ -5,9 +5,10 @@
 
 # Test Design
 # -----------
-# The function `resolves_to()` makes consecutive calls to the functions
-# `check_for_mismatches()`, `resolves_to_view()`, and `resolves_to_args()`,
-# which have been tested individually.
+# The function `resolves_to()` calls `check_for_mismatches()`, and then
+# checks the view and arguments of a single resolution like the functions
+# `resolves_to_view()` and `resolves_to_args()` do, which have been tested
+# individually.
 #
 # A simple combinatorial set of tests should suffice to provide confidence:
 # - URL is mapped to the correct view (y/n)
@@ -19,6 +20,7 @@
 # - a list can be used instead of a tuple to express keyword arguments
 
 import pytest
+from asgiref.sync import sync_to_async
 
 from django_test_urls.resolves_to import resolves_to
 from django_test_urls.exceptions import ArgumentParameterMismatch
@@ -48,7 +50,7 @@ def test__revolves_to__invalid_argument_type__view():
             None,  # <-- bad type
             (),
             {"year": "2021", "month": "11"})
-    assert "expected_view must be a function" in str(e)
+    assert "expected_view must be a function or class" in str(e)
 
 
 def test__resolves_to__invalid_argument_type__args():
@@ -192,3 +194,100 @@ def test__resolves_to__mismatch_view__mismatch_args__mismatch_sign():
             views.other_monthly_archive,
             (),
             {"year": "2021"})
+
+
+def test__resolves_to__class_based_view():
+    """ Returns True when URL is mapped to a view of the expected class, and
+        the arguments match the parameters of the class's handler methods.
+    """
+    assert resolves_to(
+        "/cbv2/2022/11/",
+        views.MonthlyArchiveView,
+        (),
+        {"year": 2022, "month": 11})
+
+
+def test__resolves_to__async_view():
+    """ Returns True when URL is mapped to an asynchronous view as expected.
+    """
+    assert resolves_to(
+        "/url10/hello/",
+        views.async_article,
+        (),
+        {"slug": "hello"})
+
+
+def test__resolves_to__view_wrapped_as_coroutine_function():
+    """ Accepts a callable object that is marked as a coroutine function, and
+        checks for mismatches using the signature of the wrapped view.
+    """
+    assert not resolves_to(
+        "/url10/hello/",
+        sync_to_async(views.article),
+        (),
+        {"slug": "hello"})
+    with pytest.raises(ArgumentParameterMismatch):
+        resolves_to(
+            "/url10/hello/",
+            sync_to_async(views.articles),
+            (),
+            {"slug": "hello"})
+
+
+def test__resolves_to__report():
+    """ Returns a truthy report of the mapping when the URL is mapped as
+        expected.
+    """
+    report = resolves_to(
+        "/url9/2022/11/",
+        views.monthly_archive,
+        (),
+        {"year": 2022, "month": 11},
+        report=True)
+    assert report
+    assert report.found_view is views.monthly_archive
+    assert report.route == "url9/<int:year>/<int:month>/"
+
+
+def test__resolves_to__report__wrong_view_and_arguments():
+    """ Returns a falsy report showing the view and arguments that were found
+        when the URL isn't mapped as expected.
+    """
+    report = resolves_to(
+        "/url9/2022/11/",
+        views.other_monthly_archive,
+        (),
+        {"year": "2022", "month": "11"},
+        report=True)
+    assert not report
+    assert report.expected_view is views.other_monthly_archive
+    assert report.found_view is views.monthly_archive
+    assert report.expected_kwargs == {"year": "2022", "month": "11"}
+    assert report.found_args == ()
+    assert report.found_kwargs == {"year": 2022, "month": 11}
+    assert report.url_name is None
+
+
+def test__resolves_to__report__404():
+    """ Returns a falsy report without a view when the URL isn't mapped.
+    """
+    report = resolves_to(
+        "/not/a/url", views.articles, (), {}, report=True)
+    assert not report
+    assert report.found_view is None
+    assert report.route is None
+
+
+def test__resolves_to__append_slash():
+    """ Follows the redirect to a URL with a trailing slash if slashes are
+        appended, and reports the redirect.
+    """
+    assert not resolves_to("/url1", views.articles, (), {})
+    assert resolves_to("/url1", views.articles, (), {}, append_slash=True)
+    report = resolves_to(
+        "/url1", views.articles, (), {}, report=True, append_slash=True)
+    assert report.redirect == "/url1/"
+    assert report.route == "url1/"
+    report = resolves_to(
+        "/url1/", views.articles, (), {}, report=True, append_slash=True)
+    assert report.redirect is None
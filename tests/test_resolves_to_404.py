@@ -10,9 +10,12 @@
 # only two tests are needed to cover these cases.
 
 import pytest
+from django.urls import path
+from django.views.decorators.common import no_append_slash
 
 from django_test_urls.resolves_to import resolves_to_404
 from django_test_urls.exceptions import InvalidArgumentType
+from tests import app_views as views
 
 
 def test__resolves_to_404__invalid_argument_type__url_path():
@@ -32,3 +35,24 @@ def test__resolves_to_404__match_with_view():
     """ Returns False when URL can be mapped to a view.
     """
     assert not resolves_to_404("/url1/")
+
+
+def test__resolves_to_404__append_slash():
+    """ Returns False when URL is redirected to a URL with a trailing slash
+        that can be mapped to a view, if slashes are appended.
+    """
+    assert resolves_to_404("/url1")
+    assert not resolves_to_404("/url1", append_slash=True)
+    assert resolves_to_404("/not/a/url", append_slash=True)
+
+
+def test__resolves_to_404__no_append_slash(settings):
+    """ Returns True when URL would be redirected to a view that is exempt
+        from appending slashes.
+    """
+    class urlconf:
+        urlpatterns = [path("noslash/", no_append_slash(views.articles))]
+
+    settings.ROOT_URLCONF = urlconf
+    assert resolves_to_404("/noslash", append_slash=True)
+    assert not resolves_to_404("/noslash/", append_slash=True)
@@ -3,10 +3,31 @@
 
 # Contains tests for the function `check_for_mismatches()`.
 
+from functools import partial
+from functools import wraps
+from importlib import import_module
+
 import pytest
+from django.contrib.auth.decorators import login_required
+from django.urls import ResolverMatch
 
 from django_test_urls.exceptions import ArgumentParameterMismatch
+from django_test_urls.exceptions import InvalidArgumentType
 from django_test_urls.resolves_to import check_for_mismatches
+from django_test_urls.resolves_to import resolves_to
+from django_test_urls.urlconf import view_path
+from tests import app_views as views
+
+
+# the submodule is shadowed by the function `resolves_to()` in the package
+module = import_module("django_test_urls.resolves_to")
+
+
+def rate_limited(view):
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        return view(request, *args, **kwargs)
+    return wrapper
 
 
 def test__function_view():
@@ -79,3 +100,92 @@ def test__multiple_args_mapped_to_parameter():
     with pytest.raises(ArgumentParameterMismatch) as e:
         check_for_mismatches(view, ("1", "2"), {"a": "3"})
     assert "multiple values for argument 'a'" in str(e)
+
+
+def test__class_based_view():
+    """ No exception is raised when there is no mismatch between the captured
+        arguments and the parameters of the class's handler methods.
+    """
+    check_for_mismatches(views.MonthlyArchiveView, (), {"year": 1, "month": 2})
+    check_for_mismatches(views.MonthlyArchiveView.as_view(), (1, 2), {})
+
+
+def test__class_based_view__handler_mismatch():
+    """ Raises an exception when there's a mismatch between the captured
+        arguments and the parameters of one of the class's handler methods.
+    """
+    with pytest.raises(ArgumentParameterMismatch) as e:
+        check_for_mismatches(views.ArticleView, (), {"slug": "hello"})
+    assert "ArticleView.post" in str(e)
+    assert "got an unexpected keyword argument 'slug'" in str(e)
+
+
+def test__decorated_view():
+    """ Checks the arguments against the parameters of the view wrapped by
+        decorators, instead of the decorators' wrappers.
+    """
+    view = login_required(rate_limited(views.monthly_archive))
+    check_for_mismatches(view, ("2022", "11"), {})
+    with pytest.raises(ArgumentParameterMismatch) as e:
+        check_for_mismatches(view, ("2022",), {})
+    assert "missing a required argument: 'month'" in str(e)
+
+
+def test__partial_view():
+    """ Checks the arguments against the parameters of a partial's view,
+        without the parameters that the partial binds.
+    """
+    view = rate_limited(partial(views.monthly_archive, month="11"))
+    check_for_mismatches(view, (), {"year": "2022"})
+    check_for_mismatches(view, (), {"year": "2022", "month": "12"})
+    with pytest.raises(ArgumentParameterMismatch):
+        check_for_mismatches(view, ("2022", "12"), {})
+    assert not resolves_to("/url1/", partial(views.articles), (), {})
+    with pytest.raises(InvalidArgumentType):
+        resolves_to("/url1/", print, (), {})
+
+
+def test__decorated_class_based_view():
+    """ Checks the arguments against the class's handler methods, including
+        the keyword arguments bound by partials.
+    """
+    as_view = views.MonthlyArchiveView.as_view()
+    view = partial(login_required(as_view), month=2)
+    check_for_mismatches(view, (), {"year": 1})
+    with pytest.raises(ArgumentParameterMismatch):
+        check_for_mismatches(view, (), {"year": 1, "day": 3})
+
+    found = ResolverMatch(view, (), {"year": 1})
+    assert module._matches_view(found, views.MonthlyArchiveView)
+    assert not module._matches_view(found, views.ArticleView)
+
+
+def test__signature_cached_per_view():
+    """ Unwraps a view and looks up its signature only once.
+    """
+    view = rate_limited(views.article)
+    module._view_signature.cache_clear()
+    for _ in range(3):
+        check_for_mismatches(view, (), {"slug": "hello"})
+    assert module._view_signature.cache_info().misses == 1
+    assert module._unwrap_view(view) == (views.article, {})
+
+
+def test__unhashable_view():
+    """ Checks a callable object that can't be hashed, without caching it.
+    """
+    class DetailView:
+        def __eq__(self, other):
+            return self is other
+
+        def __call__(self, request, pk):
+            pass
+
+    view = DetailView()
+    check_for_mismatches(view, (), {"pk": 1})
+    with pytest.raises(ArgumentParameterMismatch):
+        check_for_mismatches(view, (), {"slug": "hello"})
+    assert module._unwrap_view(view) == (view, {})
+    found = ResolverMatch(view, (), {"pk": 1})
+    assert not module._matches_view(found, views.ArticleView)
+    assert view_path(view).endswith("<locals>.DetailView")
@@ -9,6 +9,9 @@
 # - URL is mapped to expected view
 # - URL is mapped to a different view
 # - URL cannot be mapped to a view
+#
+# The first two cases are repeated for class-based views, which can be
+# expected by their class instead of the function returned by `as_view()`.
 
 from django_test_urls.resolves_to import resolves_to_view
 from tests import app_views as views
@@ -30,3 +33,17 @@ def test__matches_no_view():
     """ Returns False when URL cannot be mapped to an existing view.
     """
     assert not resolves_to_view("/not/a/url", views.article)
+
+
+def test__matches_correct_view_class():
+    """ Returns True when URL is mapped to a view of the expected class.
+    """
+    assert resolves_to_view("/cbv2/2022/11/", views.MonthlyArchiveView)
+
+
+def test__matches_wrong_view_class():
+    """ Returns False when URL is mapped to a view of another class, or to a
+        function-based view.
+    """
+    assert not resolves_to_view("/cbv2/2022/11/", views.ArticleView)
+    assert not resolves_to_view("/url1/", views.ArticleView)
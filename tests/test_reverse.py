@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the function `reverses_all()`.
+
+# Test Design
+# -----------
+# The URL patterns of the test app don't have names, so the nested URL
+# patterns are used to verify that the generated cases survive a round trip,
+# including namespaces that capture arguments. Routes that can't survive a
+# round trip are defined by a URLconf in this module.
+
+from django.urls import include
+from django.urls import path
+from django.urls import re_path
+
+from django_test_urls.reverse import reverses_all
+from django_test_urls.samples import generate_cases
+from tests import app_views as views
+
+
+class urlconf:
+    urlpatterns = [
+        re_path(r"^optional/(?:page/)?$", views.articles, name="optional"),
+        re_path(r"^mixed/([0-9]+)/$", views.articles, {"extra": 1},
+                name="mixed"),
+        path("café/<slug:slug>/", views.articles, name="cafe"),
+        path("shop/", include(
+            ([path("<int:pk>/", views.articles, name="item")], "shop"),
+            namespace="store")),
+    ]
+
+
+def test__reverses_all():
+    """ Returns a truthy result when every URL is reversed to the same path.
+    """
+    url_paths = [c.url_path for c in generate_cases("tests.app_nested_urls")]
+    result = reverses_all(url_paths, "tests.app_nested_urls")
+    assert result
+    assert result.total == 7
+    assert result.failures == []
+    assert result.skipped == ["/legacy/0000/00/", "/legacy/1111/11/"]
+    assert result.populate_seconds > 0
+
+
+def test__reverses_all__unnamed_routes():
+    """ Skips URLs that are mapped to routes without a name.
+    """
+    result = reverses_all(["/url1/", "/url9/2022/11/"])
+    assert result
+    assert result.skipped == ["/url1/", "/url9/2022/11/"]
+
+
+def test__reverses_all__quoted_and_namespaced():
+    """ Compares unquoted paths, and uses the default instance of a
+        namespace, like `reverse()` does.
+    """
+    result = reverses_all(["/café/x/", "/shop/1/"], urlconf)
+    assert result
+    assert result.skipped == []
+
+
+def test__reverses_all__failures():
+    """ Reports URLs that are reversed to another path, or can't be reversed,
+        as well as skipping URLs that can't be resolved.
+    """
+    result = reverses_all(
+        ["/optional/", "/optional/page/", "/mixed/5/", "/not/a/url"],
+        urlconf)
+    assert not result
+    assert result.total == 4
+    assert result.skipped == ["/not/a/url"]
+    optional, mixed = result.failures
+    assert optional.url_path == "/optional/page/"
+    assert optional.view_name == "optional"
+    assert optional.reversed_path == "/optional/"
+    assert optional.error is None
+    assert mixed.args == ("5",)
+    assert mixed.kwargs == {"extra": 1}
+    assert mixed.reversed_path is None
+    assert isinstance(mixed.error, ValueError)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the functions `generate_samples()`, `generate_cases()`,
+# `generate_near_misses()` and `resolves_near_misses_to_404()`.
+
+# Test Design
+# -----------
+# Samples are generated from a regex's parse tree, so the tests for
+# `generate_samples()` cover the regex features that are supported, and
+# verify that unsupported features never result in samples that don't match.
+#
+# The tests for `generate_cases()` verify that the generated cases resolve as
+# expected for the URL patterns of the test app, covering `path()` with
+# converters, `re_path()` with named and unnamed groups, and extra arguments,
+# as well as bound methods and samples that an earlier route shadows.
+#
+# The tests for near misses verify each kind of near miss, and that only the
+# URL patterns of the test app that lack a `$` are reported as permissive.
+
+import re
+
+import pytest
+from django.urls import include
+from django.urls import path
+from django.urls import re_path
+
+from django_test_urls.batch import resolves_all
+from django_test_urls.samples import generate_cases
+from django_test_urls.samples import generate_near_misses
+from django_test_urls.samples import resolves_near_misses_to_404
+from django_test_urls.samples import generate_samples
+from tests import app_views as views
+
+
+def test__generate_samples__literals_and_classes():
+    """ Generates distinct variants that are matched by the regex.
+    """
+    samples = generate_samples(re.compile(r"^a[0-9]{2}\d\w[^/]\Z"))
+    assert samples == ["a000aa", "a111bb"]
+
+
+def test__generate_samples__branches_and_repeats():
+    """ Picks different alternatives and repeats in different variants.
+    """
+    samples = generate_samples(re.compile(r"^(?:x|y)z*?(?P<g>q+)(?P=g)$"))
+    assert samples == ["xqq", "yzqqqq"]
+
+
+def test__generate_samples__conditional_group():
+    """ Generates the branch matching whether a group was captured.
+    """
+    samples = generate_samples(re.compile(r"^(a)?(?(1)b|c)(?i:d)$"))
+    assert samples == ["cd", "abd"]
+
+
+def test__generate_samples__non_ascii_and_not_literal():
+    """ Falls back to the characters of a set that aren't in the pool.
+    """
+    samples = generate_samples(re.compile(r"^[éè][^a].$"))
+    assert samples == ["éba", "ècb"]
+
+
+def test__generate_samples__lookaround():
+    """ Drops samples that don't match because of a lookaround.
+    """
+    assert generate_samples(re.compile(r"^(?!a)[ab]$")) == ["b"]
+
+
+def test__generate_samples__unsatisfiable():
+    """ Generates no samples for a set that no character matches.
+    """
+    assert generate_samples(re.compile(r"^[^\s\S]$")) == []
+
+
+def test__generate_cases__converters():
+    """ Converts values captured by a `path()` using its converters.
+    """
+    cases = [c for c in generate_cases() if c.url_path.startswith("/url9/")]
+    assert cases == [
+        ("/url9/0/0/", views.monthly_archive, (), {"year": 0, "month": 0}),
+        ("/url9/11/11/", views.monthly_archive, (), {"year": 11, "month": 11}),
+    ]
+
+
+def test__generate_cases__unnamed_groups_and_extra_arguments():
+    """ Captures positional arguments alongside extra keyword arguments.
+    """
+    cases = [c for c in generate_cases() if c.url_path.startswith("/url7/")]
+    assert cases[0] == (
+        "/url7/two-zero-two-two/01/",
+        views.monthly_archive,
+        ("01",),
+        {"year": "2022"})
+
+
+def test__generate_cases__resolve_as_expected():
+    """ Only cases of URL patterns with a mismatch fail to resolve.
+    """
+    result = resolves_all(generate_cases())
+    failed = {failure.case.url_path.split("/")[1]
+              for failure in result.failures}
+    assert result.total == 36
+    assert failed == {
+        "url7", "url8", "bad2", "bad3", "bad4", "bad5", "bad6", "cbv3"}
+
+
+class Site:
+    """ Routes its views like `admin.site.urls`: a bound method, a wrapped
+        view, and a catch-all that comes last.
+    """
+
+    def login(self, request):
+        pass  # pragma: no cover
+
+    def index(self, request):
+        pass  # pragma: no cover
+
+    def catch_all(self, request, url):
+        pass  # pragma: no cover
+
+    @property
+    def urls(self):
+        return [
+            path("", views.articles),
+            path("login/", self.login),
+            re_path(r"(?P<url>.*)$", self.catch_all),
+        ]
+
+
+def test__generate_cases__bound_methods_and_shadowed_samples(settings):
+    """ Accepts bound methods as views, and drops samples that an earlier
+        route resolves, such as the empty sample of a catch-all, or that
+        don't resolve at all, because of a lookahead.
+    """
+    class urlconf:
+        urlpatterns = [
+            path("admin/", include(Site().urls)),
+            re_path(r"^x(?!y)", include([re_path(r"^y$", views.articles)])),
+        ]
+
+    cases = generate_cases(urlconf)
+    assert [(case.url_path, case.view.__name__) for case in cases] == [
+        ("/admin/", "articles"),
+        ("/admin/login/", "login"),
+        ("/admin/b", "catch_all"),
+    ]
+    settings.ROOT_URLCONF = urlconf
+    assert resolves_all(cases)
+
+
+@pytest.mark.urls("tests.app_nested_urls")
+def test__generate_cases__nested_url_patterns():
+    """ Combines the arguments captured by nested URL patterns, and skips
+        samples that are rejected by a converter or can't be generated.
+    """
+    result = resolves_all(generate_cases())
+    assert result
+    assert [case[1:] for case in generate_cases()] == [
+        (views.monthly_archive, (), {"year": 0, "month": 0}),
+        (views.monthly_archive, (), {"year": 11, "month": 11}),
+        (views.monthly_archive, (), {"year": 0, "month": 0}),
+        (views.monthly_archive, (), {"year": 11, "month": 0}),
+        (views.monthly_archive, ("0000", "00"), {}),
+        (views.monthly_archive, ("1111", "11"), {}),
+        (views.articles, (), {}),
+    ]
+
+
+def test__generate_near_misses__kinds():
+    """ Generates each kind of near miss from the first sample of a route.
+    """
+    near_misses = [(n.url_path, n.kind) for n in generate_near_misses()
+                   if n.route.route.startswith("^url2/")]
+    assert near_misses == [
+        ("/url2/0000/01", "trailing_slash"),
+        ("/url2/0000/01/extra/", "extra_segment"),
+        ("/~rl2/0000/01/", "wrong_prefix"),
+        ("/url2/00000/01/", "out_of_range"),
+        ("/url2/0000/99/", "out_of_range"),
+    ]
+
+
+def test__generate_near_misses__rejected_by_converter():
+    """ Uses values rejected by a converter as out-of-range values.
+    """
+    near_misses = [n.url_path for n in generate_near_misses(
+        "tests.app_nested_urls") if n.kind == "out_of_range"]
+    assert "/archive/0/9/even/" in near_misses
+    assert "/archive//0/" in near_misses
+
+
+def test__resolves_near_misses_to_404():
+    """ Reports near misses that are resolved by a permissive regex.
+    """
+    result = resolves_near_misses_to_404()
+    assert not result
+    assert [failure.case.url_path for failure in result.failures] == [
+        "/url6/two-zero-two-two/01/extra/",
+        "/url7/two-zero-two-two/01/extra/",
+    ]
+
+
+@pytest.mark.urls("tests.app_nested_urls")
+def test__resolves_near_misses_to_404__nested_url_patterns():
+    """ None of the near misses of strict URL patterns are resolved.
+    """
+    assert resolves_near_misses_to_404()
+
+
+def test__generate_near_misses__edge_cases():
+    """ Skips groups that aren't captured or that accept any value, and
+        doesn't generate the same near miss twice.
+    """
+    class urlconf:
+        urlpatterns = [
+            re_path(r"^(?:x(?P<a>[0-9]))?(?P<slug>.*)$", views.article),
+            re_path(r"^(?P<slug>[^~]*)$", views.article),
+        ]
+
+    near_misses = [(n.url_path, n.kind)
+                   for n in generate_near_misses(urlconf)]
+    assert near_misses == [
+        ("", "trailing_slash"),
+        ("/extra/", "extra_segment"),
+        ("/~", "wrong_prefix"),
+    ] * 2
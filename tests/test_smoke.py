@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the function `smoke_dispatch()`.
+
+# Test Design
+# -----------
+# The views of the test app respond successfully, so the views that raise
+# exceptions, or respond with a server error, are defined by a URLconf in
+# this module. The tests verify the outcome of every URL, and that the
+# latencies are aggregated per view.
+
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from django.http import HttpResponse
+from django.template.response import SimpleTemplateResponse
+from django.urls import path
+
+from django_test_urls.smoke import smoke_dispatch
+
+
+def not_found(request):
+    raise Http404()
+
+
+def forbidden(request):
+    raise PermissionDenied()
+
+
+def broken(request):
+    raise ValueError("broken")
+
+
+def server_error(request):
+    return HttpResponse(status=503)
+
+
+class UserTemplate:
+    def render(self, context, request):
+        return context["request"].user
+
+
+def rendered(request):
+    return SimpleTemplateResponse(UserTemplate(), {"request": request})
+
+
+def echo(request):
+    return HttpResponse(status=200 if request.method == "POST" else 405)
+
+
+class urlconf:
+    urlpatterns = [
+        path("not-found/", not_found),
+        path("forbidden/", forbidden),
+        path("broken/", broken),
+        path("server-error/", server_error),
+        path("rendered/", rendered),
+        path("echo/", echo),
+    ]
+
+
+def test__smoke_dispatch():
+    """ Dispatches every URL to its view, including asynchronous views.
+    """
+    report = smoke_dispatch(["/url1/", "/url10/hello/", "/url9/2022/11/"])
+    assert report
+    assert [result[:3] for result in report.results] == [
+        ("/url1/", "tests.app_views.articles", 200),
+        ("/url10/hello/", "tests.app_views.async_article", 200),
+        ("/url9/2022/11/", "tests.app_views.monthly_archive", 200),
+    ]
+    assert all(result.error is None for result in report.results)
+
+
+def test__smoke_dispatch__not_resolved():
+    """ Reports URLs that can't be resolved as not found, without a view.
+    """
+    report = smoke_dispatch(["/not/a/url"])
+    assert report
+    assert report.results == [("/not/a/url", None, 404, 0.0, None)]
+    assert report.latencies == []
+
+
+def test__smoke_dispatch__errors():
+    """ Reports unhandled exceptions and server errors as errors, but not the
+        exceptions that Django turns into a response.
+    """
+    report = smoke_dispatch([
+        "/not-found/", "/forbidden/", "/broken/", "/server-error/",
+    ], urlconf=urlconf)
+    assert not report
+    assert [result.status_code for result in report.results] == [
+        404, 403, None, 503]
+    assert [result.url_path for result in report.errors] == [
+        "/broken/", "/server-error/"]
+    assert isinstance(report.errors[0].error, ValueError)
+
+
+def test__smoke_dispatch__prepare():
+    """ Prepares every request before dispatching it, sets the URLconf on
+        it, and renders lazy responses.
+    """
+    users = []
+
+    def prepare(request):
+        request.user = "alice"
+        users.append(request.resolver_match.func)
+        assert request.urlconf is urlconf
+
+    report = smoke_dispatch(
+        ["/rendered/", "/echo/"], method="post", prepare=prepare,
+        urlconf=urlconf)
+    assert report
+    assert users == [rendered, echo]
+    assert [result.status_code for result in report.results] == [200, 200]
+    assert report.results[0].error is None
+
+
+def test__smoke_dispatch__latencies():
+    """ Aggregates the latency of every view over all its URLs.
+    """
+    report = smoke_dispatch(
+        ["/url1/", "/url3/2022/11/", "/url9/2022/11/", "/url9/2022/12/"])
+    latencies = {latency.view: latency for latency in report.latencies}
+    assert latencies["tests.app_views.monthly_archive"].calls == 3
+    assert latencies["tests.app_views.articles"].calls == 1
+    for latency in report.latencies:
+        assert latency.max_seconds <= latency.seconds
+    assert [latency.seconds for latency in report.latencies] == sorted(
+        (latency.seconds for latency in report.latencies), reverse=True)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the function `stress_resolve()`.
+
+# Test Design
+# -----------
+# Timings depend on the machine running the tests, so only their presence
+# and sanity are verified. Inconsistencies and errors are simulated by
+# resolving URLs differently in the threads than in the main thread.
+
+import threading
+
+import pytest
+from django.urls import resolve
+from django.urls import set_urlconf
+from django.utils import translation
+
+from django_test_urls import stress
+from django_test_urls.exceptions import InvalidArgumentType
+from django_test_urls.stress import stress_resolve
+
+
+URL_PATHS = ["/url1/", "/url9/2022/11/", "/cbv2/2022/11/", "/not/a/url"]
+
+
+def test__stress_resolve():
+    """ Reports a result for each number of threads, without inconsistencies.
+    """
+    report = stress_resolve(URL_PATHS, thread_counts=(1, 2), rounds=2)
+    assert report.gil_enabled in (True, False)
+    assert [result.threads for result in report.results] == [1, 2]
+    assert [result.calls for result in report.results] == [8, 16]
+    for result in report.results:
+        assert result.seconds > 0
+        assert result.throughput > 0
+        assert result.efficiency > 0
+        assert result.max_latency > 0
+        assert result.inconsistencies == []
+    assert report.results[0].efficiency == 1.0
+
+
+def test__stress_resolve__inconsistencies(monkeypatch):
+    """ Reports results that differ from those found in the main thread.
+    """
+    def flaky_resolve(url_path):
+        if threading.current_thread() is not threading.main_thread():
+            url_path = "/url1/"
+        return resolve(url_path)
+
+    monkeypatch.setattr(stress, "resolve_url", flaky_resolve)
+    report = stress_resolve(["/url1/", "/url9/2022/11/"], (2,), rounds=1)
+    inconsistencies = report.results[0].inconsistencies
+    assert [url_path for url_path, _, _ in inconsistencies] == [
+        "/url9/2022/11/", "/url9/2022/11/"]
+
+
+def test__stress_resolve__context(settings):
+    """ Resolves URLs with the caller's active language and URLconf in every
+        thread, also if no language is active.
+    """
+    settings.LANGUAGES = [("en", "English"), ("nl", "Dutch")]
+    set_urlconf("tests.app_i18n_urls")
+    try:
+        with translation.override("nl"):
+            report = stress_resolve(["/nl/articles/"], (2,), rounds=1)
+    finally:
+        set_urlconf(None)
+    assert report.results[0].inconsistencies == []
+
+    with translation.override(None):
+        report = stress_resolve(["/url1/"], (2,), rounds=1)
+    assert report.results[0].inconsistencies == []
+
+
+def test__stress_resolve__invalid_thread_counts():
+    """ Raises an exception when a number of threads isn't positive.
+    """
+    for thread_counts in ((1, 0), (-1,), (1.5,)):
+        with pytest.raises(InvalidArgumentType):
+            stress_resolve(URL_PATHS, thread_counts, rounds=1)
+
+
+def test__stress_resolve__no_urls():
+    """ Reports runs without any calls, instead of dividing by zero.
+    """
+    report = stress_resolve([], thread_counts=(1, 2), rounds=2)
+    assert [result.calls for result in report.results] == [0, 0]
+    assert [result.efficiency for result in report.results] == [1.0, 1.0]
+
+
+def test__stress_resolve__errors(monkeypatch):
+    """ Raises the exception raised by a thread while resolving a URL.
+    """
+    def broken_resolve(url_path):
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError("broken")
+        return resolve(url_path)
+
+    monkeypatch.setattr(stress, "resolve_url", broken_resolve)
+    with pytest.raises(RuntimeError, match="broken"):
+        stress_resolve(["/url1/"], (2,), rounds=1)
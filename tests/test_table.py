@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the class `CaseTable`.
+
+# Test Design
+# -----------
+# A table should behave like a sequence of cases, both when it's built in
+# memory and when it's loaded from a file, so the same cases are stored and
+# read back in either way. The tests also verify that a table can be checked
+# using `resolves_all()`.
+
+from functools import partial
+
+import pytest
+
+from django_test_urls.batch import resolves_all
+from django_test_urls.exceptions import InvalidArgumentType
+from django_test_urls.samples import generate_cases
+from django_test_urls.table import CaseTable
+from tests import app_views as views
+
+
+CASES = [
+    ("/url1/", views.articles, (), {}),
+    ("/url3/2022/11/", views.monthly_archive, ["2022", "11"], {}),
+    ("/url9/2022/11/", views.monthly_archive, (), {"year": 2022, "month": 11}),
+    ("/cbv2/2022/11/", views.MonthlyArchiveView, (),
+     {"year": 2022, "month": 11}),
+    ("/url10/hello/", views.async_article, (), {"slug": "hello"}),
+]
+
+
+def test__case_table():
+    """ Stores cases, and reads them back as tuples.
+    """
+    table = CaseTable.from_cases(CASES)
+    assert len(table) == 5
+    assert table[1] == ("/url3/2022/11/", views.monthly_archive,
+                        ("2022", "11"), {})
+    assert table[-1].kwargs == {"slug": "hello"}
+    assert [case.url_path for case in table] == [c[0] for c in CASES]
+    with pytest.raises(IndexError):
+        table[5]
+    table.append("/café/", views.article, (), {"slug": "café"})
+    assert table[5] == ("/café/", views.article, (), {"slug": "café"})
+
+
+def test__case_table__interning():
+    """ Shares the keys of keyword arguments between cases.
+    """
+    table = CaseTable.from_cases(CASES)
+    assert list(table[2].kwargs)[0] is list(table[3].kwargs)[0]
+
+
+def test__case_table__invalid_argument_type():
+    """ Raises an exception when a case can't be stored.
+    """
+    table = CaseTable()
+    with pytest.raises(InvalidArgumentType):
+        table.append(None, views.articles, (), {})
+    with pytest.raises(InvalidArgumentType):
+        table.append("/url1/", views.articles, (object(),), {})
+    assert len(table) == 0
+
+
+def test__case_table__resolves_all():
+    """ Can be checked like any other iterable of cases.
+    """
+    result = resolves_all(CaseTable.from_cases(CASES))
+    assert result
+    assert result.total == 5
+
+
+def test__case_table__save_and_load(tmp_path):
+    """ Loads the same cases that were saved, and is read-only.
+    """
+    path = str(tmp_path / "cases.bin")
+    CaseTable.from_cases(CASES).save(path)
+    with CaseTable.load(path) as table:
+        assert list(table) == [
+            (url_path, view, tuple(args), kwargs)
+            for url_path, view, args, kwargs in CASES]
+        assert resolves_all(table)
+        with pytest.raises(InvalidArgumentType):
+            table.append("/url1/", views.articles, (), {})
+    CaseTable().close()
+
+
+def test__case_table__save_and_load__generated(tmp_path):
+    """ Saves class-based views by their class, so that a table of generated
+        cases can be loaded again, and checked with the same outcome.
+    """
+    path = str(tmp_path / "cases.bin")
+    cases = generate_cases()
+    CaseTable.from_cases(cases).save(path)
+    with CaseTable.load(path) as table:
+        assert len(table) == len(cases)
+        assert views.MonthlyArchiveView in {case.view for case in table}
+        expected = resolves_all(cases)
+        result = resolves_all(table)
+        assert result.total == expected.total == len(cases)
+        assert [f.case.url_path for f in result.failures] == [
+            f.case.url_path for f in expected.failures]
+
+
+def test__case_table__save_not_importable(tmp_path):
+    """ Raises an exception when a view can't be imported again.
+    """
+    def nested(request):
+        pass  # pragma: no cover
+
+    path = str(tmp_path / "cases.bin")
+    for view in (partial(views.article, slug="x"), nested):
+        with pytest.raises(InvalidArgumentType):
+            CaseTable.from_cases([("/url1/", view, (), {})]).save(path)
+
+
+def test__case_table__load_invalid_file(tmp_path):
+    """ Raises an exception when a file doesn't contain a table, or when it
+        was saved with another byte order.
+    """
+    path = tmp_path / "cases.bin"
+    path.write_bytes(b"not a case table")
+    with pytest.raises(ValueError):
+        CaseTable.load(str(path))
+
+    CaseTable.from_cases(CASES).save(str(path))
+    content = path.read_bytes()
+    for byteorder in (b'"little"', b'"big"'):
+        content = content.replace(byteorder, b'"other"'.ljust(len(byteorder)))
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        CaseTable.load(str(path))
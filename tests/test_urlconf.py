@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Contains tests for the function `iter_routes()`.
+
+# Test Design
+# -----------
+# The routes of a URLconf with nested URL patterns are compared with the
+# routes and names that Django reports for them.
+
+from django_test_urls.urlconf import iter_routes
+
+
+def test__iter_routes__order_and_nesting():
+    """ Yields every URL pattern in order, along with its resolvers.
+    """
+    routes = list(iter_routes("tests.app_nested_urls"))
+    assert [route.route for route in routes] == [
+        "archive/<int:year>/<int:month>/",
+        "archive/<int:year>/<even:month>/even/",
+        "archive/<int:year>/never/[^\\s\\S]$",
+        "^legacy/([0-9]{4})/([0-9]{2})/$",
+        "articles/",
+    ]
+    assert [len(route.resolvers) for route in routes] == [2, 2, 2, 2, 1]
+    assert len(routes[0].levels) == 3
+
+
+def test__iter_routes__view_name():
+    """ Includes the namespaces in the name of a route.
+    """
+    routes = list(iter_routes("tests.app_nested_urls"))
+    assert [route.view_name for route in routes] == [
+        "archive:monthly",
+        "archive:even",
+        None,
+        None,
+        "articles",
+    ]